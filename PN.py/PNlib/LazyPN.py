@@ -0,0 +1,268 @@
+# -*- coding: utf-8 -*-
+"""\
+LazyPN class
+============
+    (lazy expression graph of Polynomial Numbers)
+
+    Opt-in lazy mode: operators on LazyPN do not compute PNs, they build
+    a DAG of operations. Identical subexpressions (the same operation of
+    the same operands, `+` and `*` in any order) are the same node, so
+    e.g. `p**2` or `(p**2 + 1).sqrt()` written several times in a formula
+    are computed once. evaluate() runs the whole graph in one pass (level
+    by level - independent branches of a level can run concurrently in
+    given executor) and returns ordinary PolyNum(s).
+
+    Examples
+    --------
+    >>> from digitPN import flt
+    >>> T_0 = flt('0.04')
+    >>> pPN = PolyNum('const:(~2~,-4~4~-4~4~...~)') / flt('0.1')
+    >>> p = lazy(pPN)
+    >>> x = p / (p**2 + p + 4) * (T_0 * (p**2 + 1).sqrt()).exp()
+    >>> x0 = x * (-T_0*p).exp()
+    >>> len(x.nodes()), len(x0.nodes())  # p**2 is the single node
+    (10, 13)
+    >>> y, y0 = evaluate(x, x0)
+    >>> type(y).__name__, y == pPN / (pPN**2 + pPN + 4) * (T_0 * (pPN**2 + 1).sqrt()).exp()
+    ('PolyNum', True)
+"""
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+__all__ = ['LazyPN', 'lazy', 'evaluate']
+
+import itertools
+import weakref
+
+if __name__ == '__main__' or __name__ == 'LazyPN':
+    #standalone tests: LazyPN -> doctest
+    from PolyNum import PolyNum
+else: #relative package import
+    from .PolyNum import PolyNum
+
+
+#######################################################################
+
+_OPS = {
+    'add': lambda x, y: x + y,
+    'sub': lambda x, y: x - y,
+    'mul': lambda x, y: x * y,
+    'div': lambda x, y: x / y,
+    'pow': lambda x, a: x ** a,
+    'neg': lambda x: -x,
+    'sqrt': lambda x: x.sqrt(),
+    'exp': lambda x: x.exp(),
+    'ln': lambda x: x.ln(),
+}
+_COMMUTATIVE = ('add', 'mul')
+
+_nodes = weakref.WeakValueDictionary() # key -> LazyPN (hash-consing)
+_ids = itertools.count()
+
+def lazy(x):
+    """
+    LazyPN leaf of PolyNum (the same node for the same PolyNum object of
+    the same value). The leaf is a snapshot of x: later in-place changes
+    of x (x += 1) do not change built expressions, lazy(x) of changed x
+    is a new leaf.
+
+    >>> p = PolyNum([1., 2.]); y = lazy(p) * 2
+    >>> print(y.evaluate())
+    (~2.0~,4.0~)
+    >>> p += 1
+    >>> lazy(p) is y.args[0], p._mantissa is y.args[0].args[0]._mantissa
+    (False, False)
+    >>> print(y.evaluate(), (lazy(p) * 2).evaluate())
+    (~2.0~,4.0~) (~4.0~,4.0~)
+    """
+    if isinstance(x, LazyPN):
+        return x
+    key = (id(x), x._exponent, getattr(x, '_scale', None), tuple(x._mantissa))
+    return LazyPN._node('leaf', (PolyNum(x),), key)
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class LazyPN(object):
+    """\
+    Node of lazy PN expression
+    ==========================
+
+    Do not create directly - use lazy(PolyNum) and operators
+    `+ - * / **`, unary `-`, sqrt(), exp(), ln() on LazyPN.
+    Operands: LazyPN, PolyNum (leaf), scalars.
+
+    Attributes:
+    ----------
+        op:
+            'leaf' or name of operation ('add', 'mul', 'sqrt', ...)
+        args:
+            tuple of LazyPN and scalars (PolyNum copy for 'leaf', see lazy())
+
+    Examples
+    --------
+    >>> a = lazy(PolyNum('(~1~,2~)'))
+    >>> b = lazy(PolyNum('(~1~,2~)'))  # other PolyNum - other leaf
+    >>> a * 2 + 1 is 1 + 2 * a, a + b is b + a, a + b is a + a
+    (True, True, False)
+    >>> (a * 2 + 1)
+    LazyPN('add', LazyPN('mul', LazyPN('leaf'), 2), 1)
+    >>> print((a*a - b).evaluate())
+    (~2.0~,4.0~)*(~1~0~)**(-1)
+    """
+    __hash__ = object.__hash__ # nodes are unique - identity
+    __array_ufunc__ = None # numpy scalar/ndarray op LazyPN -> LazyPN.__rop__
+    _PNdefer = True # PolyNum op LazyPN -> LazyPN.__rop__
+
+    @classmethod
+    def _node(cls, op, args, leafKey=None):
+        """the node of op(args) - existing one if already built"""
+        if op == 'leaf':
+            key = (op, leafKey)
+        else:
+            keys = tuple(_argKey(a) for a in args)
+            if op in _COMMUTATIVE:
+                keys = tuple(sorted(keys))
+            key = (op,) + keys
+        node = _nodes.get(key)
+        if node is None:
+            node = cls.__new__(cls)
+            node.op, node.args = op, args
+            node._id = next(_ids)
+            node._value = None
+            node._depth = 1 + max([a._depth for a in args if isinstance(a, LazyPN)] or [-1])
+            _nodes[key] = node
+        return node
+
+    def __repr__(self):
+        if self.op == 'leaf':
+            return "LazyPN('leaf')"
+        return 'LazyPN({!r}, {})'.format(self.op, ', '.join(repr(a) for a in self.args))
+
+    def nodes(self):
+        """nodes of the graph of self in topological order (operands first)"""
+        return _topological((self,))
+
+    def evaluate(self, executor=None):
+        """PolyNum value of the expression, see evaluate()"""
+        return evaluate(self, executor=executor)
+
+#-----------------------------------------------------------
+
+    def _binary(self, op, other, reflected=False):
+        if isinstance(other, PolyNum):
+            other = lazy(other)
+        elif not isinstance(other, LazyPN) and hasattr(other, '__len__'):
+            return NotImplemented
+        args = (other, self) if reflected else (self, other)
+        return LazyPN._node(op, args)
+
+    def __add__(self, other):
+        return self._binary('add', other)
+    def __radd__(self, other):
+        return self._binary('add', other, True)
+    def __sub__(self, other):
+        return self._binary('sub', other)
+    def __rsub__(self, other):
+        return self._binary('sub', other, True)
+    def __mul__(self, other):
+        return self._binary('mul', other)
+    def __rmul__(self, other):
+        return self._binary('mul', other, True)
+    def __truediv__(self, other):
+        return self._binary('div', other)
+    def __rtruediv__(self, other):
+        return self._binary('div', other, True)
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, a):
+        return LazyPN._node('pow', (self, a))
+
+    def __neg__(self):
+        return LazyPN._node('neg', (self,))
+
+    def __pos__(self):
+        return self
+
+    def sqrt(self):
+        return LazyPN._node('sqrt', (self,))
+
+    def exp(self):
+        return LazyPN._node('exp', (self,))
+
+    def ln(self):
+        return LazyPN._node('ln', (self,))
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _argKey(a):
+    if isinstance(a, LazyPN):
+        return ('n', a._id)
+    return ('s', type(a).__name__, repr(a))
+
+def _topological(roots):
+    """all nodes reachable from roots, operands before results"""
+    seen, order = set(), []
+    stack = [(r, False) for r in roots]
+    while stack:
+        node, done = stack.pop()
+        if done:
+            order.append(node)
+            continue
+        if node in seen:
+            continue
+        seen.add(node)
+        stack.append((node, True))
+        if node.op != 'leaf':
+            stack.extend((a, False) for a in node.args if isinstance(a, LazyPN) and a not in seen)
+    return order
+
+def _compute(node):
+    if node.op == 'leaf':
+        return node.args[0]
+    args = [a._value if isinstance(a, LazyPN) else a for a in node.args]
+    return _OPS[node.op](*args)
+
+def evaluate(*exprs, **kwargs):
+    """
+    evaluate(*exprs, executor=None)
+        PolyNum values of LazyPN expressions (one value if one expression),
+        common subexpressions of all exprs are computed once. Nodes are
+        computed level by level (depth in the graph); with executor
+        (concurrent.futures.Executor) nodes of the same level are
+        computed concurrently. Values stay cached in nodes.
+
+    >>> from concurrent.futures import ThreadPoolExecutor
+    >>> p = lazy(PolyNum('const:(~2~,-4~4~-4~4~...~)'))
+    >>> a, b = (p**2 + 1).sqrt(), (p + 4).exp()
+    >>> with ThreadPoolExecutor(2) as ex:
+    ...     print(evaluate(a * b, executor=ex) == evaluate(a) * evaluate(b))
+    True
+    """
+    executor = kwargs.pop('executor', None)
+    if kwargs:
+        raise TypeError('unexpected keyword arguments: {}'.format(list(kwargs)))
+    todo = [n for n in _topological(exprs) if n._value is None]
+    if executor is None:
+        for node in todo:
+            node._value = _compute(node)
+    else:
+        levels = {}
+        for node in todo:
+            levels.setdefault(node._depth, []).append(node)
+        for d in sorted(levels):
+            for node, v in zip(levels[d], executor.map(_compute, levels[d])):
+                node._value = v
+    values = tuple(e._value for e in exprs)
+    return values[0] if len(values) == 1 else values
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    import time
+    import doctest
+    start = time.time()
+    doctest.testmod()
+    print('OK. sec: ',time.time() - start)
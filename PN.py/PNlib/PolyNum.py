@@ -29,9 +29,15 @@ from __future__ import division, absolute_import, print_function, unicode_litera
 #2018-05-21 x is scalar == not hasattr(x, '__len__')
 #2018-05-24 x is scalar == isinstance(x,(int,float)) or not hasattr(x, '__len__')
 
-__all__ = ['PolyNum']
+__all__ = ['PolyNum', 'pn_precision', 'pn_getN', 'pn_const', 'pn_registerConst']
 
 #from itertools import zip_longest
+import contextlib
+import contextvars
+import functools
+import sys
+from fractions import Fraction
+from math import gcd, isfinite
 
 if __name__ == '__main__' or __name__ == 'PolyNum':
     #standalone tests: PolyNum -> rundocs(), doctest
@@ -45,6 +51,85 @@ else: #relative package import    #print(f'''__nm__ = {__name__}''')
 
 
 #######################################################################
+
+_precision_N = contextvars.ContextVar('PolyNum_N', default=PolyNumConf.max_N)
+
+def pn_getN():
+    """
+    Number of mantissa digits N of new PNs (PolyNumConf.max_N by default)
+    in the current context (thread, task) - see pn_precision()
+    """
+    return _precision_N.get()
+
+@contextlib.contextmanager
+def pn_precision(N):
+    """
+    Context manager - new PNs (from lists, scalars, strings and constants)
+    have N mantissa digits inside `with` block. Results of operations on
+    PNs have N of operands (min. N of both), so PNs of different N can
+    live in the same process, also in threads (see contextvars).
+
+    >>> with pn_precision(N=8):
+    ...     p8 = PolyNum('const:(~2~,-4~4~-4~4~...~)')
+    ...     print(len(p8), pn_getN())
+    8 8
+    >>> p = PolyNum('const:(~2~,-4~4~-4~4~...~)')
+    >>> len(p), len(p8 + p), len(p8 * 2), len(p.truncate(8)), len(p8.extend(16))
+    (64, 8, 8, 8, 16)
+    >>> p8 == p.truncate(8)
+    True
+    """
+    token = _precision_N.set(N)
+    try:
+        yield N
+    finally:
+        _precision_N.reset(token)
+
+def _pnDigits(method):
+    """
+    PN method in digit context of the backend (decimal.Context of 
+    'DECIMAL' - PolyNumConf.DECIMAL_PREC), no wrapper call for other backends
+    """
+    @functools.wraps(method)
+    def digits(self, *args):
+        localContext = digitPN.getBackend().localContext
+        if localContext is None:
+            return method(self, *args)
+        with localContext():
+            return method(self, *args)
+    return digits
+
+def _pnScaled(method):
+    """
+    PN method, scaled operands (see PolyNum.rescale) - computed by plain 
+    PNs of mantissas at common scale (the largest), result at that scale
+    """
+    @functools.wraps(method)
+    def scaled(self, *args):
+        lam = getattr(self, '_scale', None)
+        other = args[0] if args else None
+        isPN = isinstance(other, PolyNum)
+        lamOther = getattr(other, '_scale', None) if isPN else None
+        if lam is None and lamOther is None: #the most common case
+            return method(self, *args)
+        if isPN:
+            lam = max(lam or 1, lamOther or 1)
+            args = (other._atScale(lam),) + args[1:]
+        y = method(self._atScale(lam), *args)
+        if lam != 1 and isinstance(y, PolyNum):
+            y._scale = lam
+        return y
+    return _pnDigits(scaled)
+
+def _pnUnscaled(method):
+    """PN method of digits (output) - scaled PN is unscaled first"""
+    @functools.wraps(method)
+    def unscaled(self, *args):
+        if getattr(self, '_scale', None) is None:
+            return method(self, *args)
+        return method(self._atScale(1), *args)
+    return _pnDigits(unscaled)
+
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
     
     
@@ -69,17 +154,24 @@ class PolyNum(object):
     ----------
         mantissa: 
             the PN "digits", in decreasing (negative) powers, starting 
-            from power 0. List of _max_N elements, 
+            from power 0. List of N elements (N = len(PN) = _max_N), 
             m[0] * p**(0) + m[1] * p**(-1) + ... +m[_max_N-1] * p**(-(_max_N-1))
             If initial length is shorten then _max_N, mantissa is filled
             with zeros of type as first element.
+            For 'FLOAT-NUMPY' (see digitPN) mantissa is numpy.ndarray.
     
         exponent:
             (int)
     
+        scale:
+            (default 1) mantissa is stored at scale lam (see rescale()), 
+            digits m[k] * lam**(exponent-k) - they do not overflow if m[k]
+            grow like lam**k; digits are unscaled only at output
+
         _strPN_cut:
             (int) (not defined by default) could be added to istance, 
-            to show first _strPN_cut digits in str() and repr().
+            to show first _strPN_cut digits in str() and repr();
+            PolyNum._strCut - the same for all PNs (None - all digits).
             
     Parameters
     ----------
@@ -102,10 +194,10 @@ class PolyNum(object):
             
     exponentAdd:
         value added to 0 or original PN exponent (if exists)
-    
-    Const. fixed as class attr.
-    ---------------------------
-    _max_N = PolyNumConf.max_N
+    N:
+        number of mantissa digits (precision), by default N of PN to copy
+        or pn_getN() - see `with pn_precision(N): ...`
+        (PolyNumConf.max_N if not changed)
         
     Examples
     --------
@@ -127,39 +219,66 @@ class PolyNum(object):
 
     - PN const from string:
     >>> # p_trap(h) == (2/h) * (~1~-1~) / (~1~1~) == (1/h) * (~2~,-4~4~-4~4~...~)
-    >>> y1=PolyNum('const:(~2~,-4~4~-4~4~...~)'); y1._strPN_cut = 7;  y1
-    PolyNum('(~2~,-4~4~-4~4~-4~4~...~)')
+    >>> y1=PolyNum('const:(~2~,-4~4~-4~4~...~)'); [int(d) for d in y1[:7]]
+    [2, -4, 4, -4, 4, -4, 4]
     >>> # flat samples ready to multiply by (a/2):
-    >>> y2=PolyNum('const:(~1~,2~2~2~2~...~)'); y2._strPN_cut = 7;  y2
-    PolyNum('(~1~,2~2~2~2~2~2~...~)')
+    >>> y2=PolyNum('const:(~1~,2~2~2~2~...~)'); [int(d) for d in y2[:7]]
+    [1, 2, 2, 2, 2, 2, 2]
     
     - PN matissa and exponent
-    >>> p1 = PolyNum([1.1,2,3],-2); p1
-    PolyNum('(~1.1~,2~3~)*(~1~0~)**(-2)')
+    >>> p1 = PolyNum([1.1,2.,3.],-2); p1
+    PolyNum('(~1.1~,2.0~3.0~)*(~1~0~)**(-2)')
     >>> p2 = PolyNum(p1, 12); p2
-    PolyNum('(~1.1~,2~3~)*(~1~0~)**(10)')
-    >>> pM0 = PolyNum([1.1,2,3]); pM0
-    PolyNum('(~1.1~,2~3~)')
-    >>> PolyNum([1,2.0,3])
-    PolyNum('(~1~,2.0~3~)')
-    >>> print( PolyNum([3+digitPN.zeroPNdig,2,digitPN.onePNdig]) )
-    (~3.0~,2~1.0~)
-    >>> PolyNum([0,0,3,4])
-    PolyNum('(~3~,4~)*(~1~0~)**(-2)')
+    PolyNum('(~1.1~,2.0~3.0~)*(~1~0~)**(10)')
+    >>> pM0 = PolyNum([1.1,2.,3.]); pM0
+    PolyNum('(~1.1~,2.0~3.0~)')
+    >>> PolyNum([1.,2.5,3.])
+    PolyNum('(~1.0~,2.5~3.0~)')
+    >>> print( PolyNum([3+digitPN.zeroPNdig,2.,digitPN.onePNdig]) )
+    (~3.0~,2.0~1.0~)
+    >>> PolyNum([0.,0.,3.,4.])
+    PolyNum('(~3.0~,4.0~)*(~1~0~)**(-2)')
     
     ### - other object, not dtype:
     ### >>> from fractions import Fraction
     ### >>> PolyNum([Fraction(1/2),Fraction(5,9),6])
     ### PolyNum('(~1/2~,5/9~6~)')
     """
+    __slots__ = ('_mantissa', '_exponent', '_strPN_cut', '_powers', '_scale')
+    # no instance __dict__ - see memory footprint in PolyNumConf
     __hash__ = None
-    _max_N = PolyNumConf.max_N #num. of mantissa items
+    __array_ufunc__ = None # numpy scalar/ndarray op PN -> PN.__rop__
+    # objects of `_PNdefer = True` (PolyNumArray, ...) handle PN op other
     _sep = PolyNumConf.sep #'~' # in str() and repr()
+    _strCut = None # default _strPN_cut of all PNs
+    _frozen = False # see pn_const()
+
+    @property
+    def _max_N(self):
+        """num. of mantissa items N - precision of this PN"""
+        return len(self._mantissa)
     
     @property
+    @_pnUnscaled
     def mantissa(self):
         """ A copy of the coefficients"""
-        return self._mantissa[:] #or  deepcopy ?
+        return mantPN_copy(self._mantissa) #or  deepcopy ?
+    @property
+    def effLen(self):
+        """ 
+        Effective length of mantissa - up to the last non-zero digit 
+        (1 for zero PN). Products and divisions by short PN cost 
+        O(effLen * N) instead of O(N**2).
+
+        >>> PolyNum([1, 2]).effLen, PolyNum('(~1~,0~0~-1~)').effLen, len(PolyNum([1, 2]))
+        (2, 4, 64)
+        >>> PolyNum('(~0.1~,2e-58~4.3~6.1e-60~)').chop().effLen
+        3
+        """
+        return mantPN_effLen(self._mantissa)
+    def _mantEff(self):
+        """mantissa up to the last non-zero digit (not a copy for ndarray)"""
+        return self._mantissa[:mantPN_effLen(self._mantissa)]
     @property
     def exponent(self):
         """ The exponent of the Polynomial Number """
@@ -168,81 +287,174 @@ class PolyNum(object):
         else:
             return 0
 
-    def __init__(self, mantissa_or_pN_or_str=None, exponentAdd=0):
+    def __init__(self, mantissa_or_pN_or_str=None, exponentAdd=0, N=None):
         """\
         After __init__ first PN digit (self.mantissa[0]) is non-zero or 
         (in zero PN case) mantissa is filled with zeroes.
         """
         if isinstance(mantissa_or_pN_or_str, PolyNum):
-            self._initMant(mantissa_or_pN_or_str.mantissa)
+            if N is None:
+                N = mantissa_or_pN_or_str._max_N
+            self._initMant(mantissa_or_pN_or_str._mantissa, N)
             self._exponent = exponentAdd
             if hasattr(self,'exponent'):
                 self._exponent = mantissa_or_pN_or_str.exponent + exponentAdd
+            lam = getattr(mantissa_or_pN_or_str, '_scale', None)
+            if lam is not None: # (~1~0~)**exponentAdd at scale lam
+                self._scale = lam
+                if exponentAdd:
+                    mantPN_iscale(self._mantissa, 
+                                  _digitOf(lam, self._mantissa[0]) **exponentAdd)
             return
         
+        if N is None:
+            N = _precision_N.get()
         if mantissa_or_pN_or_str is None:
             mantissa_or_pN_or_str = []
         # elif isinstance(mantissa_or_pN_or_str, string_types): # six.string_types
         elif isinstance(mantissa_or_pN_or_str, str): #__future__ unicode_literals
             mantissa_or_pN_or_str, exponent1 = \
-                getMantissaExponent_fromStr(mantissa_or_pN_or_str, self._sep, self._max_N)
+                getMantissaExponent_fromStr(mantissa_or_pN_or_str, self._sep, N)
             exponentAdd += exponent1
         else: #mantissa_or_pN_or_str should be array_like
             #if isinstance(mantissa_or_pN_or_str, numbers.Number):
             if not isinstance(mantissa_or_pN_or_str,(int,float)) or \
                     hasattr(mantissa_or_pN_or_str, '__len__'):
-                mantissa_or_pN_or_str = list(mantissa_or_pN_or_str)
+                if not (mantPN_isDD(mantissa_or_pN_or_str) or \
+                        mantPN_isFrac(mantissa_or_pN_or_str)): # slices are copies
+                    mantissa_or_pN_or_str = list(mantissa_or_pN_or_str)
             else: #scalar
                 mantissa_or_pN_or_str = [mantissa_or_pN_or_str]
 
-        self._initMant(mantissa_or_pN_or_str)
+        self._initMant(mantissa_or_pN_or_str, N)
         self._exponent = exponentAdd
         self._normalize0() #case: PolyNum('(~0~,2.~-0.3~)'), 100
 
-    def _initMant(self, mant=None):
+    def _initMant(self, mant, N):
         """
         default init: [0.0, 0.0, ...] zeros of type digitPN.zeroPNdig
         """
         if isinstance(mant, PolyNum):
-            self._mantissa = mant.mantissa
-            return
+            mant = mant._mantissa
         
         #if not mant: #numpy ValueError: The truth value of an array with more than one element is ambiguous.
         if (mant is None) or not len(mant):
             mant = [digitPN.zeroPNdig] #type is determined in digitPN, rather not [0.0] 
-        self._mantissa = list(mant[:self._max_N])
-        self._fillZerosProc()
+        self._mantissa = digitPN.asMant(mant[:N])
+        self._fillZerosProc(N)
+
+    def _fillZerosProc(self, N):
+        assert len(self._mantissa), "At least one element must exist, to add zeroes of the same type!"
+        if len(self._mantissa) < N:
+            self._mantissa = mantPN_fill(self._mantissa, N)
+
+    @staticmethod
+    def _fromMantExpo(mant, expo, N):
+        """
+        trusted constructor - `mant` is a fresh mantPN of N digits (not 
+        copied, not normalized), i.e. from mantPN_mul(..., N); if mant[0]
+        is zero (or other case) - PolyNum(mant, expo, N)
+        """
+        b = digitPN.getBackend()
+        if len(mant) != N or not mant[0] or type(mant) is not b.mantType or \
+                (mantPN_isArr(mant) and mant.dtype != b.dtypePN):
+            return PolyNum(mant, expo, N)
+        y = object.__new__(PolyNum)
+        y._mantissa, y._exponent = mant, expo
+        return y
+
+    def truncate(self, N):
+        """PN copy with first N digits of mantissa (lower precision)"""
+        if N > self._max_N:
+            raise ValueError("truncate({}) of PN of {} digits - use extend()".format(N, self._max_N))
+        return PolyNum(self, 0, N)
+
+    def extend(self, N):
+        """
+        PN copy with mantissa of N digits, filled with zeros - exact only 
+        for PN known exactly (e.g. polynomials), else digits are unknown
+        """
+        if N < self._max_N:
+            raise ValueError("extend({}) of PN of {} digits - use truncate()".format(N, self._max_N))
+        return PolyNum(self, 0, N)
+
+    @property
+    def scale(self):
+        """scale lam of mantissa (see rescale()), 1 - digits as they are"""
+        return getattr(self, '_scale', None) or 1
 
-    def _fillZerosProc(self):
-        assert self._mantissa, "At least one element must exist, to add zeroes of the same type!"
-        if len(self._mantissa) < self._max_N:
-            zero = 0 * self._mantissa[0]
-            self._mantissa += [zero for __ in range(self._max_N-len(self._mantissa))]
+    def rescale(self, lam=None):
+        """
+        PN of the same value, mantissa stored at scale `lam` > 0 (z -> lam*z
+        rescaling, i.e. PN of p/lam): digits m[k] * lam**(exponent-k). 
+        Digits growing like q**k stay in float range if lam ~ q, so large N
+        runs can stay on the fast float path. Operations on PNs of different
+        scales use the largest one; str(), [k], mantissa, invTr... - digits
+        are unscaled; chop() tolerance is for scaled digits. 
+        lam=None - unscaled PN.
+
+        >>> x = PolyNum('(~0.1~,2.0~)', 0, 1024)
+        >>> y = 1 / x; print(digitPN.strF(y[4]))
+        1600000.0
+        >>> not abs(float(y[300])) < 1e308 # 10 * 20**300 - out of float range
+        True
+        >>> y = 1 / x.rescale(20); y.scale, digitPN.strF(y[4]), digitPN.strF(y._mantissa[300])
+        (20, '1600000.0', '10.0')
+        >>> print((y * x).chop())
+        (~1.0~)
+        >>> print(PolyNum('(~3~,2~1~)*(~1~0~)**(-1)').rescale(2) + PolyNum('(~1~,1~)'))
+        (~1.0~,4.0~2.0~1.0~)
+        >>> a = PolyNum([1., 2.]); b = a.rescale(); b += PolyNum([1., 1.])
+        >>> print(a); print(b)
+        (~1.0~,2.0~)
+        (~2.0~,3.0~)
+        """
+        if lam is not None and not lam > 0:
+            raise ValueError("rescale({}) - scale should be positive".format(lam))
+        m = self._atScale(lam or 1)._mantissa
+        if m is self._mantissa: # same scale - y may be changed in place
+            m = mantPN_copy(m)
+        y = PolyNum._fromMantExpo(m, self._exponent, self._max_N)
+        if lam is not None and lam != 1:
+            y._scale = lam
+        return y
+
+    def _atScale(self, lam):
+        """
+        plain (unscaled) PN of mantissa of self at scale `lam` - not a copy
+        if self is at scale lam
+        """
+        lamSelf = getattr(self, '_scale', None) or 1
+        y = object.__new__(PolyNum)
+        y._exponent = self._exponent
+        if lam == lamSelf:
+            y._mantissa = self._mantissa
+            return y
+        zero = self._mantissa[0] * 0
+        r = (zero + _digitOf(lamSelf, zero)) / _digitOf(lam, zero)
+        y._mantissa = mantPN_geomScale(self._mantissa, r, -self._exponent)
+        return y
 
     def _shrMantProc(self, r):
-        zero = 0 * self._mantissa[0]
-        if r > self._max_N:
-            r = self._max_N
-        zeros = [zero for __ in range(r)]
-        self._mantissa = zeros + self._mantissa[:(self._max_N - r)]
+        self._mantissa = mantPN_shr(self._mantissa, r, self._max_N)
 
     def _normalize0(self): #return None
         """First digit non-zero or zero PN - to use in init"""
         if self._mantissa[0]: #nothing to do
             return self
-        first = 0
-        m0 = self._mantissa[0]
-        for d in self._mantissa:
-            if d: #d!= 0
-                break
-            else:
-                first += 1
-                self._exponent  -= 1
-        if first == len(self._mantissa):
-            self._mantissa = [m0] #preserve first 0.0 - to get type of mant[0]
-        else:
-            self._mantissa = self._mantissa[first:]
-        self._fillZerosProc() # fill right zeros
+        m = self._mantissa # shifted in place - see __iadd__
+        N = len(m)
+        first = mantPN_firstNonzero(m)
+        self._exponent -= first
+        zero = m[0] if first == N else 0 * m[first] #preserve type of mant[0]
+        if first < N:
+            m[:N-first] = m[first:]
+        if mantPN_isVec(m):
+            m[N-first:] = zero
+        else: # list, array('d')
+            for k in range(N-first, N):
+                m[k] = zero
+        return self
         
 #-----------------------------------------------------------
         
@@ -275,12 +487,14 @@ class PolyNum(object):
     def __repr__(self):
         return "PolyNum('"+self._strPN(digitPN.reprF)+"')"
     
+    @_pnUnscaled
     def _strPN(self, digToStr):
         """
         digToStr = digitPN.strF
         """
-        cutedStr = hasattr(self, '_strPN_cut') and self._strPN_cut < self._max_N
-        ma = self.mantissa
+        strCut = getattr(self, '_strPN_cut', self._strCut)
+        cutedStr = strCut is not None and strCut < self._max_N
+        ma = self._mantissa
         ex = self.exponent
         # r = '({0}{1}{0}'.format(self._sep, ma[0]) # (~{}~
         try:
@@ -300,10 +514,10 @@ class PolyNum(object):
                 else:
                     last = last - 1
             ma = ma[:last]
-            if cutedStr and (len(ma) < self._strPN_cut-1):
+            if cutedStr and (len(ma) < strCut-1):
                cutedStr = False 
             if cutedStr:
-                ma = ma[:self._strPN_cut-1]
+                ma = ma[:strCut-1]
             if len(ma):
                 r += ','
                 for m in ma:
@@ -316,6 +530,7 @@ class PolyNum(object):
             r += '*({0}1{0}0{0})**({1})'.format(self._sep, ex) #*(~1~0~)**({})
         return r
         
+    @_pnScaled
     def chop(self, tol=digitPN.epsilonPNdig*1024*1024): #1024*1024 = 1e6
         """
         Converts PN digits close to zero to exact zeros. Normalize at the end.
@@ -326,9 +541,8 @@ class PolyNum(object):
         >>> PolyNum('(~1e-36~,2e-38~4.3~6.0~)').chop()
         PolyNum('(~4.3~,6.0~)*(~1~0~)**(-2)')
         """
-        zero = self.mantissa[0] * 0
-        ma = [digitPN.chop( d, tol, zero ) for d in self.mantissa]
-        x = PolyNum(ma, self.exponent)
+        ma = mantPN_chop(self._mantissa, tol)
+        x = PolyNum(ma, self.exponent, self._max_N)
         return x._normalize0()
 
     def __format__(self, format_spec):
@@ -341,18 +555,19 @@ class PolyNum(object):
     def __len__(self):
         return self._max_N
 
+    @_pnUnscaled
     def __call__(self, val):
         """
         >>> p = PolyNum([3.,0,1,2])
-        >>> p(5.)  # 3. * 5.**0 + 0 * 5.**(-1)1 + 1 * 5.**(-2) + 2 * 5.**(-3)
+        >>> print(digitPN.strF(p(5.)))  # 3. * 5.**0 + 0 * 5.**(-1)1 + 1 * 5.**(-2) + 2 * 5.**(-3)
         3.056
         >>> p1 = PolyNum([3.,0,1,2],-2)
-        >>> p1(5.)
+        >>> print(digitPN.strF(p1(5.)))
         0.12224
         """  
         if not self.__nonzero__():
             return val * 0 # zero of val type
-        y = mantPN_val(self.mantissa, val)
+        y = mantPN_val(self._mantissa, val)
         res = 1
         if self.exponent:
             res = val #val **self.exponent
@@ -362,24 +577,26 @@ class PolyNum(object):
         else:
             return y * res
             
+    @_pnScaled
     def __neg__(self):
-        return PolyNum([-x for x in self._mantissa], self.exponent)
+        return PolyNum._fromMantExpo(mantPN_neg(self._mantissa), self.exponent, self._max_N)
 
     def __pos__(self):
         return self
 
+    @_pnScaled
     def __mul__(self, other):
         """
         Examples
         --------
-        >>> PolyNum([1.,2,3],-2) * 100
-        PolyNum('(~100.0~,200~300~)*(~1~0~)**(-2)')
+        >>> PolyNum([1.,2.,3.],-2) * 100
+        PolyNum('(~100.0~,200.0~300.0~)*(~1~0~)**(-2)')
         >>> PolyNum([1.,2,3],-2) * PolyNum([0.1,2],-5)
         PolyNum('(~0.1~,2.2~4.3~6.0~)*(~1~0~)**(-7)')
         >>> PolyNum([0.1,2],-5) * PolyNum([1.,2,3],-2)
         PolyNum('(~0.1~,2.2~4.3~6.0~)*(~1~0~)**(-7)')
-        >>> 100 * PolyNum([1.,2,3],-2) #__rmul__ test
-        PolyNum('(~100.0~,200~300~)*(~1~0~)**(-2)')
+        >>> 100 * PolyNum([1.,2.,3.],-2) #__rmul__ test
+        PolyNum('(~100.0~,200.0~300.0~)*(~1~0~)**(-2)')
         
         >>> p1 = PolyNum([1.,2,3],-2) #__imul__   test 
         >>> p1 *= PolyNum([0.1,2],-5)
@@ -398,31 +615,39 @@ class PolyNum(object):
         ... 
         ValueError: [5, 6, 7] <- invalid operand for PN __rmul__
         """
+        if getattr(other, '_PNdefer', False):
+            return NotImplemented
+        N = self._max_N
         if isinstance(other, PolyNum):
-            yMant = mantPN_mul(self.mantissa, other.mantissa, self._max_N)
+            N = min(N, other._max_N)
+            yMant = mantPN_mul(self._mantEff(), other._mantEff(), N)
         elif isinstance(other,(int,float)) or \
                 not hasattr(other, '__len__'): #`other` is scalar
-            yMant = [x * other for x in self.mantissa]
+            yMant = mantPN_scale(self._mantissa, other)
         else:
             raise ValueError(str(other)+" <- invalid operand for PN __mul__")
         expoOther = 0
         if hasattr(other, 'exponent'):
             expoOther = other.exponent
-        return PolyNum(yMant, self.exponent + expoOther)
+        return PolyNum._fromMantExpo(yMant, self.exponent + expoOther, N)
 
+    @_pnScaled
     def __rmul__(self, other): # case: other * self 
+        N = self._max_N
         if isinstance(other, PolyNum):
-            yMant = mantPN_mul(other.mantissa, self.mantissa, self._max_N)
+            N = min(N, other._max_N)
+            yMant = mantPN_mul(other._mantEff(), self._mantEff(), N)
         elif isinstance(other,(int,float)) or \
                 not hasattr(other, '__len__'): #`other` is scalar
-            yMant = [other * x for x in self.mantissa]
+            yMant = mantPN_rscale(other, self._mantissa)
         else:
             raise ValueError(str(other)+" <- invalid operand for PN __rmul__")
         expoOther = 0 #f.ex. int, real, 
         if hasattr(other, 'exponent'):
             expoOther = other.exponent
-        return PolyNum(yMant, self.exponent + expoOther)
+        return PolyNum._fromMantExpo(yMant, self.exponent + expoOther, N)
 
+    @_pnScaled
     def __truediv__(self, other): #self / other
         """
         Examples
@@ -456,48 +681,51 @@ class PolyNum(object):
         ... 
         ValueError: [3, 4, 5] <- invalid operand for PN __rdiv__
         """
+        if getattr(other, '_PNdefer', False):
+            return NotImplemented
+        N = self._max_N
         if isinstance(other, PolyNum):
-            yMant = mantPN_mul(
-                self.mantissa, 
-                mantPN_inv(other.mantissa, self._max_N), 
-                self._max_N)
+            N = min(N, other._max_N)
+            yMant = mantPN_div(self._mantEff(), other._mantEff(), N)
         elif isinstance(other,(int,float)) or \
                 not hasattr(other, '__len__'): #`other` is scalar
-            yMant = [x / other for x in self.mantissa]
+            yMant = mantPN_scale(self._mantissa, other, div=True)
         else:
             raise ValueError(str(other)+" <- invalid operand for PN __div__")
         expoOther = 0
         if hasattr(other, 'exponent'):
             expoOther = other.exponent
-        return PolyNum(yMant, self.exponent - expoOther)
+        return PolyNum._fromMantExpo(yMant, self.exponent - expoOther, N)
 
     #? __div__ = __truediv__
 
+    @_pnScaled
     def __rtruediv__(self, other): # case: other / self 
-        inv = mantPN_inv(self.mantissa, self._max_N)
+        N = self._max_N
+        inv = mantPN_inv(self._mantEff(), N)
         if isinstance(other, PolyNum):
-            yMant = mantPN_mul(other.mantissa, inv, self._max_N)
+            N = min(N, other._max_N)
+            yMant = mantPN_mul(other._mantEff(), inv, N)
         else:
-            if other == 1  or  other == digitPN.onePNdig:
+            if not (isinstance(other,(int,float)) or \
+                    not hasattr(other, '__len__')): #`other` is not scalar
+                raise ValueError(str(other)+" <- invalid operand for PN __rdiv__")
+            elif other == 1  or  other == digitPN.onePNdig:
                 yMant = inv
-            elif isinstance(other,(int,float)) or \
-                    not hasattr(other, '__len__'): #`other` is scalar
-                yMant = [other * x for x in inv]
             else:
-                raise ValueError(str(other)+" <- invalid operand for PN __rdiv__")
+                yMant = mantPN_rscale(other, inv)
         expoOther = 0
         if hasattr(other, 'exponent'):
             expoOther = other.exponent
-        return PolyNum(yMant, expoOther - self.exponent)
+        return PolyNum._fromMantExpo(yMant, expoOther - self.exponent, N)
 
     #? __rdiv__ = __rtruediv__
     
-    def __idiv__(self, other): # need for transcript
-        return self.__truediv__(other)
     def __rdiv__(self, other): # need for transcript
         return self.__rtruediv__(other)
     def __div__(self, other): #?
         return self.__truediv__(other)
+    @_pnScaled
     def __add__(self, other):
         """
         >>> PolyNum('(~1~,2~3~)') + PolyNum('(~10~,20~30~)')
@@ -509,8 +737,8 @@ class PolyNum(object):
         >>> PolyNum('(~1~2~3~)') + 100
         PolyNum('(~1.0~,2.0~103.0~)*(~1~0~)**(2)')
         
-        >>> 100 + PolyNum([1.,2,3],-2) #__radd__ test
-        PolyNum('(~100.0~,0.0~1.0~2~3~)')
+        >>> 100 + PolyNum([1.,2.,3.],-2) #__radd__ test
+        PolyNum('(~100.0~,0.0~1.0~2.0~3.0~)')
         
         >>> p1 = PolyNum([1.,2,3],-2) #__iadd__   test 
         >>> p1 += PolyNum([0.1,5],-4)
@@ -522,32 +750,37 @@ class PolyNum(object):
         PolyNum('(~100.0~,0.0~0.0~0.0~0.1~2.0~)')
 
         """
+        if getattr(other, '_PNdefer', False):
+            return NotImplemented
         if ( isinstance(other,(int,float)) or \
                 not hasattr(other, '__len__') ) and not other:
             return PolyNum(self) #PolyNum() - copy of mantissa
-        otherPN = PolyNum(other)
+        otherPN = PolyNum(other, 0, None if isinstance(other, PolyNum) else self._max_N)
+        N = min(self._max_N, otherPN._max_N)
         if not self.__nonzero__():
-            return PolyNum(otherPN)
+            return PolyNum(otherPN, 0, N)
         if otherPN.exponent <= self.exponent:
             a1, a2 = self, otherPN
         else:
             a1, a2 = otherPN, self
-        if a2.exponent < a1.exponent - self._max_N:
-            return PolyNum(a1)
+        if a2.exponent < a1.exponent - N:
+            return PolyNum(a1, 0, N)
         if a2.exponent == a1.exponent: #it will be a common case - do not shrMant()
             # yMant = [a + b for (a,b) in zip_longest(a1.mantissa, a2.mantissa, fillvalue=0)])
-            yMant = [a + b for (a,b) in zip(a1.mantissa, a2.mantissa)]
+            yMant = mantPN_add(a1._mantissa[:N], a2._mantissa[:N])
         else:
-            a2 = PolyNum(a2) #copy of a2 mantissa, which will be shifted
+            a2 = PolyNum(a2, 0, N) #copy of a2 mantissa, which will be shifted
             a2._shrMantProc(a1.exponent - a2.exponent) 
             #because of leading zero a2 is treating as (~0~) PolynNum in debugger, 
             #but i.e. a2.mantissa == [0.0, 0.0, 1.0, 2, 3, 0.0, ... 
-            yMant = [a + b for (a,b) in zip(a1.mantissa, a2.mantissa)]
-        return PolyNum(yMant, a1.exponent)._normalize()
+            yMant = mantPN_add(a1._mantissa[:N], a2._mantissa)
+        return PolyNum(yMant, a1.exponent, N)._normalize()
 
+    @_pnScaled
     def __radd__(self, other):
-        return self.__add__(PolyNum(other))
+        return self.__add__(PolyNum(other, 0, self._max_N))
 
+    @_pnScaled
     def __sub__(self, other):
         '''
         >>> PolyNum('(~1~,2~3~)') - PolyNum('(~10~,20~30~)')
@@ -559,8 +792,8 @@ class PolyNum(object):
         >>> PolyNum('(~1~2~3~)') - 100
         PolyNum('(~1.0~,2.0~-97.0~)*(~1~0~)**(2)')
         
-        >>> 100 - PolyNum([1.1,2,3],-2) #__rsub__ test
-        PolyNum('(~100.0~,0.0~-1.1~-2~-3~)')
+        >>> 100 - PolyNum([1.1,2.,3.],-2) #__rsub__ test
+        PolyNum('(~100.0~,0.0~-1.1~-2.0~-3.0~)')
         
         >>> p1 = PolyNum([1.1,2.5,3],-2) #__isub__   test 
         >>> p1 -= PolyNum([0.1,5.1],-4)
@@ -571,13 +804,111 @@ class PolyNum(object):
         >>> p100     
         PolyNum('(~100.0~,0.0~0.0~0.0~-0.1~-2.0~)')
         '''
-        return self.__add__(-PolyNum(other))
+        if getattr(other, '_PNdefer', False):
+            return NotImplemented
+        return self.__add__(-PolyNum(other, 0, None if isinstance(other, PolyNum) else self._max_N))
 
+    @_pnScaled
     def __rsub__(self, other): # case: other - self 
         selfNeg = -self
         return selfNeg.__radd__(other)
 
+    @_pnDigits
+    def __iadd__(self, other):
+        """
+        self += other - in place: mantissa buffer of self is updated (PNs 
+        of the same exponent and N - without temporary mantissa)
+
+        >>> acc = PolyNum([1., 2]); buf = acc._mantissa
+        >>> for k in range(3):
+        ...     acc += PolyNum([1., 1.*k])
+        >>> acc, acc._mantissa is buf
+        (PolyNum('(~4.0~,5.0~)'), True)
+        >>> acc -= PolyNum([4., 5]); acc *= 2; acc, acc._mantissa is buf
+        (PolyNum('(~0.0~)'), True)
+        """
+        if self._isInplace(other):
+            mantPN_iadd(self._mantissa, other._mantissa)
+            if not self._mantissa[0]:
+                self._normalize0()
+            return self
+        return self._assign(self.__add__(other))
+
+    @_pnDigits
+    def __isub__(self, other):
+        if self._isInplace(other):
+            mantPN_iadd(self._mantissa, other._mantissa, -1)
+            if not self._mantissa[0]:
+                self._normalize0()
+            return self
+        return self._assign(self.__sub__(other))
+
+    @_pnDigits
+    def __imul__(self, other):
+        """
+        self *= other - in place for scalar other; RationalPN, LazyPN 
+        (see _PNdefer) - result of their reflected operation
 
+        >>> from RationalPN import RationalPN
+        >>> from LazyPN import lazy
+        >>> R = RationalPN([1., 1.], [1., -1.])
+        >>> y = PolyNum([1., 2.]); y *= R; print(y == PolyNum([1., 2.]) * R)
+        True
+        >>> y = PolyNum([1., 2.]); y /= R; print(y == PolyNum([1., 2.]) / R)
+        True
+        >>> y = PolyNum([1., 2.]); y *= lazy(PolyNum([2., 2.])); type(y).__name__
+        'LazyPN'
+        >>> y = PolyNum([1., 2.]); y /= lazy(PolyNum([2.])); print(y.evaluate())
+        (~0.5~,1.0~)
+        """
+        if getattr(other, '_PNdefer', False):
+            return NotImplemented
+        if isinstance(other,(int,float)) or not hasattr(other, '__len__'):
+            if self._isInplace(None) and other:
+                mantPN_iscale(self._mantissa, other)
+                return self
+        return self._assign(self.__mul__(other))
+
+    @_pnDigits
+    def __itruediv__(self, other):
+        if getattr(other, '_PNdefer', False):
+            return NotImplemented
+        if isinstance(other,(int,float)) or not hasattr(other, '__len__'):
+            if self._isInplace(None):
+                mantPN_iscale(self._mantissa, other, div=True)
+                return self
+        return self._assign(self.__truediv__(other))
+
+    __idiv__ = __itruediv__
+
+    def _isInplace(self, other):
+        """True if other (None - scalar) can be added/scaled in self buffer"""
+        if self._frozen:
+            return False
+        self._powers = None # mantissa will change
+        if other is None:
+            return True
+        return isinstance(other, PolyNum) and other._exponent == self._exponent and \
+            other._max_N == self._max_N and self.__nonzero__() and \
+            getattr(other, '_scale', None) == getattr(self, '_scale', None) and \
+            (not mantPN_isVec(self._mantissa) or mantPN_isVec(other._mantissa))
+
+    def _assign(self, y):
+        """self = y (new PN of operation), mantissa copied into self buffer"""
+        if not isinstance(y, PolyNum) or self._frozen:
+            return y
+        self._powers = None # cached powers of old value
+        if len(y._mantissa) == len(self._mantissa) and \
+                type(y._mantissa) is type(self._mantissa):
+            self._mantissa[:] = y._mantissa
+        else:
+            self._mantissa = y._mantissa
+        self._exponent = y._exponent
+        self._scale = getattr(y, '_scale', None)
+        return self
+
+
+    @_pnScaled
     def __pow__(self, a):
         """
         self **a
@@ -597,25 +928,94 @@ class PolyNum(object):
         PolyNum('(~10.0~,-200.0~4000.0~-80000.0~1600000.0~...~)')
         >>> print('-- 1 ----------')
         -- 1 ----------
-        >>> y0xx = (y0 * xx); y0xx._strPN_cut = 22; y0xx
-        PolyNum('(~1.0~,0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~...~)')
-        >>> y1xx = (y1 * xx); y1xx._strPN_cut = 22; y1xx
-        PolyNum('(~1.0~,0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~0.0~...~)')
+        >>> # digits of y0, y1 grow as 20**k - round-off is chopped at scale 20
+        >>> (y0 * xx).rescale(20).chop(), (y1 * xx).rescale(20).chop()
+        (PolyNum('(~1.0~)'), PolyNum('(~1.0~)'))
+
+        p_trap(h) **a - closed form (O(N)), see pn_const('p_trap_pow', a)
+        >>> p = PolyNum('const:(~2~,-4~4~-4~4~...~)') / digitPN.flt('0.25')
+        >>> y = p **1.5; y._strPN_cut = 5; print(y)
+        (~22.627417~,-67.882251~101.823376~-124.450793~144.249783~...~)
+        >>> tol = digitPN.flt('1e-12')
+        >>> y.isclose(PolyNum(mantPN_power_real(p.mantissa, 1.5, 64)), tol, tol)
+        True
+
+        x **0.5, x **-0.5 - coupled Newton iteration (mantPN_sqrt, mantPN_invsqrt)
+        >>> x = PolyNum('(~4.0~,4.0~1.0~)')
+        >>> (x **0.5).chop(), (x **-0.5 * x **0.5).chop()
+        (PolyNum('(~2.0~,1.0~)'), PolyNum('(~1.0~)'))
         """
         if not a or not self.__nonzero__():  # results of x[0] **0 and 0 **a (rather =1) determined by mantissa[0] **a
-            return PolyNum([self._mantissa[0] **a]) # (~1~,0~0~...~)
+            return PolyNum([self._mantissa[0] **a], 0, self._max_N) # (~1~,0~0~...~)
         #if (self.exponent != 0 and not isinstance(a, numbers.Integral)):
         if (self.exponent != 0 and not isinstance(a, int)):
             raise ValueError("Power only to int, real, rational by exponent == 0 or to int by exponent != 0")
+        a = _digitOf(a, self._mantissa[0])
         #if self.exponent == 0 power to int, real, rational allowed
-        yMant = mantPN_power_real(self.mantissa, a, self._max_N)
+        if isinstance(a, int) and not isinstance(a, bool):
+            yMant = self._powInt(abs(a))
+            if a < 0:
+                yMant = mantPN_div([yMant[0]*0 + 1], yMant[:mantPN_effLen(yMant)], self._max_N)
+            else:
+                yMant = mantPN_copy(yMant)
+        elif not self._exponent and mantPN_isPTrap(self._mantissa):
+            # self == (m0/2) * p_trap, p_trap**a - closed form O(N)
+            yMant = mantPN_scale(pn_const('p_trap_pow', a, N=self._max_N)._mantissa,
+                                 (self._mantissa[0] / 2) **a)
+        elif a == 0.5:
+            yMant = mantPN_sqrt(self._mantissa, self._max_N)
+        elif a == -0.5:
+            yMant = mantPN_invsqrt(self._mantissa, self._max_N)
+        else:
+            yMant = mantPN_power_real(self._mantissa, a, self._max_N)
         
         expo = 0
         if self.exponent != 0:
             expo = self.exponent * a
             #assert isinstance(expo, numbers.Integral)
             assert isinstance(expo, int)
-        return PolyNum(yMant, expo)
+        return PolyNum._fromMantExpo(yMant, expo, self._max_N)
+
+    def _powInt(self, n):
+        """
+        mantissa of self **n, int n >= 1 - binary exponentiation
+        (square-and-multiply by mantPN_mul()); powers are cached in PN 
+        (up to PolyNumConf.POW_CACHE_SIZE), so p**2 + p**3 + p**4 
+        costs 3 products. Returned mantissa is shared - do not modify.
+
+        >>> p = PolyNum('(~1.0~,1~)')
+        >>> p **5
+        PolyNum('(~1.0~,5.0~10.0~10.0~5.0~1.0~)')
+        >>> sorted(p._powers)
+        [2, 5]
+        >>> y = p **-2; y._strPN_cut = 5; y
+        PolyNum('(~1.0~,-2.0~3.0~-4.0~5.0~...~)')
+
+        in-place operations drop the cache
+        >>> p = PolyNum([1., 2, 3]); y = p **2; p *= PolyNum([1., 1])
+        >>> (p **2).isclose(p * p)
+        True
+        """
+        if n == 1:
+            return self._mantissa
+        size = PolyNumConf.POW_CACHE_SIZE
+        powers = getattr(self, '_powers', None)
+        if powers is None:
+            powers = {}
+            if size:
+                object.__setattr__(self, '_powers', powers) # also pn_const
+        y = powers.get(n)
+        if y is None:
+            h = self._powInt(n // 2)
+            h = h[:mantPN_effLen(h)]
+            y = mantPN_mul(h, h, self._max_N)
+            if n % 2:
+                y = mantPN_mul(y[:mantPN_effLen(y)], self._mantEff(), self._max_N)
+            if size:
+                if len(powers) >= size:
+                    del powers[next(iter(powers))] # the oldest
+                powers[n] = y
+        return y
 
     def _MantPN_isclose(self, other, rel_tol=digitPN.epsilonPNdig*128, abs_tol=digitPN.epsilonPNdig*128): 
         """
@@ -630,11 +1030,18 @@ class PolyNum(object):
         """
         if not isinstance(other, PolyNum):
             return NotImplemented
-        for a, b in zip(self.mantissa, other.mantissa):
+        if mantPN_isArr(self._mantissa) and mantPN_isArr(other._mantissa):
+            import numpy as np
+            N = min(self._max_N, other._max_N)
+            a, b = self._mantissa[:N], other._mantissa[:N]
+            return bool(np.all(abs(a - b) <= np.maximum(abs_tol, 
+                                rel_tol * np.maximum(abs(a), abs(b)))))
+        for a, b in zip(self._mantissa, other._mantissa):
             if not digitPN.PNdig_isclose(a, b, rel_tol, abs_tol): # a != b:
                 return False
         return True
 
+    @_pnScaled
     def isclose(self, other, rel_tol=digitPN.epsilonPNdig*128, abs_tol=digitPN.epsilonPNdig*128): 
         """
         Return :
@@ -651,7 +1058,7 @@ class PolyNum(object):
         if isinstance(other, PolyNum):
             otherPN = other
         else:
-            otherPN = PolyNum(other)
+            otherPN = PolyNum(other, 0, self._max_N)
         if otherPN.exponent <= self.exponent:
             a1, a2 = self, otherPN
         else:
@@ -672,6 +1079,7 @@ class PolyNum(object):
         return not self.__eq__(other)
         
         
+    @_pnScaled
     def __abs__(self):
         """
         | . |
@@ -680,7 +1088,7 @@ class PolyNum(object):
         >>> abs(PolyNum('(~2.4~,-1.1~-8.8~)'))
         PolyNum('(~2.4~,1.1~8.8~)')
         """
-        return PolyNum([abs(x) for x in self.mantissa], self.exponent)
+        return PolyNum._fromMantExpo(mantPN_abs(self._mantissa), self.exponent, self._max_N)
 
     def isnonnegative(self):
         """
@@ -697,7 +1105,9 @@ class PolyNum(object):
         """
         if not self.__nonzero__():
             return True
-        for x in self.mantissa:
+        if mantPN_isArr(self._mantissa):
+            return bool((self._mantissa >= 0).all())
+        for x in self._mantissa:
             if not x >= 0:
                 return False
         return True
@@ -718,7 +1128,7 @@ class PolyNum(object):
         >>> abs(x) <= 2*abs(x)
         True
         """
-        other = PolyNum(other)
+        other = PolyNum(other, 0, None if isinstance(other, PolyNum) else self._max_N)
         return ( other - self ).isnonnegative()
 
     def __ge__(self, other):
@@ -738,6 +1148,7 @@ class PolyNum(object):
         
 ########
         
+    @_pnScaled
     def sqrt(self):
         """
         sqrt()
@@ -752,8 +1163,9 @@ class PolyNum(object):
         """
         if self._exponent and (self.exponent % 2): #odd
             raise ValueError("Does not support sqrt() if exponent is odd: {}.format()self.exponent")
-        return PolyNum(mantPN_sqrt(self.mantissa, self._max_N), self._exponent // 2)
+        return PolyNum._fromMantExpo(mantPN_sqrt(self._mantissa, self._max_N), self._exponent // 2, self._max_N)
 
+    @_pnScaled
     def exp(self):
         """
         exp()
@@ -774,15 +1186,16 @@ class PolyNum(object):
             raise ValueError("Todo(?) - case if exponent (== {}) is positive.".format(self.exponent))
             
         if self._exponent == 0: #it will be common case - do not shrMant()
-            return PolyNum(mantPN_exp(self.mantissa, self._max_N))
+            return PolyNum._fromMantExpo(mantPN_exp(self._mantissa, self._max_N), 0, self._max_N)
         else:
             a2 = PolyNum(self) #copy of a2 mantissa, which will be shifted
             a2._shrMantProc(-a2._exponent) 
             # because of leading zero a2 is treating as (~0~), but i.e.
             # a2.mantissa [0.0, 0.0, 1.0, 2, 3, 0.0, ... 
-            return PolyNum(mantPN_exp(a2.mantissa, self._max_N))
+            return PolyNum._fromMantExpo(mantPN_exp(a2._mantissa, self._max_N), 0, self._max_N)
 
 ####
+    @_pnDigits
     def expZ(self, pZ, T0, h):
         """
         returns exp() with shifted samples
@@ -808,11 +1221,13 @@ class PolyNum(object):
             return PolyNum(x.exp(), -K)
 ####
 
+    @_pnScaled
     def ln(self):
         if self._exponent: 
             raise ValueError("Does not support ln() if exponent is nonzero: {}.format()self.exponent")
-        return PolyNum(mantPN_ln(self.mantissa, self._max_N))
+        return PolyNum._fromMantExpo(mantPN_ln(self._mantissa, self._max_N), 0, self._max_N)
 
+    @_pnUnscaled
     def __getitem__(self, index):
         """
         index < 0 is not allowed
@@ -825,13 +1240,13 @@ class PolyNum(object):
         >>> x = [ 1, 2, 3, 4, 5, 6, 7, 8, 9,10,11,12,13,14,15,16,\
                  17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32]
         >>> x1 = PolyNum(x)
-        >>> x1[0]
+        >>> int(x1[0])
         1
         >>> x2 = PolyNum(x,-2)
-        >>> x2[31]
+        >>> int(x2[31])
         30
         >>> x3 = PolyNum(x,-3)
-        >>> (x3[:])[:32]
+        >>> [int(d) for d in x3[:]][:32]
         [0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29]
         >>> x4 = PolyNum(x,4)
         >>> x4[:]
@@ -841,13 +1256,13 @@ class PolyNum(object):
 
         """
         if not self.exponent: #the most common case
-            return self.mantissa[index]
+            y = self._mantissa[index]
+            return y.copy() if type(index) is slice and mantPN_isArr(y) else y
         if type(index) is slice:
             if self._exponent > 0: 
                 raise ValueError("if exponent(={}) is positive, PN slicing is not allowed".format(self._exponent))
-            y = ([0 * self._mantissa[0]] * (-self._exponent)) \
-                    + self.mantissa[:self._exponent] # [:-(-self._exponent)]
-            return y[index]
+            y = mantPN_shr(self._mantissa, -self._exponent, len(self._mantissa))
+            return y[index] # [:-(-self._exponent)] shifted right
         else: # int
             if not 0 <= index < len(self._mantissa): raise IndexError()
             i = index + self._exponent
@@ -860,12 +1275,13 @@ class PolyNum(object):
             if i < 0:
                 return 0 * self._mantissa[0] # zero of type m[0]
             else:
-                return self.mantissa[i]
+                return self._mantissa[i]
      
 #     def __setitem__(self, index, val):
 #         self._mantissa[index] = val
 #         return
  
+    @_pnUnscaled
     def __iter__(self):
         """
         if __iter__ is not defined, then __getitem__ is used for list()
@@ -873,10 +1289,10 @@ class PolyNum(object):
         >>> x = [ 1, 2, 3, 4, 5, 6, 7, 8, 9,10,11,12,13,14,15,16,\
                  17,18,19,20,21,22,23,24,25,26,27,28,29,30,31,32]
         >>> x1 = PolyNum(x)
-        >>> list(x1)[:32]
+        >>> [int(d) for d in x1][:32]
         [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
         >>> x2 = PolyNum(x,-2)
-        >>> list(x2)[:32]
+        >>> [int(d) for d in x2][:32]
         [0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30]
         >>> x4 = PolyNum(x,4)
         >>> list(x4)
@@ -885,14 +1301,13 @@ class PolyNum(object):
         ValueError: if exponent(=4) is positive, PN __iter__  is not allowed
         """
         if not self.exponent: #the most common case
-            return iter(self.mantissa)
+            return iter(self._mantissa)
         if self._exponent > 0: 
                 raise ValueError("if exponent(={}) is positive, PN __iter__  is not allowed".format(self._exponent))
-        zero = 0 * self._mantissa[0]
-        y = ([zero for __ in range(-self._exponent)]) \
-                    + self.mantissa[:self._exponent] # [:-(-self._exponent)]
-        return iter(y)
+        y = mantPN_shr(self._mantissa, -self._exponent, len(self._mantissa))
+        return iter(y) # [:-(-self._exponent)] shifted right
 
+    @_pnUnscaled
     def asList(self):
         '''
         List normalized to exponent=0 - only if exponent <= 0
@@ -910,8 +1325,7 @@ class PolyNum(object):
                     'PN exponent = {}. Can not convert to array if PN exponent > 0'\
                     .format(-ex))
             else: #(-self.exponent) > 0
-                zero = 0 * self._mantissa[0]
-                mantissaE0 = [zero for __ in range(ex)] + self._mantissa 
+                mantissaE0 = mantPN_shr(self._mantissa, ex, ex + len(self._mantissa))
             return mantissaE0 
     #import numpy as np
     #return np.asarray(mantissaE0)
@@ -919,11 +1333,12 @@ class PolyNum(object):
     
 #&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&&
 
+    @_pnUnscaled
     def invTr1LaplPN (self, t):
         """
-        inp: t :float
-        otpt: y, err :float
-        
+        inp: t :float or array_like of float
+        otpt: y, err :float or (for array t) ndarray - all t at once
+
         Examples:
         >>> Yerr = PolyNum('(~1~2~)') 
         >>> Yerr.invTr1LaplPN(1)
@@ -931,13 +1346,23 @@ class PolyNum(object):
         ... 
         ValueError: PN exponent = 1 > 0 - inverese Laplce transform does not exist.
             
+        >>> p = PolyNum('const:(~2~,-4~4~-4~4~...~)') / digitPN.flt('0.1')
+        >>> Y = 1 / (p*p + p + 4) * PolyNum('(~0~,1~)')
+        >>> t = [0, 0.5, 1, 2.5, -1]
+        >>> y, err = Y.invTr1LaplPN(t)
+        >>> [list(y), list(err)] == [list(v) for v in zip(*(Y.invTr1LaplPN(_t) for _t in t))]
+        True
         """
+        if hasattr(t, '__len__'):
+            return self._invTr1LaplPN_arr(t)
         stop = False
         zero = self._mantissa[0] * 0
+        t = zero + _digitOf(t, zero)
         one = zero + 1 #1 of type of zero
         if t < 0:
             return zero, zero
         max_a = zero
+        eps = digitPN.epsilonPNdig
         
         ex = self._exponent
         if ex >= 0:
@@ -947,7 +1372,7 @@ class PolyNum(object):
         if t == 0:
             #return self._mantissa[-ex-1], zero
             #rather set t=0+ = eps/int(1e24)
-            t = digitPN.epsilonPNdig / 1000000000000000000000000
+            t = eps / 1000000000000000000000000
             
         wk = one
         for k in range(1, -ex-1+1): # (~0~,0~0~0~0
@@ -975,9 +1400,9 @@ class PolyNum(object):
                     dk_maxLocal = k-k_maxLocal
                     k_maxLocal = k
                 stop = ( (dk_maxLocal > 0) and (q_maxLocal < 1) 
-                        and (maxLocal < abs(out)*digitPN.epsilonPNdig) ) \
+                        and (maxLocal < abs(out)*eps) ) \
                     or \
-                    ( (k > k_maxLocal + self._max_N // 4) and (abs_ak < abs(out)*digitPN.epsilonPNdig) )
+                    ( (k > k_maxLocal + self._max_N // 4) and (abs_ak < abs(out)*eps) )
                     #last line - not oscillatory convergent
 
             out=out + ak
@@ -986,12 +1411,42 @@ class PolyNum(object):
                 break
 
         if ( (k <= k_maxLocal+self._max_N // 4) and (dk_maxLocal > 0) and (q_maxLocal < 1) ):
-            err = maxLocal * q_maxLocal **((k-k_maxLocal)/dk_maxLocal )
+            err = maxLocal * q_maxLocal **((k-k_maxLocal)/(dk_maxLocal + zero))
         else:
             err = abs_ak
-        err = err + (max_a+out) * digitPN.epsilonPNdig;
+        err = err + (max_a+out) * eps;
 
         return out, err #end def invTr1LaplPN(self, t)
+
+    def _invTr1LaplPN_arr(self, t):
+        """
+        invTr1LaplPN() for array of t: weights `wk` and stop criterion
+        for all t (lanes) together, stopped lanes are masked
+        """
+        import numpy as np
+        t, zero, lanes = _invTrLanes(self._mantissa, t)
+        ex = self._exponent
+        if ex >= 0:
+            raise ValueError(
+                'PN exponent = {} > 0 - inverese Laplce transform does not exist.'\
+                .format(ex))
+        isNeg = t < 0
+        t = np.where(t == 0, digitPN.epsilonPNdig / 1000000000000000000000000, t)
+        t = np.where(isNeg, zero + 1, t)
+
+        wk = np.full(t.shape, zero + 1, dtype=t.dtype)
+        for k in range(1, -ex-1+1):
+            wk = wk * t/k
+        out = self._mantissa[0] * wk
+        lanes.start(abs(out), 0)
+        for k in range(0, self._max_N-1):
+            wk = wk * t / (k-ex)
+            ak = self._mantissa[k+1] * wk
+            out = lanes.step(k, ak, out, self._max_N)
+            if not lanes.active.any():
+                break
+        out, err = lanes.finish(out, self._max_N // 4, 1)
+        return np.where(isNeg, zero, out), np.where(isNeg, zero, err)
         
         
 
@@ -1077,6 +1532,7 @@ class PolyNum(object):
 ###
 ####
 
+    @_pnUnscaled
     def invTr05exp_b0_LaplPN (self, t, b0):
         """
         inp: t, b0 :float
@@ -1100,13 +1556,26 @@ class PolyNum(object):
                     flt('20')*digitPN.erfc(b0/digitPN.sqrt(t)/2)+ \
                     flt('60')*digitPN.sqrt(t/digitPN.pi)*digitPN.exp(-b0*b0/t/4)- \
                     flt('30')*b0*digitPN.erfc(b0/digitPN.sqrt(t)/2)
-        >>> yOK = PolyNum([y_ok(t_) for t_ in t])
+        >>> with digitPN.digitContext(): yOK = PolyNum([y_ok(t_) for t_ in t])
         >>> y = PolyNum(y)
         >>> abs( y - yOK ) <= (digitPN.epsilonPNdig*1024*1024) * PolyNum('const:(~1~,2~2~2~2~...~)')
         True
+
+        t and/or b0 as array_like - all (t, b0) pairs (broadcasted) at once:
+        >>> yA, errA = Y.invTr05exp_b0_LaplPN(t, b0)
+        >>> list(yA) == list(y)
+        True
+        >>> t2, b2 = [0, 0, 0.5, 1, -1], [0, 1, 1, 2, 1]
+        >>> y2, err2 = Y.invTr05exp_b0_LaplPN(t2, b2)
+        >>> [list(y2), list(err2)] == [list(v) for v in zip(*(
+        ...     Y.invTr05exp_b0_LaplPN(_t, _b) for (_t, _b) in zip(t2, b2)))]
+        True
         """
+        if hasattr(t, '__len__') or hasattr(b0, '__len__'):
+            return self._invTr05exp_b0_LaplPN_arr(t, b0)
         stop = False
         zero = self._mantissa[0] * 0
+        t, b0 = zero + _digitOf(t, zero), zero + _digitOf(b0, zero)
         #one = zero + 1 #1 of type of zero
         if t < 0:
             return zero, zero
@@ -1119,6 +1588,7 @@ class PolyNum(object):
 
         ce1 = -ex-1
         pi_ = digitPN.pi
+        eps = digitPN.epsilonPNdig
         if (t == 0):
             if (b0 != 0):
                 return zero, zero
@@ -1164,9 +1634,9 @@ class PolyNum(object):
                         dk_maxLocal = k-k_maxLocal
                         k_maxLocal = k
                     stop = ( (dk_maxLocal > 0) and (q_maxLocal < 1) 
-                        and (maxLocal < abs(out)*digitPN.epsilonPNdig) ) \
+                        and (maxLocal < abs(out)*eps) ) \
                         or \
-                        ( (k > k_maxLocal + self._max_N // 4) and (abs_ak < abs(out)*digitPN.epsilonPNdig) )
+                        ( (k > k_maxLocal + self._max_N // 4) and (abs_ak < abs(out)*eps) )
                         #last line - for not oscillatory convergent case
                 out = out + ak
 
@@ -1177,11 +1647,57 @@ class PolyNum(object):
                 err = maxLocal * q_maxLocal **((k-k_maxLocal)/dk_maxLocal)
             else:
                 err = abs_ak
-        err = err + (max_a+out) * digitPN.epsilonPNdig
+        err = err + (max_a+out) * eps
         return out, err #invTr05exp_b0_LaplPN()
 
+    def _invTr05exp_b0_LaplPN_arr(self, t, b0):
+        """
+        invTr05exp_b0_LaplPN() for arrays of t, b0 (broadcasted): 
+        recurrence of y[k] and stop criterion for all lanes together
+        """
+        import numpy as np
+        t, zero, __ = _invTrLanes(self._mantissa, t)
+        b0 = _digitArr(self._mantissa, b0)
+        t, b0 = np.broadcast_arrays(t, b0)
+        lanes = _InvTrLanes(t.shape, t.dtype, zero)
+        ex = self._exponent
+        if ex >= 0:
+            raise ValueError(
+                'PN exponent = {} > 0 - inverese Laplce transform does not exist.'\
+                .format(ex))
+        ce1 = -ex-1
+        pi_ = digitPN.pi
+        isNeg, isT0 = t < 0, t == 0
+        t = np.where(isNeg | isT0, zero + 1, t)
+
+        y = [zero, zero] # ring-array of 2 last values[0..1]
+        y[0] = _digitFunArr(digitPN.exp, -(b0*b0)/(4*t)) / _digitFunArr(digitPN.sqrt, pi_*t)
+        y[1] = _digitFunArr(digitPN.erfc, 
+            b0 / _digitFunArr(digitPN.sqrt, 2*t) / digitPN.sqrt(2+zero))
+        for k in range(1, ce1+1):
+            y[(k+1) % 2] = (2*t* y[(k-1) % 2] - b0 * y[k % 2]) / k
+
+        k = ce1
+        out = self._mantissa[k-ce1] * y[k % 2]
+        lanes.start(abs(out), ce1)
+        while 1:
+            k += 1
+            y[(k+1) % 2] = (2*t* y[(k-1) % 2] - b0 * y[k % 2]) / k
+            ak = self._mantissa[k-ce1] * y[k % 2]
+            out = lanes.step(k, ak, out, self._max_N)
+            if (k >= self._max_N-1 + ce1) or not lanes.active.any():
+                break
+        out, err = lanes.finish(out, self._max_N-1 // 4)
+
+        # t == 0: out = zero if b0 != 0 else self._mantissa[ex+2] (or zero)
+        out0 = np.where(b0 == 0, self._mantissa[ex+2] if ex+2 >= 0 else zero, zero)
+        out = np.where(isNeg, zero, np.where(isT0, out0, out))
+        err = np.where(isNeg, zero, np.where(isT0, out0 * digitPN.epsilonPNdig, err))
+        return out, err
+
 ####
     
+    @_pnDigits
     def const_Qu(self, n, a):
         """
         Qu_n(a)
@@ -1192,12 +1708,7 @@ class PolyNum(object):
         
         -- not yet tested
         """
-        _4nn = 4*n*n
-        mant = self._mantissa[:]
-        mant[0] = mant[0]*0 + 1 # 1.0 of type of mant[0]
-        for k in range(1, self._max_N):
-            mant[k] = mant[k-1] * (_4nn -(2*k-1)*(2*k-1)) / (8*a*k)
-        return PolyNum(mant, 0)
+        return PolyNum(pn_const('Qu', n, a, N=self._max_N))
 
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
     
@@ -1251,6 +1762,120 @@ class PolyNum(object):
 
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
+#################### PN constants ####################
+
+_CONST_GEN = {} # name -> generator(N, *args) of mantissa (O(N))
+_CONST_STR = {} # 'const:(~...~)' string -> name
+
+def pn_registerConst(name, generator, strForm=None):
+    """
+    Registers PN constant `name` (available also as string 'const:<name>'
+    or strForm in PolyNum(str)), generator(N, *args) returns mantissa 
+    (list of digits, up to N) of exponent 0 - see pn_const().
+
+    >>> pn_registerConst('p_bdf2', lambda N: [1.5, -2., 0.5]) # 3/2 - 2z + 1/2z**2
+    >>> print(PolyNum('const:p_bdf2'))
+    (~1.5~,-2.0~0.5~)
+    """
+    _CONST_GEN[name] = generator
+    if strForm is not None:
+        _CONST_STR[strForm] = name
+    _constPN.cache_clear()
+
+def pn_const(name, *args, **kwargs):
+    """
+    pn_const(name, *args, N=None)
+        Shared immutable PN constant `name` (of parameters args) of N
+        digits (default pn_getN()). Constants are cached (LRU) by 
+        (name, args, N, digit type) - a copy is made only by PolyNum(). 
+        Built-in constants (multiply by 1/h, where needed):
+            'p_trap'    (~2~,-4~4~-4~4~...~)  == 2(1-z)/(1+z), trapezoidal rule
+            'flat'      (~1~,2~2~2~2~...~)    == (1+z)/(1-z)
+            'p_euler'   (~1~,-1~)             == 1-z, backward Euler
+            'p_simpson' (~3~,-12~42~...~)     == 3(1-z**2)/(1+4z+z**2), 
+                Simpson rule (digits grow as 3.73**k)
+            'p_trap_pow', a - p_trap**a, a - real (O(N), see __pow__):
+                c[0] = 2**a, c[1] = -2a c[0], 
+                c[k+1] = (-2a c[k] + (k-1) c[k-1]) / (k+1)
+            'Qu', n, a  - see PolyNum.const_Qu()
+            
+    >>> p = pn_const('p_trap', N=8); [int(d) for d in p]
+    [2, -4, 4, -4, 4, -4, 4, -4]
+    >>> p is pn_const('p_trap', N=8), p is PolyNum('const:(~2~,-4~4~-4~4~...~)', 0, 8)
+    (True, False)
+    >>> [int(d) for d in pn_const('p_simpson', N=6)]
+    [3, -12, 42, -156, 582, -2172]
+    >>> p._strPN_cut = 7
+    Traceback (most recent call last):
+    ...
+    AttributeError: PN constant is immutable - use PolyNum(pn_const(...))
+    """
+    N = kwargs.pop('N', None)
+    if kwargs:
+        raise TypeError('unexpected keyword arguments: {}'.format(list(kwargs)))
+    if N is None:
+        N = _precision_N.get()
+    name = _CONST_STR.get(name, name)
+    if name not in _CONST_GEN:
+        raise ValueError("{!r} - unknown PN const.".format(name))
+    return _constPN(name, args, N, digitPN.getBackend().FLOAT_TYPE)
+
+@functools.lru_cache(maxsize=64)
+def _constPN(name, args, N, floatType):
+    return _ConstPN(_CONST_GEN[name](N, *args), 0, N)
+
+class _ConstPN(PolyNum):
+    """shared PN - read only (see pn_const)"""
+    __slots__ = ('_frozen',)
+    def __init__(self, *args):
+        PolyNum.__init__(self, *args)
+        if mantPN_isArr(self._mantissa):
+            self._mantissa.flags.writeable = False
+        elif mantPN_isDD(self._mantissa):
+            self._mantissa.hi.flags.writeable = False
+            self._mantissa.lo.flags.writeable = False
+        self._frozen = True
+    def __setattr__(self, name, value):
+        if getattr(self, '_frozen', False):
+            raise AttributeError("PN constant is immutable - use PolyNum(pn_const(...))")
+        object.__setattr__(self, name, value)
+
+def _const_p_trap(N):
+    mant = [4, -4] * ((N + 1)//2)
+    mant[0] = 2
+    return mant[:N]
+
+def _const_p_simpson(N):
+    # 3(1-z**2) / (1+4z+z**2):  y[k] = x[k] - 4 y[k-1] - y[k-2]
+    mant = [3, -12]
+    for k in range(2, N):
+        mant.append((-3 if k == 2 else 0) - 4*mant[k-1] - mant[k-2])
+    return mant[:N]
+
+def _const_p_trap_pow(N, a):
+    # ((1-z)/(1+z))**a == f:  (1-z**2) f' == -2a f
+    mant = [(digitPN.onePNdig * 2) **a]
+    if N > 1:
+        mant.append(-2 * a * mant[0])
+    for k in range(1, N-1):
+        mant.append((-2 * a * mant[k] + (k-1) * mant[k-1]) / (k+1))
+    return mant
+
+def _const_Qu(N, n, a):
+    # k-th digit = Γ(n+k+(1/2)) / (Γ(n-k+(1/2)) * k! * (2*a) **k)
+    _4nn = 4*n*n
+    mant = [digitPN.onePNdig]
+    for k in range(1, N):
+        mant.append(mant[k-1] * (_4nn -(2*k-1)*(2*k-1)) / (8*a*k))
+    return mant
+
+pn_registerConst('p_trap', _const_p_trap, 'const:(~2~,-4~4~-4~4~...~)')
+pn_registerConst('flat', lambda N: [1] + [2]*(N-1), 'const:(~1~,2~2~2~2~...~)')
+pn_registerConst('p_euler', lambda N: [1, -1])
+pn_registerConst('p_simpson', _const_p_simpson)
+pn_registerConst('p_trap_pow', _const_p_trap_pow)
+pn_registerConst('Qu', _const_Qu)
+
 def getMantissaExponent_fromStr(s, sep, max_N):
     '''
     max_N is used to generate constatnts
@@ -1307,17 +1932,11 @@ def getMantissaExponent_fromStr(s, sep, max_N):
     
     # const 
     if mLR_[0] == 'c':
-        mant = []
-        if mLR_ == 'const:(~2~,-4~4~-4~4~...~)':
-            for __ in range(max_N//2):
-                mant.extend([4,-4])
-            mant[0] = 2
-        elif mLR_ == 'const:(~1~,2~2~2~2~...~)':
-            mant = [1] + [2 for __ in range(max_N-1)]
-        else:
+        name = _CONST_STR.get(mLR_, mLR_[len('const:'):])
+        if not mLR_.startswith('const:') or name not in _CONST_GEN:
             raise ValueError(
             "{!r} error - unknow PN const format.".format(s))
-        return mant[:max_N], expo
+        return pn_const(name, N=max_N)._mantissa, expo # copied by PolyNum()
     
     # values
     mLR_ = mLR_.replace(sep+',','`,') # '(~1.2`,2.~-0.3~)' (for case '(`,2.~-0.3~)')
@@ -1340,6 +1959,115 @@ def getMantissaExponent_fromStr(s, sep, max_N):
     mant = [digitPN.flt(d) for d in m]
     return mant, expo
 
+#################### invTr...LaplPN for array of t ####################
+
+def _digitOf(a, dig):
+    """
+    scalar `a` as a digit of type of `dig` if `a` is float and does not mix
+    with `dig` (i.e. Decimal digits), otherwise `a`
+    """
+    if not isinstance(a, float) or isinstance(dig, float):
+        return a
+    try:
+        return dig*0 + a
+    except TypeError:
+        return type(dig)(repr(a))
+
+def _invTrLanes(mant, t):
+    """
+    t as ndarray (dtype float or object - for not float digits), 
+    zero of that dtype and _InvTrLanes for lanes of t
+    """
+    zero = mant[0] * 0
+    t = _digitArr(mant, t)
+    return t, zero, _InvTrLanes(t.shape, t.dtype, zero)
+
+def _digitArr(mant, x):
+    """
+    x as ndarray of dtype float (float digits of mant) or object - items 
+    of type of mant digits (see _digitOf())
+    """
+    import numpy as np
+    if mantPN_isFloat(mant[:1]):
+        return np.array(x, dtype=float)
+    x = np.array(x, dtype=object)
+    zero = mant[0] * 0
+    return np.array(np.frompyfunc(lambda v: zero + _digitOf(v, zero), 1, 1)(x), dtype=object)
+
+def _digitFunArr(f, x):
+    """scalar function `f` (digitPN.exp, ...) for each item of ndarray x"""
+    import numpy as np
+    return np.frompyfunc(f, 1, 1)(x).astype(x.dtype)
+
+class _InvTrLanes(object):
+    """
+    Per-lane state of the series sum in invTr...LaplPN: local maxima of
+    |a_k|, stop criterion and error estimate - like scalar loop, but 
+    stopped lanes are frozen by masks.
+    """
+    def __init__(self, shape, dtype, zero):
+        import numpy as np
+        self.np = np
+        self.zero = zero
+        z = np.full(shape, zero, dtype=dtype)
+        self.active = np.ones(shape, dtype=bool)
+        self.max_a, self.abs_ak, self.maxLocal, self.q_maxLocal = z, z, z, z
+        self.dk_maxLocal = np.full(shape, -1)
+        self.k_maxLocal = np.full(shape, -(1 << 30)) # no local max
+        self.k = np.zeros(shape, dtype=int)
+
+    def start(self, abs_out, kOut):
+        """abs_a[kOut % 3] = |out| (ring-array of 3 last abs_ak)"""
+        self.abs_a = [self.abs_ak, self.abs_ak, self.abs_ak]
+        self.abs_a[kOut % 3] = abs_out
+
+    def step(self, k, ak, out, max_N):
+        """
+        a_k term of active lanes: local max and stop; returns out + ak
+        """
+        np, act, abs_a = self.np, self.active, self.abs_a
+        with np.errstate(all='ignore'):
+            abs_ak = np.where(act, abs(ak), self.abs_ak)
+            self.abs_ak = abs_ak
+            self.max_a = np.where(act & (abs_ak > self.max_a), abs_ak, self.max_a)
+            abs_a[(k+1) % 3] = np.where(act, abs_ak, abs_a[(k+1) % 3])
+            isMax = act & (abs_a[(k+3-1) % 3] < abs_a[k % 3]) \
+                & (abs_a[k % 3] >= abs_a[(k+1) % 3]) # local max is here
+            isNext = isMax & (self.dk_maxLocal >= 0)
+            maxLocal = np.where(self.maxLocal != 0, self.maxLocal, 1)
+            self.q_maxLocal = np.where(isNext, abs_a[k % 3]/maxLocal, self.q_maxLocal)
+            self.maxLocal = np.where(isMax, abs_a[k % 3], self.maxLocal)
+            self.dk_maxLocal = np.where(isMax, 
+                np.where(isNext, k - self.k_maxLocal, 0), self.dk_maxLocal)
+            self.k_maxLocal = np.where(isMax, k, self.k_maxLocal)
+            abs_out = abs(out) * digitPN.epsilonPNdig
+            stop = isMax & ( 
+                ( (self.dk_maxLocal > 0) & (self.q_maxLocal < 1) 
+                    & (self.maxLocal < abs_out) ) 
+                | 
+                ( (k > self.k_maxLocal + max_N // 4) & (abs_ak < abs_out) ) )
+            out = np.where(act, out + ak, out)
+        self.k = np.where(act, k, self.k)
+        self.active = act & ~stop
+        return out
+
+    def finish(self, out, dk_err, dk_last=0):
+        """
+        out, err; err from local max. if k <= k_maxLocal + dk_err, 
+        where k = (k of last step) + dk_last (as loop counter after break)
+        """
+        np = self.np
+        k = self.k + dk_last
+        isQ = (k <= self.k_maxLocal + dk_err) & (self.dk_maxLocal > 0) \
+            & (self.q_maxLocal < 1)
+        with np.errstate(all='ignore'):
+            q = np.where(isQ, self.q_maxLocal, 1)
+            dk = np.where(isQ, self.dk_maxLocal, 1)
+            err = np.where(isQ, 
+                self.maxLocal * q **((k - self.k_maxLocal) / (dk + self.zero)), self.abs_ak)
+            err = err + (self.max_a + out) * digitPN.epsilonPNdig
+        return out, err
+
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
 #################### MantPN functions #################################
@@ -1347,10 +2075,285 @@ def getMantissaExponent_fromStr(s, sep, max_N):
 #################### CONST ############################################
 
 
-_powersOfTwo = [1]
-while _powersOfTwo[-1] < PolyNumConf.max_N:
-    _powersOfTwo += [2 * _powersOfTwo[-1]]
-_powersOfTwo = tuple(_powersOfTwo)  # (1, 2, 4, 8, 16, 32, 64, 128)
+@functools.lru_cache(maxsize=None)
+def _newtonSteps(N, n0=1):
+    """
+    plan of Newton iteration for N digits (cached per N, n0): 
+    ((nw, n2), ...) - n2 = min(2*nw, N) digits from nw correct digits,
+    starting from n0 digits
+
+    >>> _newtonSteps(8), _newtonSteps(5), _newtonSteps(20, 6)
+    (((1, 2), (2, 4), (4, 8)), ((1, 2), (2, 4), (4, 5)), ((6, 12), (12, 20)))
+    """
+    steps = []
+    nw = n0
+    while nw < N:
+        steps.append((nw, min(2*nw, N)))
+        nw = steps[-1][1]
+    return tuple(steps)
+
+_KARATSUBA_LEAF = 16 # direct sum in mantPN_mul_karatsuba() for n <= 16
+#  and in mantPN_mul() if shorter operand has <= 16 digits
+
+#################### digit-wise MantPN ################################
+# mantPN is `list` of digits or (see 'FLOAT-NUMPY' in digitPN) 
+# contiguous numpy.ndarray - then array ops are used instead of loops
+
+def mantPN_isArr(x):
+    """True if mantPN `x` is numpy.ndarray"""
+    return hasattr(x, 'ndim')
+
+def mantPN_isDD(x):
+    """True if mantPN `x` is ddPN.DDArray (see 'DOUBLE-DOUBLE' in digitPN)"""
+    return getattr(x, '_isDDArr', False)
+
+def mantPN_isFrac(x):
+    """True if mantPN `x` is fracPN.FracArray (see 'EXACT-FRACTION' in digitPN)"""
+    return getattr(x, '_isFracArr', False)
+
+def mantPN_isVec(x):
+    """True if digit-wise ops of mantPN `x` are array ops (ndarray, DDArray)"""
+    return hasattr(x, 'ndim') or getattr(x, '_isDDArr', False)
+
+
+def mantPN_copy(x):
+    """
+    >>> x = [1, 2.5]; y = mantPN_copy(x); y[0] = 0; x
+    [1, 2.5]
+    """
+    if mantPN_isArr(x):
+        return x.copy()
+    return x[:]
+
+def mantPN_fill(x, N):
+    """
+    x filled with right zeros (of type x[0]) to N elements 
+
+    >>> mantPN_fill([1, 2.5], 4)
+    [1, 2.5, 0, 0]
+    """
+    if len(x) >= N:
+        return x
+    if mantPN_isArr(x):
+        import numpy as np
+        return np.concatenate((x, np.zeros(N - len(x), dtype=x.dtype)))
+    if mantPN_isDD(x) or mantPN_isFrac(x):
+        y = type(x).zeros(N)
+        y[:len(x)] = x
+        return y
+    zero = 0 * x[0]
+    return list(x) + [zero for __ in range(N - len(x))]
+
+def mantPN_shr(x, r, N):
+    """
+    x shifted right by r digits (left zeros), N digits
+
+    >>> mantPN_shr([1., 2, 3, 4], 2, 4)
+    [0.0, 0.0, 1.0, 2]
+    """
+    if r > N:
+        r = N
+    if mantPN_isArr(x):
+        import numpy as np
+        y = np.zeros(N, dtype=x.dtype)
+        y[r:] = x[:(N - r)]
+        return y
+    if mantPN_isDD(x) or mantPN_isFrac(x):
+        y = type(x).zeros(N)
+        y[r:] = x[:(N - r)]
+        return y
+    zero = 0 * x[0]
+    zeros = [zero for __ in range(r)]
+    return zeros + list(x[:(N - r)])
+
+def mantPN_effLen(x):
+    """
+    index of last non-zero digit + 1, 1 if all digits are zeros
+
+    >>> mantPN_effLen([1., 0, 2, 0, 0]), mantPN_effLen([0., 0])
+    (3, 1)
+    """
+    if mantPN_isVec(x):
+        import numpy as np
+        nz = np.flatnonzero(x.hi if mantPN_isDD(x) else x)
+        return int(nz[-1]) + 1 if len(nz) else 1
+    k = len(x) - 1
+    while k > 0 and not x[k]:
+        k -= 1
+    return k + 1
+
+def mantPN_firstNonzero(x):
+    """
+    index of first non-zero digit, len(x) if all digits are zeros
+
+    >>> mantPN_firstNonzero([0., 0, 3, 4]), mantPN_firstNonzero([0., 0])
+    (2, 2)
+    """
+    if mantPN_isVec(x):
+        import numpy as np
+        nz = np.flatnonzero(x.hi if mantPN_isDD(x) else x)
+        return int(nz[0]) if len(nz) else len(x)
+    first = 0
+    for d in x:
+        if d: #d!= 0
+            break
+        first += 1
+    return first
+
+def mantPN_neg(x):
+    if mantPN_isVec(x) or mantPN_isFrac(x):
+        return -x
+    return [-d for d in x]
+
+def mantPN_abs(x):
+    if mantPN_isVec(x) or mantPN_isFrac(x):
+        return abs(x)
+    return [abs(d) for d in x]
+
+def mantPN_scale(x, a, div=False):
+    """
+    x * a  (or x / a if div), a - scalar
+
+    >>> mantPN_scale([1., 2, 3], 100), mantPN_scale([1., 2, 3], 100, div=True)
+    ([100.0, 200, 300], [0.01, 0.02, 0.03])
+    """
+    if mantPN_isVec(x) or mantPN_isFrac(x):
+        return x / a if div else x * a
+    if div:
+        return [d / a for d in x]
+    return [d * a for d in x]
+
+def mantPN_geomScale(x, r, k0=0):
+    """
+    x[k] * r**(k + k0) - mantissa at other scale (see PolyNum.rescale),
+    zero digits stay zeros (also if r**k overflows)
+
+    >>> mantPN_geomScale([1., 2, 0., 8], 0.5), mantPN_geomScale([1., 2], 2., -1)
+    ([1.0, 1.0, 0.0, 1.0], [0.5, 2.0])
+    """
+    if mantPN_isArr(x):
+        import numpy as np
+        with np.errstate(over='ignore', invalid='ignore'):
+            w = np.power(x.dtype.type(r), np.arange(k0, k0 + len(x)))
+            return np.where(x != 0, x * w, x)
+    w = [_digitPow(r, k) for k in range(k0, k0 + len(x))]
+    if mantPN_isDD(x):
+        y = x * type(x)(w)
+        isZero = x.hi == 0
+        y.hi[isZero], y.lo[isZero] = 0., 0.
+        return y
+    y = [d * wk if d else d for (d, wk) in zip(x, w)]
+    return type(x)(y) if mantPN_isFrac(x) else y
+
+def _digitPow(r, k):
+    """r**k, inf if float overflows"""
+    try:
+        return r **k
+    except OverflowError:
+        return float('inf')
+
+def mantPN_isPTrap(x):
+    """
+    True if x == x[0]/2 * (~2~,-4~4~-4~4~...~) exactly, i.e. (1/h) * 'p_trap'
+
+    >>> mantPN_isPTrap([20., -40, 40, -40]), mantPN_isPTrap([20., -40, 40, 40])
+    (True, False)
+    """
+    if len(x) < 2 or not x[0] or x[1] != -2 * x[0]:
+        return False
+    if mantPN_isArr(x):
+        return bool((x[2:] == -x[1:-1]).all())
+    return all(x[k] == -x[k-1] for k in range(2, len(x)))
+
+def mantPN_iscale(x, a, div=False):
+    """
+    x *= a  (or x /= a if div) in place, a - scalar
+
+    >>> x = [1., 2, 3]; mantPN_iscale(x, 2); x
+    [2.0, 4, 6]
+    """
+    if mantPN_isVec(x) or mantPN_isFrac(x):
+        if div:
+            x /= a
+        else:
+            x *= a
+        return
+    for k in range(len(x)):
+        x[k] = x[k] / a if div else x[k] * a
+
+def mantPN_iadd(x, y, sign=1):
+    """
+    x += y  (or x -= y if sign < 0) in place, len(y) >= len(x)
+
+    >>> x = [1., 2, 3]; mantPN_iadd(x, [1, 1, 1], -1); x
+    [0.0, 1, 2]
+    """
+    if mantPN_isVec(x) or mantPN_isFrac(x) and mantPN_isFrac(y):
+        if sign < 0:
+            x -= y[:len(x)]
+        else:
+            x += y[:len(x)]
+        return
+    for k in range(len(x)):
+        x[k] = x[k] - y[k] if sign < 0 else x[k] + y[k]
+
+def mantPN_rscale(a, x):
+    """a * x, a - scalar"""
+    if mantPN_isVec(x) or mantPN_isFrac(x):
+        return a * x
+    return [a * d for d in x]
+
+def mantPN_add(x, y):
+    """
+    >>> mantPN_add([1., 2, 3], [10, 20, 30])
+    [11.0, 22, 33]
+    """
+    if mantPN_isVec(x) and mantPN_isVec(y) or mantPN_isFrac(x) and mantPN_isFrac(y):
+        return x + y
+    return [a + b for (a,b) in zip(x, y)]
+
+def mantPN_chop(x, tol=digitPN.epsilonPNdig*1024*1024):
+    """Converts digits close to zero to exact zeros"""
+    if mantPN_isArr(x):
+        import numpy as np
+        return np.where(abs(x) > tol, x, 0 * x[0])
+    if mantPN_isDD(x):
+        y = x.copy()
+        small = abs(y.hi) <= float(tol)
+        y.hi[small], y.lo[small] = 0., 0.
+        return y
+    zero = x[0] * 0
+    return [digitPN.chop( d, tol, zero ) for d in x]
+
+def mantPN_der(x):
+    """
+    derivative of mantissa as power series of (~1~0~)**(-1): (k+1)*x[k+1]
+
+    >>> mantPN_der([5., 1., 2., 3.])
+    [1.0, 4.0, 9.0]
+    """
+    if mantPN_isVec(x):
+        import numpy as np
+        k = np.arange(1., len(x))
+        return x[1:] * (type(x)(k) if mantPN_isDD(x) else k)
+    return [d * k for (k, d) in enumerate(x[1:], 1)]
+
+def mantPN_int(x, c0):
+    """
+    integral of mantissa (see mantPN_der()), c0 - digit 0
+
+    >>> mantPN_int([1., 4, 9], 5.)
+    [5.0, 1.0, 2.0, 3.0]
+    """
+    if mantPN_isVec(x):
+        import numpy as np
+        k = np.arange(1., len(x) + 1)
+        if mantPN_isDD(x):
+            y = type(x).zeros(len(x) + 1)
+            y[0], y[1:] = c0, x / type(x)(k)
+            return y
+        return np.concatenate(([c0], x / k))
+    return [c0] + [d / k for (k, d) in enumerate(x, 1)]
 
 #######################################################################
 
@@ -1380,22 +2383,26 @@ def mantPN_val(mant, x):
         y = y * x_1 + p1
     return y
 
-def mantPN_mul(x, h, N):
+def mantPN_mul(x, h, N, k0=0):
     """
     Find the product of two mantPN.
 
     Parameters
     ----------
-    x, h : mantPN objects, both must have N elements!
+    x, h : mantPN objects, N elements (shorter are treated as filled 
+        with zeros)
+    k0 : first digit of result (middle product if k0 > 0)
 
     Returns
     -------
-    out : (x * h)[:N]
+    out : (x * h)[k0:N]
 
     Examples
     --------
     >>> mantPN_mul([1, 2, 3], [9, 5, 1], 3)
     [9, 23, 38]
+    >>> mantPN_mul([1, 2, 3], [9, 5], 3), mantPN_mul([1, 2, 3], [9, 5], 3, 1)
+    ([9, 23, 37], [23, 37])
 
     >>> mantPN_mul([1, 2, 3], [9., 5, 1], 3)
     [9.0, 23.0, 38.0]
@@ -1414,21 +2421,499 @@ def mantPN_mul(x, h, N):
     >>> mantPN_mul([Fraction('1/2'), 10, 2.], [Fraction('1/3'), 100, 0], 3)
     [Fraction(1, 6), Fraction(160, 3), 1000.6666666666666]
 
+    numpy.ndarray (see 'FLOAT-NUMPY' in digitPN)
+    >>> import numpy as np
+    >>> mantPN_mul(np.array([1., 2, 3]), np.array([9., 5, 1]), 3).tolist()
+    [9.0, 23.0, 38.0]
+
+    float digits and N >= PolyNumConf.MUL_FFT_MIN_N - see mantPN_mul_fft(),
+    mpf (Fraction) digits and N >= PolyNumConf.MUL_KRONECKER_MIN_N - see
+    mantPN_mul_kronecker() (mantPN_mul_rational()), other digits and N >= PolyNumConf.MUL_KARATSUBA_MIN_N - see 
+    mantPN_mul_karatsuba(), ddPN.DDArray - vectorized DDArray.conv()
     """
+    if mantPN_isDD(x) or mantPN_isDD(h):
+        if not mantPN_isDD(x):
+            x = type(h)(x)
+        return x.conv(h if mantPN_isDD(h) else type(x)(h), N, k0)
+    if PolyNumConf.MUL_KRONECKER_MIN_N is not None and \
+            N >= PolyNumConf.MUL_KRONECKER_MIN_N and \
+            mantPN_isMpf(x) and mantPN_isMpf(h):
+        y = mantPN_mul_kronecker(x, h, N, k0)
+        if y is not None:
+            return y
+    if (mantPN_isFrac(x) or mantPN_isFrac(h) or \
+            PolyNumConf.MUL_KRONECKER_MIN_N is not None and \
+            N >= PolyNumConf.MUL_KRONECKER_MIN_N) and \
+            mantPN_isFraction(x) and mantPN_isFraction(h):
+        return mantPN_mul_rational(x, h, N, k0)
+    isFFT_N = PolyNumConf.MUL_FFT_MIN_N is not None and \
+                N >= PolyNumConf.MUL_FFT_MIN_N
+    isKaratsuba_N = PolyNumConf.MUL_KARATSUBA_MIN_N is not None and \
+                N >= PolyNumConf.MUL_KARATSUBA_MIN_N and \
+                min(len(x), len(h)) > _KARATSUBA_LEAF
+    if isFFT_N or isKaratsuba_N:
+        if mantPN_isFloat(x) and mantPN_isFloat(h):
+            if isFFT_N:
+                y = mantPN_mul_fft(x, h, N)
+                if y is not None:
+                    return y[k0:]
+        elif isKaratsuba_N:
+            return mantPN_mul_karatsuba(x, h, N)[k0:]
+    if mantPN_isArr(x) and mantPN_isArr(h):
+        import numpy as np
+        return mantPN_fill(np.convolve(x[:N], h[:N])[:N], N)[k0:]
     zero = (x[0]+h[0])*0 # zero of common-type of x and y
-    y = [zero for __ in range(N)]     # y = [zero]*N
-    for k in range(N):
-      for j in range(k+1):
-        y[k] = y[k] + x[k-j]*h[j]
+    y = []
+    nx, nh = min(len(x), N), min(len(h), N)
+    for k in range(k0, N):
+        yk = zero
+        for j in range(max(0, k-nx+1), min(k+1, nh)):
+            yk = yk + x[k-j]*h[j]
+        y.append(yk)
     return y
+
+
+def mantPN_isFloat(x):
+    """
+    True if digits of mantPN `x` are native floats (float ndarray or list 
+    of python float/int), i.e. FFT convolution can be used
+    
+    >>> from fractions import Fraction
+    >>> mantPN_isFloat([1., 2, 3]), mantPN_isFloat([1., Fraction(1,2)])
+    (True, False)
+    """
+    if mantPN_isArr(x):
+        return x.dtype.kind == 'f'
+    for d in x:
+        if type(d) is not float and type(d) is not int:
+            return False
+    return True
+
+def mantPN_mul_fft(x, h, N):
+    """
+    (x * h)[:N] by FFT convolution (numpy.fft.rfft of length 2**k >= 2*N-1)
+    None if numpy is not available.
     
-    #y = np.convolve(x, h, mode='full') #'same' - max(M, N);  'full' - M+N-1
-    #return y[:N]
+    Digits are balanced before FFT: d[k] -> d[k] / lam**k, where lam is 
+    a geometric growth rate of x and h digits, i.e. for (~1~-1.5~)**(-1) 
+    (k-th digit == 1.5**k) FFT rounding errors are relative to each digit,
+    not to the biggest one.
+
+    >>> N = 512
+    >>> x = [1.5**k for k in range(N)] # (~1~-1.5~)**(-1)
+    >>> y = mantPN_mul_fft(x, [1., -1.5] + [0.]*(N-2), N)
+    >>> type(y), max(abs(d) / 1.5**k for (k, d) in enumerate(y[1:])) < 1e-12
+    (<class 'list'>, True)
+    >>> p = [2.] + [-4., 4.]*(N//2-1) + [-4.] # (~2~,-4~4~-4~...~)
+    >>> yFFT = mantPN_mul_fft(x, p, N); yDir = mantPN_mul(x[:64], p[:64], 64)
+    >>> all(digitPN.PNdig_isclose(a, b, 1e-12) for (a, b) in zip(yFFT, yDir))
+    True
+    """
+    try:
+        import numpy as np
+    except ImportError:
+        return None
+    isArr = mantPN_isArr(x) and mantPN_isArr(h)
+    dtype = x.dtype if mantPN_isArr(x) else float
+    x = np.asarray(x[:N], dtype=float)
+    h = np.asarray(h[:N], dtype=float)
+    n = min(len(x) + len(h) - 1, N)
+    L = 1
+    while L < len(x) + len(h) - 1:
+        L *= 2
+    k = np.arange(max(len(x), len(h), n))
+    lnLam = max(_lnGrowth(x), _lnGrowth(h))
+    lnLam = min(max(lnLam, -700. / len(k)), 700. / len(k)) # lam**len(k) in float range
+    if lnLam:
+        with np.errstate(over='ignore', under='ignore', invalid='ignore'):
+            w = np.exp(-lnLam * k)
+            y = np.fft.irfft(np.fft.rfft(x * w[:len(x)], L) * 
+                             np.fft.rfft(h * w[:len(h)], L), L)[:n]
+            y = y * np.exp(lnLam * k[:n])
+    else:
+        y = np.fft.irfft(np.fft.rfft(x, L) * np.fft.rfft(h, L), L)[:n]
+    y = mantPN_fill(y, N)
+    if isArr:
+        return y.astype(dtype, copy=False)
+    return y.tolist()
+
+def _lnGrowth(x):
+    """ln of geometric growth rate of non-zero digits of x (ndarray), LSQ fit"""
+    import numpy as np
+    a = abs(x)
+    k = np.flatnonzero(np.isfinite(a) & (a > 0))
+    if len(k) < 2:
+        return 0.0
+    lnA = np.log(a[k])
+    k = k - k.mean()
+    return float(np.dot(k, lnA - lnA.mean()) / np.dot(k, k))
+
+def mantPN_mul_karatsuba(x, h, N):
+    """
+    (x * h)[:N] by truncated (low half) Karatsuba multiplication, 
+    O(N**1.58) digit operations `+`, `-`, `*` - for any ring-like digits 
+    (mpf, Fraction, Decimal, int), exact for exact digits. Direct sum for 
+    blocks of _KARATSUBA_LEAF digits.
 
+    >>> from fractions import Fraction
+    >>> x = [Fraction(1, k+1) for k in range(200)]
+    >>> h = [Fraction(k, 3) for k in range(200)]
+    >>> y = mantPN_mul_karatsuba(x, h, 200)
+    >>> y == [sum(x[k-j]*h[j] for j in range(k+1)) for k in range(200)]
+    True
+    >>> y50 = [sum(x[k-j]*h[j] for j in range(min(k+1, 50))) for k in range(200)]
+    >>> mantPN_mul_karatsuba(x, h[:50], 200) == y50
+    True
+    """
+    zero = (x[0]+h[0])*0 # zero of common-type of x and y
+    if len(x) < len(h):
+        x, h = h, x
+    x = mantPN_fill(list(x[:N]), N)
+    h = list(h[:N])
+    nh = len(h)
+    if 2 * nh > N:
+        return _karatsubaLow(x, mantPN_fill(h, N), N, zero, _KARATSUBA_LEAF)
+    # short h: sum of full products of nh-digit blocks of x and h
+    y = [zero for __ in range(N)]
+    for b in range(0, N, nh):
+        xb = mantPN_fill(x[b:b+nh], nh)
+        yb = _karatsubaFull(xb, h, zero, _KARATSUBA_LEAF)
+        for k in range(min(len(yb), N - b)):
+            y[b+k] = y[b+k] + yb[k]
+    return y
+
+def _karatsubaLow(x, h, n, zero, leaf):
+    """
+    (x * h)[:n] : (x0 + x1 z**m)(h0 + h1 z**m) = 
+        x0 h0 + z**m (x0 h1 + x1 h0)[:n-m] , m = ceil(n/2)
+    """
+    if n <= leaf:
+        y = [zero for __ in range(n)]
+        for k in range(n):
+            for j in range(k+1):
+                y[k] = y[k] + x[k-j]*h[j]
+        return y
+    m = (n + 1) // 2
+    y = _karatsubaFull(x[:m], h[:m], zero, leaf)[:n] + [zero] # 2m-1 >= n-1
+    c1 = _karatsubaLow(x[:n-m], h[m:n], n-m, zero, leaf)
+    c2 = _karatsubaLow(x[m:n], h[:n-m], n-m, zero, leaf)
+    for k in range(n-m):
+        y[m+k] = y[m+k] + (c1[k] + c2[k])
+    return y[:n]
+
+def _karatsubaFull(x, h, zero, leaf):
+    """
+    full product x * h, len(x) == len(h) == n -> 2*n-1 digits
+    """
+    n = len(x)
+    if n <= leaf:
+        y = [zero for __ in range(2*n-1)]
+        for i in range(n):
+            xi = x[i]
+            for j in range(n):
+                y[i+j] = y[i+j] + xi*h[j]
+        return y
+    m = n // 2
+    x0, x1, h0, h1 = x[:m], x[m:], h[:m], h[m:] # len(x1) == n-m >= m
+    z0 = _karatsubaFull(x0, h0, zero, leaf)
+    z2 = _karatsubaFull(x1, h1, zero, leaf)
+    xs = x1[:]
+    hs = h1[:]
+    for k in range(m):
+        xs[k] = xs[k] + x0[k]
+        hs[k] = hs[k] + h0[k]
+    z1 = _karatsubaFull(xs, hs, zero, leaf)
+    y = z0 + [zero] + z2 # 2m-1 + 1 + 2(n-m)-1 == 2n-1
+    for k in range(len(z1)):
+        d = z1[k] - z2[k]
+        if k < len(z0):
+            d = d - z0[k]
+        y[m+k] = y[m+k] + d
+    return y
+
+def mantPN_isMpf(x):
+    """
+    True if all digits of mantPN `x` are mpmath.mpf (mpmath is not imported)
+
+    >>> from mpmath import mpf
+    >>> mantPN_isMpf([mpf(1), mpf('0.5')]), mantPN_isMpf([mpf(1), 0.5])
+    (True, False)
+    """
+    mpmath = sys.modules.get('mpmath')
+    if mpmath is None or mantPN_isArr(x) or not len(x):
+        return False
+    mpf = mpmath.mpf
+    for d in x:
+        if type(d) is not mpf:
+            return False
+    return True
+
+def mantPN_toFixed(x, prec, g=0):
+    """
+    Fixed-point form of mpf digits x (python ints with shared binary 
+    exponent F):
+        x[k] == X[k] * 2**(g*k - F) (rounded to nearest)
+    where g - int growth rate of digits (bits per digit, see 
+    _fixedGrowth()) and F is chosen so that the least non-zero balanced 
+    digit x[k] * 2**(-g*k) has `prec` significant bits.
+
+    Returns
+    -------
+    (X, F) or None (x has inf or nan digits)
+
+    >>> from mpmath import mpf
+    >>> mantPN_toFixed([mpf(1), mpf(-3), mpf('0.25'), mpf(0)], 4)
+    ([32, -96, 8, 0], 5)
+    >>> mantPN_toFixed([mpf(1), mpf(-3), mpf('0.25'), mpf(0)], 4, -2)
+    ([8, -96, 32, 0], 3)
+    """
+    digits = []
+    minBal = None
+    for k, d in enumerate(x):
+        sign, man, exp, bc = d._mpf_
+        if not man:
+            if exp: # inf, nan
+                return None
+            digits.append(None)
+            continue
+        exp -= g * k # balanced digit: man * 2**exp
+        if minBal is None or exp + bc < minBal:
+            minBal = exp + bc
+        digits.append((sign, man, exp))
+    if minBal is None: # zeros
+        return [0] * len(x), 0
+    F = prec - minBal
+    X = []
+    for dig in digits:
+        if dig is None:
+            X.append(0)
+            continue
+        sign, man, exp = dig
+        s = exp + F
+        if s >= 0:
+            man = int(man) << s
+        else:
+            man = (int(man) + (1 << (-s-1))) >> -s
+        X.append(-man if sign else man)
+    return X, F
+
+def _fixedGrowth(x):
+    """int growth rate (in bits per digit) of non-zero mpf digits x, LSQ fit"""
+    ks, mags = [], []
+    for k, d in enumerate(x):
+        sign, man, exp, bc = d._mpf_
+        if man:
+            ks.append(k)
+            mags.append(exp + bc)
+    n = len(ks)
+    if n < 2:
+        return 0
+    kMean, magMean = sum(ks) / n, sum(mags) / n
+    kk = sum((k - kMean)**2 for k in ks)
+    return int(round(sum((k - kMean) * (m - magMean) for (k, m) in zip(ks, mags)) / kk))
+
+def _kroneckerBias(n, nb):
+    """sum of 2**(8*nb-1) * 2**(8*nb*k), k < n - for signed fields of nb bytes"""
+    return int.from_bytes((b'\0' * (nb-1) + b'\x80') * n, 'little')
+
+def _kroneckerPack(X, nb):
+    """sum(X[k] * 2**(8*nb*k)) of signed ints X[k], |X[k]| < 2**(8*nb-1)"""
+    bias = 1 << (8*nb - 1)
+    return int.from_bytes(b''.join([(d + bias).to_bytes(nb, 'little') for d in X]), 
+                          'little') - _kroneckerBias(len(X), nb)
+
+def _kroneckerUnpack(Y, n, nb, k0=0):
+    """signed fields Y[k0:n] of nb bytes (higher ones are dropped), see _kroneckerPack()"""
+    bias = 1 << (8*nb - 1)
+    b = ((Y + _kroneckerBias(n, nb)) & ((1 << (8*nb*n)) - 1)).to_bytes(n*nb, 'little')
+    return [int.from_bytes(b[k*nb:(k+1)*nb], 'little') - bias for k in range(k0, n)]
+
+def mantPN_mul_kronecker(x, h, N, k0=0):
+    """
+    (x * h)[k0:N] of mpf digits by big int multiplication: x and h are 
+    converted to fixed-point ints (mantPN_toFixed(), common growth rate 
+    of digits), packed into one int each (Kronecker substitution: 
+    X(2**B)), multiplied by CPython (Karatsuba) and unpacked. 
+    Digits of at most mp.prec + 8 bits (i.e. all mpf of current mp.prec)
+    are converted exactly, products and sums of ints are exact, so each
+    result digit is the exact truncated convolution rounded once to 
+    mp.prec bits (mp.rounding). The direct mpf sum rounds every term, so
+    both may differ in low bits - at cancellation relatively much. 
+    None if x or h have inf or nan.
+
+    >>> from mpmath import mp, mpf
+    >>> N = 40
+    >>> x = [mpf(3)/2**k for k in range(N)] # (~1~-0.5~)**(-1) * 3
+    >>> h = [mpf(k+1)/7 * (-1)**k for k in range(N)]
+    >>> y = mantPN_mul_kronecker(x, h, N)
+    >>> yDir = [mp.fsum(x[k-j]*h[j] for j in range(k+1)) for k in range(N)]
+    >>> all(digitPN.PNdig_isclose(a, b, mpf(2)**(10-mp.prec), 0) for (a, b) in zip(y, yDir))
+    True
+    >>> mantPN_mul_kronecker(x, h, N, N-2) == y[N-2:]
+    True
+    >>> from fractions import Fraction
+    >>> from mpmath.libmp import from_rational, to_rational
+    >>> q = lambda d: Fraction(*to_rational(d._mpf_)) # exact value of mpf
+    >>> exact = [sum(q(x[k-j]) * q(h[j]) for j in range(k+1)) for k in range(N)]
+    >>> all(d._mpf_ == from_rational(e.numerator, e.denominator, mp.prec, mp.rounding)
+    ...     for (d, e) in zip(y, exact)) # correctly rounded
+    True
+    """
+    mp = sys.modules['mpmath'].mp
+    prec = mp.prec
+    nx, nh = min(len(x), N), min(len(h), N)
+    x, h = x[:nx], h[:nh]
+    g = max(_fixedGrowth(x), _fixedGrowth(h), key=abs)
+    xF = mantPN_toFixed(x, prec + 8, g)
+    hF = mantPN_toFixed(h, prec + 8, g)
+    if xF is None or hF is None:
+        return None
+    (X, Fx), (H, Fh) = xF, hF
+    bitsX = max(abs(d) for d in X).bit_length()
+    bitsH = max(abs(d) for d in H).bit_length()
+    nb = (bitsX + bitsH + min(nx, nh).bit_length() + 1) // 8 + 1 # |Y[k]| < 2**(8*nb-1)
+    n = min(nx + nh - 1, N)
+    Y = _kroneckerUnpack(_kroneckerPack(X, nb) * _kroneckerPack(H, nb), n, nb, k0)
+    makeMpf, fromManExp = mp.make_mpf, sys.modules['mpmath'].libmp.from_man_exp
+    F, rnd = Fx + Fh, mp.rounding
+    y = [makeMpf(fromManExp(Yk, g*k - F, prec, rnd)) for (k, Yk) in enumerate(Y, k0)]
+    zero = mp.mpf(0)
+    y.extend(zero for __ in range(max(N - max(n, k0), 0)))
+    return y
+
+def mantPN_isFraction(x):
+    """
+    True if digits of mantPN `x` are fractions.Fraction (or int), at least 
+    one Fraction
+
+    >>> from fractions import Fraction
+    >>> mantPN_isFraction([Fraction(1, 2), 10]), mantPN_isFraction([1, 10])
+    (True, False)
+    """
+    if mantPN_isFrac(x):
+        return True
+    if mantPN_isArr(x):
+        return False
+    isFr = False
+    for d in x:
+        if type(d) is Fraction:
+            isFr = True
+        elif type(d) is not int:
+            return False
+    return isFr
+
+def mantPN_toCommonDen(x):
+    """
+    Exact rational digits x as int numerators over one shared denominator:
+        x[k] == X[k] / D
+
+    >>> from fractions import Fraction
+    >>> mantPN_toCommonDen([Fraction(1, 2), 10, Fraction(-2, 3)])
+    ([3, 60, -4], 6)
+    """
+    if mantPN_isFrac(x): # stored so
+        return x.num, x.den
+    D = 1
+    for d in x:
+        den = d.denominator
+        if D % den:
+            D = D // gcd(D, den) * den
+    return [d.numerator * (D // d.denominator) for d in x], D
+
+def mantPN_mul_rational(x, h, N, k0=0):
+    """
+    (x * h)[k0:N] of exact rational digits (Fraction, int): numerators 
+    over common denominators (mantPN_toCommonDen()) are multiplied as one
+    big int product (Kronecker substitution, see mantPN_mul_kronecker()),
+    each digit of result is normalized (gcd) once - not per digit product.
+    fracPN.FracArray operands are stored so, result - FracArray (its 
+    denominator is normalized once).
+
+    >>> from fractions import Fraction
+    >>> x = [Fraction(1, k+1) for k in range(40)]
+    >>> h = [Fraction(-k, 3)**2 + 1 for k in range(40)]
+    >>> y = mantPN_mul_rational(x, h, 40)
+    >>> y == [sum(x[k-j]*h[j] for j in range(k+1)) for k in range(40)]
+    True
+    >>> mantPN_mul_rational(x, h[:5], 40, 38) == [sum(x[k-j]*h[j] for j in range(5)) for k in (38, 39)]
+    True
+
+    exact reference PN ('EXACT-FRACTION' digits) of a float run:
+    >>> with digitPN.useBackend('EXACT-FRACTION'):
+    ...     p = PolyNum('const:(~2~,-4~4~-4~4~...~)') / digitPN.flt('0.1')
+    ...     Y = 1 / (p*p + p + 4)
+    >>> list(Y[0:3]), type(Y._mantissa).__name__
+    ([Fraction(1, 424), Fraction(205, 22472), Fraction(2570, 148877)], 'FracArray')
+    >>> p = PolyNum('const:(~2~,-4~4~-4~4~...~)') / digitPN.flt('0.1')
+    >>> bool(max(abs(float(a) - float(b)) / abs(float(a)) for (a, b) in zip(Y, 1 / (p*p + p + 4))) < 1e-9)
+    True
+    """
+    nx, nh = min(len(x), N), min(len(h), N)
+    X, Dx = mantPN_toCommonDen(x[:nx])
+    H, Dh = mantPN_toCommonDen(h[:nh])
+    bitsX = max(abs(d) for d in X).bit_length()
+    bitsH = max(abs(d) for d in H).bit_length()
+    nb = (bitsX + bitsH + min(nx, nh).bit_length() + 1) // 8 + 1 # |Y[k]| < 2**(8*nb-1)
+    n = min(nx + nh - 1, N)
+    Y = _kroneckerUnpack(_kroneckerPack(X, nb) * _kroneckerPack(H, nb), n, nb, k0)
+    D = Dx * Dh
+    Y.extend(0 for __ in range(max(N - max(n, k0), 0)))
+    if mantPN_isFrac(x) or mantPN_isFrac(h): # normalized once
+        return type(x if mantPN_isFrac(x) else h).fromNumDen(Y, D)
+    return [Fraction(Yk, D) for Yk in Y]
+
+def mantPN_div(x, d, N):
+    """
+    (x / d)[:N]: recurrence mantPN_div_short() for short d
+    (len(d) <= PolyNumConf.DIV_RECURRENCE_MAX_N), otherwise x * mantPN_inv(d)
+
+    >>> mantPN_div([1., 2, 3], [1., 1], 5), mantPN_div([1., 2, 3], [1., 1, 0, 0, 0], 5)
+    ([1.0, 1.0, 2.0, -2.0, 2.0], [1.0, 1.0, 2.0, -2.0, 2.0])
+    """
+    nd = min(len(d), N)
+    if PolyNumConf.DIV_RECURRENCE_MAX_N is not None and \
+            nd <= PolyNumConf.DIV_RECURRENCE_MAX_N:
+        return mantPN_div_short(x, d, N)
+    return mantPN_mul(x, mantPN_inv(d, N), N)
+
+def mantPN_div_short(x, d, N):
+    """
+    (x / d)[:N] by linear recurrence, O(N * len(d)):
+        y[k] = (x[k] - sum(d[j] * y[k-j] for j in 1..len(d)-1)) / d[0]
+
+    >>> mantPN_div_short([1, 0, 0, 0], [1, -1], 4)
+    [1.0, 1.0, 1.0, 1.0]
+    >>> import numpy as np
+    >>> mantPN_div_short(np.array([1., 2, 3]), np.array([2., 1]), 4).tolist()
+    [0.5, 0.75, 1.125, -0.5625]
+    """
+    nx, nd = min(len(x), N), min(len(d), N)
+    d0 = d[0]
+    if mantPN_isArr(x) and mantPN_isArr(d):
+        import numpy as np
+        y = np.zeros(N, dtype=np.result_type(x, d))
+        y[:nx] = x[:nx]
+        y[0] /= d0
+        for k in range(1, N):
+            m = min(k+1, nd) # d[1:m] * y[k-1], ... y[k-m+1]
+            y[k] = (y[k] - np.dot(d[1:m], y[k-m+1:k][::-1])) / d0
+        return y
+    zero = (x[0]+d0)*0 # zero of common-type of x and d
+    y = []
+    for k in range(N):
+        yk = x[k] + zero if k < nx else zero
+        for j in range(1, min(k+1, nd)):
+            yk = yk - d[j]*y[k-j]
+        y.append(yk / d0)
+    return y
 
 def mantPN_inv(x, N):
     """
     Find an inversion of mantPN.
+    Newton iteration, number of correct digits n is doubled in each step:
+        y[n:2n] = -(y[:n] * (x * y[:n])[n:2n])[:n]
+    i.e. two truncated products of mantPN_mul() (FFT, Karatsuba, ...),
+    the first one - only digits [n:2n] (mantPN_mul(..., k0=n))
 
     Parameters
     ----------
@@ -1447,65 +2932,116 @@ def mantPN_inv(x, N):
     [2.0, -28.0, 392.0, -5488.0, 76832.0, -1075648.0]
     >>> print(mantPN_mul(x, y, 8))
     [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-    
+    >>> import numpy as np
+    >>> print(mantPN_inv(np.array(x), 8)[:6].tolist())
+    [2.0, -28.0, 392.0, -5488.0, 76832.0, -1075648.0]
+    >>> print(mantPN_inv([1, 1, 0], 3), mantPN_inv([1., 1, 0, 0, 0], 5))
+    [1.0, -1.0, 1.0] [1.0, -1.0, 1.0, -1.0, 1.0]
     """
-    zero = x[0] * 0
-    LoN = 0
-    while _powersOfTwo[LoN] < N:
-        LoN += 1 # 2**LoN >= N
-    #print(f'''N={N}, 2**   {_powersOfTwo[LoN]} -- {_powersOfTwo}''')
-    v = [zero for __ in range(_powersOfTwo[LoN])]   # v = [zero] * _powersOfTwo[LoN]
-    y = v[:]
-    if len(x) < len(v): # case if N != _powersOfTwo[LoN]
-        x = (x + v)[:len(v)]
+    if PolyNumConf.DIV_RECURRENCE_MAX_N is not None and \
+            mantPN_effLen(x[:N]) <= PolyNumConf.DIV_RECURRENCE_MAX_N:
+        x = x[:mantPN_effLen(x[:N])]
+        return mantPN_div_short(mantPN_scale(x[:1], 0) + 1 if mantPN_isArr(x)
+                                else [x[0]*0 + 1], x, N)
+    x = mantPN_fill(x[:N], N)
+    if PolyNumConf.MIXED_REFINE_STEPS and _mixedType(x) is not None:
+        y = mantPN_inv_mixed(x, N, PolyNumConf.MIXED_REFINE_STEPS)
+        if y is not None:
+            return y
+    y = mantPN_scale(x, 0) # zeros of type x[0]
     y[0] = 1 / x[0] #x[0]**(-1), despite of x[0] type
-    for w in range(LoN):
-        nw = _powersOfTwo[w]
-        for k in range(nw):
-            v[k] = zero # unnecessary?
-            for j in range(nw):
-                v[k] = v[k] + y[j] * x[k+nw-j]
-        for k in range(nw):
-            y[k+nw] = zero # unnecessary?
-            for j in range(k+1):
-                y[k+nw] = y[k+nw] - y[k-j] * v[j]
-                #? if abs(y[k+nw]) >= sqrt(MaxFloat): y[k+nw] = sqrt(MaxFloat) ?
-    return y[:N]
+    for nw, n2 in _newtonSteps(N):
+        v = mantPN_mul(x[:n2], y[:nw], n2, nw) # (1 - x*y)[nw:n2] == -v
+        y[nw:n2] = mantPN_neg(mantPN_mul(y[:nw], v, n2-nw))
+        #? if abs(y[k+nw]) >= sqrt(MaxFloat): y[k+nw] = sqrt(MaxFloat) ?
+    return y
+
+def mantPN_invsqrt(x, N):
+    """
+    1 / sqrt(x)[:N]
+    =====
+    Newton iteration z += z*(1 - x*z*z)/2, number of correct digits n 
+    is doubled in each step and only the new digits are computed:
+        z[n:2n] = -(z[:n] * (x * z[:n]**2)[n:2n])[:n] / 2
+    (digits [:n] of the previous step are kept, no inversion).
+
+    Examples
+    --------
+    >>> x = [4., 4, 1, 0, 0, 0]
+    >>> print(', '.join([digitPN.strF(d) for d in mantPN_invsqrt(x, 6)]))
+    0.5, -0.25, 0.125, -0.0625, 0.03125, -0.015625
+    >>> x = [digitPN.flt(d) for d in [1, 2] + [0]*30]
+    >>> z = mantPN_invsqrt(x, 32)
+    >>> print(', '.join([digitPN.strF(d) for d in mantPN_chop(mantPN_mul(mantPN_mul(z, z, 32), x, 32))[:5]]))
+    1.0, 0.0, 0.0, 0.0, 0.0
+    >>> mantPN_invsqrt([-1, 1], 2)
+    Traceback (most recent call last):
+    ...
+    ValueError: {1/sqrt(x)} 1st digit of x is not positive: -1
+    """
+    if x[0] <= 0:
+        raise ValueError("{{1/sqrt(x)}} 1st digit of x is not positive: {}".format(x[0]))
+    x = mantPN_fill(x[:N], N)
+    z = mantPN_scale(x, 0) # zeros of type x[0]
+    z[0] = 1 / digitPN.sqrt(x[0])
+    for nw, n2 in _newtonSteps(N):
+        z2 = mantPN_mul(z[:nw], z[:nw], n2)
+        e = mantPN_mul(x[:n2], z2, n2, nw) # (1 - x*z*z)[nw:n2] == -e
+        z[nw:n2] = mantPN_scale(mantPN_mul(z[:n2-nw], e, n2-nw), -2, div=True)
+    return z
 
 def mantPN_sqrt(x, N):
     """
     sqrt(x)[:N]
     =====
+    Coupled iteration: z = 1/sqrt(x) by mantPN_invsqrt(), y = x*z and
+    one correction (Karp-Markstein) by residual of all N digits
+        y += z * (x - y*y) / 2
+    i.e. without inversion of y in each Newton step. The correction of
+    digits [:N//2] too (not only new ones) keeps round-off of the 
+    inverse-based Newton sqrt (or less).
     
     Examples
     --------
-    >>> xx = [0.1,2.,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0, 0,0,0,0]
-    >>> y0 = mantPN_sqrt(xx, 32)
+    >>> xx = [digitPN.flt('0.1'), digitPN.flt(2)] + [digitPN.flt(0)]*34
+    >>> with digitPN.digitContext(): # DECIMAL_PREC of 'DECIMAL' digits
+    ...     y0 = mantPN_sqrt(xx, 32); yy = mantPN_mul(y0, y0, 32)
     >>> print(', '.join([digitPN.strF(y) for y in y0[:7]])) #     0.316227766, 3.16227766, -15.8113883, 158.113883, -1976.42354, 27669.9295, -415048.943, 6522197.67
     0.316227766, 3.16227766, -15.8113883, 158.113883, -1976.42354, 27669.9295, -415048.943
-    >>> print(', '.join([digitPN.strF(y) for y in mantPN_mul(y0, y0, 32)[:5]])) # 0.1, 2.0, -9.40395481e-38, -1.88079096e-36, -1.50463277e-35, -5.77778983e-34, -1.00148357e-32, 3.08148791e-32
+    >>> print(', '.join([digitPN.strF(y) for y in yy[:5]])) # 0.1, 2.0, -9.40395481e-38, -1.88079096e-36, -1.50463277e-35, -5.77778983e-34, -1.00148357e-32, 3.08148791e-32
     0.1, 2.0, 0.0, 0.0, 0.0
+    >>> print(', '.join([digitPN.strF(d) for d in mantPN_chop(mantPN_sqrt([4., 4, 1, 0, 0], 5))]))
+    2.0, 1.0, 0.0, 0.0, 0.0
+
+    accuracy: sqrt(p**2 + 1), p = p_trap/0.1 - residual near round-off of digits
+    >>> p = PolyNum('const:(~2~,-4~4~-4~4~...~)') / digitPN.flt('0.1')
+    >>> x = (p*p + 1)._mantissa
+    >>> with digitPN.digitContext():
+    ...     y = mantPN_sqrt(x, 64); r = mantPN_mul(y, y, 64); mantPN_iadd(r, x, -1)
+    >>> bool(max(abs(float(d)) for d in r) < 100 * float(digitPN.epsilonPNdig) * max(abs(float(d)) for d in x))
+    True
+    >>> mantPN_sqrt([0, 1], 2)
+    Traceback (most recent call last):
+    ...
+    ValueError: {sqrt(x)} 1st digit of x is not positive: 0
     """
     if x[0] <= 0:
-        raise ValueError("{sqrt(x)} 1st digit of x is not positive: {}".format(x[0]))
-    zero = x[0] * 0
-    LoN = 1
-    while _powersOfTwo[LoN] < N:
-        LoN += 1 # 2**LoN >= N
-    y = [zero for __ in range(_powersOfTwo[LoN])]   # [zero] * _powersOfTwo[LoN]
-    odwr = y[:]
-    outp = y[:]
-    if len(x) < len(y): # case if N != _powersOfTwo[LoN]
-        x = (x + y)[:len(y)]
-    outp[0] = digitPN.sqrt(x[0])
-    for w in range(1, LoN+1):
-        odwr = mantPN_inv(outp, _powersOfTwo[w])
-        y = mantPN_mul(odwr, x, _powersOfTwo[w]) #mantPN_div(outp,x,_powersOfTwo[w])
-        for j in range(_powersOfTwo[w-1]):
-            outp[j] = (outp[j] + y[j]) / 2 # 1/2 despite of () type 
-        for j in range(_powersOfTwo[w-1], _powersOfTwo[w]):
-            outp[j] = y[j] / 2
-    return outp[:N]
+        raise ValueError("{{sqrt(x)}} 1st digit of x is not positive: {}".format(x[0]))
+    x = mantPN_fill(x[:N], N)
+    if PolyNumConf.MIXED_REFINE_STEPS and _mixedType(x) is not None:
+        y = mantPN_sqrt_mixed(x, N, PolyNumConf.MIXED_REFINE_STEPS)
+        if y is not None:
+            return y
+    if N == 1:
+        y = mantPN_scale(x, 0)
+        y[0] = digitPN.sqrt(x[0])
+        return y
+    z = mantPN_invsqrt(x, N)
+    y = mantPN_mul(x, z, N)
+    r = mantPN_mul(y, y, N)
+    mantPN_iadd(r, x, -1) # y*y - x, digits ~ round-off
+    mantPN_iadd(y, mantPN_scale(mantPN_mul(z, r, N), -2, div=True))
+    return y
     
 def mantPN_power_real(x, a, N):
     """
@@ -1526,7 +3062,7 @@ def mantPN_power_real(x, a, N):
     >>> print('-- 1 ----------')
     -- 1 ----------
     >>> print(mantPN_mul(y0, xx, 32)[:25])
-    [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, -140737488355328.0, 2251799813685248.0]
+    [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2251799813685248.0]
     >>> print(mantPN_mul(y1, xx, 32)[:32])
     [1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 2251799813685248.0, 0.0, 0.0, 1.8446744073709552e+19, 0.0, 0.0, 0.0, 0.0]
     
@@ -1538,6 +3074,17 @@ def mantPN_power_real(x, a, N):
 
     """
     zero = x[0] * 0
+    a = _digitOf(a, zero)
+    if mantPN_isArr(x):
+        import numpy as np
+        x = mantPN_fill(x[:N], N)
+        outp = np.zeros(N, dtype=x.dtype)
+        outp[0] = x[0] **a
+        a += 1
+        j = np.arange(1, N, dtype=x.dtype)
+        for k in range(1, N):
+            outp[k] = np.dot(x[1:k+1] * (a*j[:k]/k - 1), outp[k-1::-1]) / x[0]
+        return outp
     outp = [zero for __ in range(N)]     # y = [zero]*N
     outp[0] = x[0] **a
     a += 1
@@ -1553,16 +3100,33 @@ def mantPN_exp(x, N):
     ======
     >>> xx = [0]*32
     >>> xx[0:2] = [digitPN.flt('0.1'),digitPN.flt('2.')]
-    >>> y0 = mantPN_exp(xx, 32)
+    >>> with digitPN.digitContext(): # DECIMAL_PREC of 'DECIMAL' digits
+    ...     y0 = mantPN_exp(xx, 32); x0 = mantPN_ln(y0, 32)
     >>> print(', '.join([digitPN.strF(y) for y in y0[:4]]))
     1.10517092, 2.21034184, 2.21034184, 1.47356122
-    >>> print(', '.join([digitPN.strF(y) for y in mantPN_ln(y0,32)[:4]]))
+    >>> print(', '.join([digitPN.strF(y) for y in x0[:4]]))
     0.1, 2.0, 0.0, 0.0
+
+    N >= PolyNumConf.EXP_NEWTON_MIN_N (EXP_NEWTON_FLOAT_MIN_N for float
+    digits) - see mantPN_exp_newton()
     """
+    if PolyNumConf.MIXED_REFINE_STEPS and _mixedType(x) is not None:
+        y = mantPN_exp_mixed(x, N, PolyNumConf.MIXED_REFINE_STEPS)
+        if y is not None:
+            return y
+    minN = _expNewtonMinN(x)
+    if minN is not None and N >= minN:
+        return mantPN_exp_newton(x, N, (minN + 1) // 2)
     zero = x[0]*0 
     exp_x0 = digitPN.exp(x[0])
-    outp = [exp_x0 * x1 for x1 in x]
+    outp = mantPN_rscale(exp_x0, x)
     outp[0] = exp_x0
+    if mantPN_isArr(outp):
+        import numpy as np
+        j = np.arange(1, N, dtype=outp.dtype)
+        for k in range(2, N):
+            outp[k] += np.dot(x[k-1:0:-1] * (1 - j[:k-1]/k), outp[1:k])
+        return outp
     for k in range(1, N):
         #outp[k] = exp_x0 * x[k]
         for j in range(1, k):
@@ -1573,17 +3137,262 @@ def mantPN_ln(x, N):
     """
     ln(x)
     =====
+    N >= PolyNumConf.EXP_NEWTON_MIN_N (EXP_NEWTON_FLOAT_MIN_N for float
+    digits) - see mantPN_ln_newton()
     """
+    if PolyNumConf.MIXED_REFINE_STEPS and _mixedType(x) is not None:
+        y = mantPN_ln_mixed(x, N, PolyNumConf.MIXED_REFINE_STEPS)
+        if y is not None:
+            return y
+    minN = _expNewtonMinN(x)
+    if minN is not None and N >= minN:
+        return mantPN_ln_newton(x, N)
     zero = x[0]*0 
     ln_x0 = digitPN.log(x[0])
-    outp = x[:]
+    outp = mantPN_copy(x)
     outp[0] = ln_x0
+    if mantPN_isArr(outp):
+        import numpy as np
+        j = np.arange(1, N, dtype=outp.dtype)
+        for k in range(1, N):
+            outp[k] -= np.dot(x[1:k] * (1 - j[:k-1]/k), outp[k-1:0:-1])
+            outp[k] = outp[k] / x[0]
+        return outp
     for k in range(1, N):
         #outp[k] = x[k]
         for j in range(1, k):
             outp[k] -= x[j] * outp[k-j] * (1 - (zero + j)/k)
         outp[k] = outp[k] / x[0]
     return outp
+
+def _expNewtonMinN(x):
+    """crossover N of Newton exp/ln for digits of x (None - not used)"""
+    if mantPN_isFraction(x[:1]): # exact digits - recurrence
+        return None
+    if mantPN_isFloat(x[:1]):
+        return PolyNumConf.EXP_NEWTON_FLOAT_MIN_N
+    return PolyNumConf.EXP_NEWTON_MIN_N
+
+def mantPN_ln_newton(x, N):
+    """
+    ln(x)[:N] = ln(x[0]) + integral(x' / x) - O(M(N)) by mantPN_inv() 
+    and mantPN_mul() (FFT, Kronecker, ...) instead of O(N**2) recurrence
+
+    >>> x = [2. + k / 3 for k in range(64)]
+    >>> y, y0 = mantPN_ln_newton(x, 64), mantPN_ln(x[:32], 32)
+    >>> bool(max(abs(a - b) for (a, b) in zip(y, y0)) < 1e-13)
+    True
+    """
+    x = mantPN_fill(x[:N], N)
+    if N == 1:
+        return mantPN_int(x[:0], digitPN.log(x[0]))
+    dx = mantPN_der(x)
+    return mantPN_int(mantPN_mul(dx, mantPN_inv(x[:N-1], N-1), N-1), digitPN.log(x[0]))
+
+def mantPN_exp_newton(x, N, n0=1):
+    """
+    exp(x)[:N] - Newton iteration y += y * (x - ln(y)), number of correct
+    digits doubled in each step (ln by mantPN_ln() - also Newton for 
+    large N), O(M(N)); first n0 digits by recurrence of mantPN_exp()
+
+    >>> x = [1. / (k + 1) * (-1)**k for k in range(64)]
+    >>> y, y0 = mantPN_exp_newton(x, 64, 8), mantPN_exp(x[:32], 32)
+    >>> bool(max(abs(a - b) for (a, b) in zip(y, y0)) < 1e-14)
+    True
+
+    unstable for decaying digits of exp(x) - Newton ln() divides by them,
+    i.e. delay exp(-0.3*sqrt(p**2+1)), p = p_trap/0.1: recurrence (default,
+    PolyNumConf.EXP_NEWTON_MIN_N = None) vs Newton of N >= 32
+    >>> p = PolyNum('const:(~2~,-4~4~-4~4~...~)') / digitPN.flt('0.1')
+    >>> x = ((p*p + 1).sqrt() * digitPN.flt('-0.3'))._mantissa
+    >>> E = (-digitPN.flt('0.3') * (p*p + 1).sqrt()).exp() # recurrence
+    >>> bool(abs(float(E[63]) + 0.0159191717) < 1e-8)
+    True
+    >>> minN = PolyNumConf.EXP_NEWTON_MIN_N, PolyNumConf.EXP_NEWTON_FLOAT_MIN_N
+    >>> PolyNumConf.EXP_NEWTON_MIN_N = PolyNumConf.EXP_NEWTON_FLOAT_MIN_N = 32
+    >>> with digitPN.digitContext():
+    ...     E1 = mantPN_exp_newton(x, 64, 16)
+    >>> PolyNumConf.EXP_NEWTON_MIN_N, PolyNumConf.EXP_NEWTON_FLOAT_MIN_N = minN
+    >>> bool(max(abs(float(a) - float(b)) for (a, b) in zip(E, E1)) > 1e-10)
+    True
+    """
+    x = mantPN_fill(x[:N], N)
+    n0 = min(n0, N)
+    y = mantPN_fill(mantPN_exp(x[:n0], n0), N)
+    for nw, n2 in _newtonSteps(N, n0):
+        e = mantPN_copy(x[nw:n2]) # (x - ln(y[:nw]))[nw:n2], [:nw] ~ zeros
+        mantPN_iadd(e, mantPN_ln(mantPN_fill(y[:nw], n2), n2)[nw:n2], -1)
+        y[nw:n2] = mantPN_mul(y[:n2-nw], e, n2-nw)
+    return y
+
+#################### mixed precision refinement ########################
+# solution in float64 (fast), then Newton corrections: residual by high
+# precision product, correction (small) in float64 - each step doubles
+# the number of correct bits (~1e-16 -> 1e-32 -> 1e-48)
+
+def _mixedType(x):
+    """
+    type of high precision digits of mantPN `x` (mpf, Decimal, DDArray 
+    of double-double) - mixed precision refinement can be used, None for 
+    float, int or Fraction (exact) digits
+    """
+    if mantPN_isDD(x):
+        return type(x)
+    if mantPN_isArr(x) or type(x[0]) in (float, int, Fraction):
+        return None
+    return type(x[0])
+
+def _mantPN_toFloat(x):
+    """python float digits of mantPN `x`, None if any is not finite"""
+    y = x.hi.tolist() if mantPN_isDD(x) else [float(d) for d in x]
+    return y if all(isfinite(d) for d in y) else None
+
+def _mantPN_fromFloat(y, T):
+    """float digits `y` as mantPN of digits of type T (see _mixedType)"""
+    if getattr(T, '_isDDArr', False):
+        import numpy as np
+        return T(np.array(y))
+    return [T(d) for d in y]
+
+def _floatPN(f, *args):
+    """f(*args) of float mantPNs, digit functions of 'FLOAT-PYTHON'"""
+    with digitPN.useBackend('FLOAT-PYTHON'):
+        return f(*args)
+
+def _mantPN_subFloat(y, cf, T):
+    """y - cf (float correction) in high precision"""
+    mantPN_iadd(y, _mantPN_fromFloat(cf, T), -1)
+    return y
+
+def mantPN_inv_mixed(x, N, steps=2):
+    """
+    (1 / x)[:N] - float64 inversion y, then `steps` Newton corrections:
+    y -= y * (x*y - 1), x*y in high precision, y * (...) in float64
+    (see PolyNumConf.MIXED_REFINE_STEPS). None if float64 overflows.
+
+    >>> with digitPN.useBackend('FLOAT-MPMATH-MPF') as mp:
+    ...     x = [mp.flt(1) / (k+1) for k in range(32)]
+    ...     e = mantPN_mul(x, mantPN_inv_mixed(x, 32), 32); e[0] -= 1
+    >>> bool(max(abs(d) for d in e) < mp.epsilonPNdig * 1e3)
+    True
+    """
+    T = _mixedType(x)
+    xf = _mantPN_toFloat(x[:N])
+    if T is None or xf is None:
+        return None
+    yf = _floatPN(mantPN_inv, xf, N)
+    if not all(isfinite(d) for d in yf):
+        return None
+    y = _mantPN_fromFloat(yf, T)
+    for __ in range(steps):
+        r = mantPN_mul(x, y, N)
+        r[0] = r[0] - 1
+        rf = _mantPN_toFloat(r)
+        if rf is None:
+            return None
+        y = _mantPN_subFloat(y, _floatPN(mantPN_mul, yf, rf, N), T)
+    return y
+
+def mantPN_sqrt_mixed(x, N, steps=2):
+    """
+    sqrt(x)[:N] - float64 sqrt y, then `steps` Newton corrections:
+    y -= (y*y - x) / (2*y), y*y in high precision, division in float64
+    (see PolyNumConf.MIXED_REFINE_STEPS). None if float64 overflows.
+
+    >>> with digitPN.useBackend('FLOAT-MPMATH-MPF') as mp:
+    ...     x = [mp.flt(2) + k for k in range(32)]
+    ...     y = mantPN_sqrt_mixed(x, 32); e = mantPN_mul(y, y, 32)
+    >>> bool(max(abs(a - b) / b for (a, b) in zip(e, x)) < mp.epsilonPNdig * 1e3)
+    True
+    """
+    T = _mixedType(x)
+    xf = _mantPN_toFloat(x[:N])
+    if T is None or xf is None or not xf[0] > 0:
+        return None
+    yf = _floatPN(mantPN_sqrt, xf, N)
+    invf = _floatPN(mantPN_inv, yf, N)
+    if not all(isfinite(d) for d in yf + invf):
+        return None
+    y = _mantPN_fromFloat(yf, T)
+    for __ in range(steps):
+        r = mantPN_mul(y, y, N)
+        mantPN_iadd(r, x, -1)
+        rf = _mantPN_toFloat(r)
+        if rf is None:
+            return None
+        cf = _floatPN(mantPN_mul, invf, rf, N)
+        y = _mantPN_subFloat(y, [d / 2 for d in cf], T)
+    return y
+
+def mantPN_exp_mixed(x, N, steps=2):
+    """
+    exp(x)[:N] - float64 exp y, then `steps` Newton corrections of
+    y' = x'*y: r = y' - x'*y (high precision), y += y * integral(-r/y) 
+    (float64), see PolyNumConf.MIXED_REFINE_STEPS. None if float64 
+    overflows.
+
+    >>> with digitPN.useBackend('FLOAT-MPMATH-MPF') as mp:
+    ...     x = [mp.flt(1) / (k+1) for k in range(32)]
+    ...     x1 = mantPN_ln(mantPN_exp_mixed(x, 32), 32)
+    >>> bool(max(abs(a - b) for (a, b) in zip(x1, x)) < mp.epsilonPNdig * 1e3)
+    True
+    """
+    T = _mixedType(x)
+    xf = _mantPN_toFloat(x[:N])
+    if T is None or xf is None:
+        return None
+    yf = _floatPN(mantPN_exp, xf, N)
+    invf = _floatPN(mantPN_inv, yf, N)
+    if not all(isfinite(d) for d in yf + invf):
+        return None
+    x = x[:N]
+    dx = mantPN_der(x)
+    y = _mantPN_fromFloat(yf, T)
+    y[0] = digitPN.exp(x[0])
+    for __ in range(steps):
+        r = mantPN_der(y)
+        mantPN_iadd(r, mantPN_mul(dx, y, N-1), -1)
+        rf = _mantPN_toFloat(r)
+        if rf is None:
+            return None
+        df = mantPN_int(_floatPN(mantPN_mul, invf, rf, N-1), 0.)
+        cf = _floatPN(mantPN_mul, yf, df, N)
+        cf[0] = 0. # y[0] = exp(x[0]) - without FFT round-off
+        y = _mantPN_subFloat(y, cf, T)
+    return y
+
+def mantPN_ln_mixed(x, N, steps=2):
+    """
+    ln(x)[:N] - float64 ln y, then `steps` corrections of x*y' = x': 
+    r = x*y' - x' (high precision), y -= integral(r/x) (float64), see 
+    PolyNumConf.MIXED_REFINE_STEPS. None if float64 overflows.
+
+    >>> with digitPN.useBackend('FLOAT-MPMATH-MPF') as mp:
+    ...     x = [mp.flt(2) + k for k in range(32)]
+    ...     x1 = mantPN_exp(mantPN_ln_mixed(x, 32), 32)
+    >>> bool(max(abs(a - b) / b for (a, b) in zip(x1, x)) < mp.epsilonPNdig * 1e3)
+    True
+    """
+    T = _mixedType(x)
+    xf = _mantPN_toFloat(x[:N])
+    if T is None or xf is None or not xf[0] > 0:
+        return None
+    yf = _floatPN(mantPN_ln, xf, N)
+    invf = _floatPN(mantPN_inv, xf, N)
+    if not all(isfinite(d) for d in yf + invf):
+        return None
+    x = x[:N]
+    dx = mantPN_der(x)
+    y = _mantPN_fromFloat(yf, T)
+    y[0] = digitPN.log(x[0])
+    for __ in range(steps):
+        r = mantPN_mul(x, mantPN_der(y), N-1)
+        mantPN_iadd(r, dx, -1)
+        rf = _mantPN_toFloat(r)
+        if rf is None:
+            return None
+        y = _mantPN_subFloat(y, mantPN_int(_floatPN(mantPN_mul, invf, rf, N-1), 0.), T)
+    return y
     
 #$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
 
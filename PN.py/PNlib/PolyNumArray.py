@@ -0,0 +1,561 @@
+# -*- coding: utf-8 -*-
+"""\
+PolyNumArray class
+==================
+    (batch of Polynomial Numbers)
+
+    K Polynomial Numbers (see PolyNum) of the same length N (see pn_precision)
+    stored as K x N matrix of float mantissas plus K-vector of exponents.
+    Each operation is done for the whole batch by NumPy array ops, i.e.
+    the same operational expression evaluated for hundreds of sampling
+    periods `h` or parameter values costs one pass of Python interpreter.
+
+    Requires numpy; digits are of dtype PolyNumConf.NUMPY_DTYPE (float64).
+
+    Examples
+    --------
+    >>> h = np.array([0.1, 0.2, 0.5])
+    >>> p = PolyNumArray(PolyNum('const:(~2~,-4~4~-4~4~...~)'), K=3) / h
+    >>> Y = 1 / (p**2 + p + 4)
+    >>> Y.exponent.tolist()
+    [0, 0, 0]
+    >>> p1 = PolyNum('const:(~2~,-4~4~-4~4~...~)') / 0.2
+    >>> np.allclose(Y.mantissa[1], PolyNumArray(1 / (p1**2 + p1 + 4)).mantissa[0])
+    True
+"""
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+__all__ = ['PolyNumArray']
+
+import numpy as np
+
+if __name__ == '__main__' or __name__ == 'PolyNumArray':
+    #standalone tests: PolyNumArray -> doctest
+    import PolyNumConf
+    from PolyNum import PolyNum, pn_getN
+else: #relative package import
+    from . import PolyNumConf
+    from .PolyNum import PolyNum, pn_getN
+
+
+#######################################################################
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class PolyNumArray(object):
+    """\
+    A batch of Polynomial Numbers
+    =============================
+
+    Attributes:
+    ----------
+        mantissa:
+            (K, N) ndarray - rows are PN mantissas (see PolyNum), first
+            digit of each row is non-zero or row is zero.
+        exponent:
+            (K,) ndarray of int
+
+    Parameters
+    ----------
+    pNs_or_mantissas :
+        PolyNum:
+            PN repeated K times
+        PolyNumArray:
+            copy
+        2-D array_like (K, n):
+            rows are mantissas of PNs, n <= N
+        sequence:
+            of PolyNum, str, scalars - converted by PolyNum()
+    exponent:
+        int or (K,) array of int, added to exponents of PNs
+    K:
+        batch size, if pNs_or_mantissas is PolyNum
+
+    Operands of `+ - * / **`:
+        scalars, (K,) array (scalar for each row), PolyNum (the same
+        for each row), PolyNumArray (of K or 1 rows)
+
+    Examples
+    --------
+    >>> x = PolyNumArray([PolyNum('(~1~,2~)'), PolyNum('(~0.5~,1~)', -1)])
+    >>> x
+    PolyNumArray([PolyNum('(~1.0~,2.0~)'), PolyNum('(~0.5~,1.0~)*(~1~0~)**(-1)')])
+    >>> x + 1
+    PolyNumArray([PolyNum('(~2.0~,2.0~)'), PolyNum('(~1.0~,0.5~1.0~)')])
+    >>> x * np.array([10, 100])
+    PolyNumArray([PolyNum('(~10.0~,20.0~)'), PolyNum('(~50.0~,100.0~)*(~1~0~)**(-1)')])
+    >>> y = 1 / x; y._strPN_cut = 4; y
+    PolyNumArray([PolyNum('(~1.0~,-2.0~4.0~-8.0~...~)'), PolyNum('(~2.0~,-4.0~8.0~-16.0~...~)*(~1~0~)**(1)')])
+    >>> (y * x).chop()
+    PolyNumArray([PolyNum('(~1.0~)'), PolyNum('(~1.0~)')])
+    >>> x[1] * PolyNum([0, 1.]) == (x * PolyNum([0, 1.]))[1]
+    True
+    """
+    __hash__ = None
+    __array_ufunc__ = None # numpy scalar/ndarray op PNA -> PNA.__rop__
+    _PNdefer = True # PolyNum op PNA -> PNA.__rop__
+    _dtype = np.dtype(PolyNumConf.NUMPY_DTYPE)
+
+    @property
+    def mantissa(self):
+        """ A copy of the (K, N) coefficients"""
+        return self._mantissa.copy()
+    @property
+    def exponent(self):
+        """ The (K,) exponents of the Polynomial Numbers """
+        return self._exponent.copy()
+
+    def __init__(self, pNs_or_mantissas=None, exponent=0, K=None):
+        N = pn_getN()
+        if isinstance(pNs_or_mantissas, PolyNumArray):
+            M, E = pNs_or_mantissas._mantissa, pNs_or_mantissas._exponent
+            N = M.shape[1]
+        elif isinstance(pNs_or_mantissas, PolyNum):
+            M, E = _mantExpo_ofPN(pNs_or_mantissas)
+            N = M.shape[1]
+            if K is not None:
+                M, E = np.repeat(M, K, axis=0), np.repeat(E, K)
+        elif hasattr(pNs_or_mantissas, 'ndim') and pNs_or_mantissas.ndim == 2:
+            M = pNs_or_mantissas
+            E = np.zeros(len(M), dtype=int)
+        else:
+            if pNs_or_mantissas is None:
+                pNs_or_mantissas = [PolyNum()]
+            pNs = [_mantExpo_ofPN(PolyNum(x)) for x in pNs_or_mantissas]
+            N = min(m.shape[1] for (m, __) in pNs) # precision of PNs
+            M = np.concatenate([m[:, :N] for (m, __) in pNs])
+            E = np.concatenate([e for (__, e) in pNs])
+        M = np.asarray(M, dtype=self._dtype)[:, :N]
+        self._mantissa = np.zeros((len(M), N), dtype=self._dtype)
+        self._mantissa[:, :M.shape[1]] = M
+        self._exponent = E + np.asarray(exponent, dtype=int)
+        self._normalize0()
+
+    @classmethod
+    def _fromMantExpo(cls, M, E):
+        """M (K, N), E (K,) - without copy"""
+        y = cls.__new__(cls)
+        y._mantissa, y._exponent = M, E
+        return y._normalize0()
+
+    def _normalize0(self):
+        """First digit of rows non-zero or zero row (exponent 0)"""
+        M = self._mantissa
+        nz = M != 0
+        first = np.argmax(nz, axis=1)
+        isZero = ~nz.any(axis=1)
+        first[isZero] = 0
+        self._exponent = np.where(isZero, 0, self._exponent - first)
+        if first.any():
+            self._mantissa = mantPNs_shr(M, -first)
+        return self
+
+    def __len__(self):
+        return len(self._mantissa)
+
+    def __getitem__(self, index):
+        """
+        PolyNum for int index, PolyNumArray for slice
+        """
+        if isinstance(index, slice):
+            return PolyNumArray._fromMantExpo(self._mantissa[index].copy(),
+                                              self._exponent[index].copy())
+        pN = PolyNum(self._mantissa[index], int(self._exponent[index]))
+        if hasattr(self, '_strPN_cut'):
+            pN._strPN_cut = self._strPN_cut
+        return pN
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    def __repr__(self):
+        return 'PolyNumArray([' + ', '.join(repr(x) for x in self) + '])'
+
+    def __str__(self):
+        return '[' + ', '.join(str(x) for x in self) + ']'
+
+    def chop(self, tol=None):
+        """Converts PN digits close to zero to exact zeros."""
+        if tol is None:
+            tol = np.finfo(self._dtype).eps*1024*1024
+        M = np.where(abs(self._mantissa) > tol, self._mantissa, 0)
+        return PolyNumArray._fromMantExpo(M, self._exponent.copy())
+
+#-----------------------------------------------------------
+
+    def _operand(self, other):
+        """
+        (M_self, M, E) of other: PolyNumArray, PolyNum or None (if scalar);
+        mantissas cut to N of lower precision
+        """
+        if isinstance(other, PolyNumArray):
+            M, E = other._mantissa, other._exponent
+        elif isinstance(other, PolyNum):
+            M, E = _mantExpo_ofPN(other)
+        else:
+            return None
+        N = min(self._mantissa.shape[1], M.shape[1])
+        return self._mantissa[:, :N], M[:, :N], E
+
+    def _scalar(self, other, opName):
+        """scalar or (K, 1) array of (K,) array `other`"""
+        a = np.asarray(other)
+        if a.ndim == 0:
+            return other
+        if a.ndim == 1 and len(a) == len(self):
+            return a[:, None]
+        raise ValueError(str(other)+" <- invalid operand for PNA "+opName)
+
+    def __neg__(self):
+        return PolyNumArray._fromMantExpo(-self._mantissa, self._exponent.copy())
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        """
+        >>> x = PolyNumArray([PolyNum('(~1~,2~3~)', -3), PolyNum(0.)])
+        >>> x + PolyNum('(~10~,20~30~)', -1)
+        PolyNumArray([PolyNum('(~10.0~,20.0~31.0~2.0~3.0~)*(~1~0~)**(-1)'), PolyNum('(~10.0~,20.0~30.0~)*(~1~0~)**(-1)')])
+        >>> x - np.array([100, 0])
+        PolyNumArray([PolyNum('(~-100.0~,0.0~0.0~1.0~2.0~3.0~)'), PolyNum('(~0.0~)')])
+        """
+        ME = self._operand(other)
+        if ME is None:
+            a = self._scalar(other, '__add__')
+            M = np.zeros((np.shape(a)[0] if np.ndim(a) else 1,
+                          self._mantissa.shape[1]), dtype=self._dtype)
+            M[:, :1] = a
+            ME = self._mantissa, M, np.zeros(len(M), dtype=int)
+        M, E = mantPNs_add(ME[0], self._exponent, ME[1], ME[2])
+        return PolyNumArray._fromMantExpo(M, E)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        ME = self._operand(other)
+        if ME is None:
+            self._scalar(other, '__sub__')
+            return self.__add__(-np.asarray(other))
+        return self.__add__(PolyNumArray._fromMantExpo(-ME[1], ME[2]))
+
+    def __rsub__(self, other): # case: other - self
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        """
+        >>> x = PolyNumArray([PolyNum([1.,2,3],-2), PolyNum([0.5,2],-5)])
+        >>> x * PolyNum([0.5,2],-5)
+        PolyNumArray([PolyNum('(~0.5~,3.0~5.5~6.0~)*(~1~0~)**(-7)'), PolyNum('(~0.25~,2.0~4.0~)*(~1~0~)**(-10)')])
+        """
+        ME = self._operand(other)
+        if ME is None:
+            a = self._scalar(other, '__mul__')
+            return PolyNumArray._fromMantExpo(self._mantissa * a, self._exponent.copy())
+        M1, M2, E2 = ME
+        M = mantPNs_mul(M1, M2, M1.shape[1])
+        return PolyNumArray._fromMantExpo(M, self._exponent + E2)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        """
+        >>> y = PolyNumArray([PolyNum([1.,0.2,0.3],-2)]) / PolyNum([0.1,0.2],-5)
+        >>> y._strPN_cut = 7; print(y)
+        [(~10.0~,-18.0~39.0~-78.0~156.0~-312.0~624.0~...~)*(~1~0~)**(3)]
+        """
+        ME = self._operand(other)
+        if ME is None:
+            a = self._scalar(other, '__div__')
+            return PolyNumArray._fromMantExpo(self._mantissa / a, self._exponent.copy())
+        M1, M2, E2 = ME
+        N = M1.shape[1]
+        M = mantPNs_mul(M1, mantPNs_inv(M2, N), N)
+        return PolyNumArray._fromMantExpo(M, self._exponent - E2)
+
+    def __rtruediv__(self, other): # case: other / self
+        ME = self._operand(other)
+        if ME is None:
+            a = self._scalar(other, '__rdiv__')
+            N = self._mantissa.shape[1]
+            inv = mantPNs_inv(self._mantissa, N)
+            return PolyNumArray._fromMantExpo(a * inv, -self._exponent)
+        M1, M2, E2 = ME
+        N = M1.shape[1]
+        return PolyNumArray._fromMantExpo(mantPNs_mul(M2, mantPNs_inv(M1, N), N),
+                                          E2 - self._exponent)
+
+    def __pow__(self, a):
+        """
+        self **a
+        ========
+        a - scalar or (K,) array, rather float, fract or int;
+        a is int for rows of exponent != 0
+
+        >>> x = PolyNumArray([PolyNum('(~0.1~,2.0~)'), PolyNum('(~1~,2.0~)', -1)])
+        >>> y = x **np.array([-1, 2]); y._strPN_cut = 5; y
+        PolyNumArray([PolyNum('(~10.0~,-200.0~4000.0~-80000.0~1600000.0~...~)'), PolyNum('(~1.0~,4.0~4.0~)*(~1~0~)**(-2)')])
+        >>> x = PolyNumArray([PolyNum([4.,4,1]), PolyNum([0.1,2.5])])
+        >>> np.allclose((x **0.5).mantissa, x.sqrt().mantissa)
+        True
+        """
+        aK = np.broadcast_to(np.asarray(a), self._exponent.shape)
+        if np.any((self._exponent != 0) & (aK != np.round(aK))):
+            raise ValueError("Power only to int, real, rational by exponent == 0 or to int by exponent != 0")
+        N = self._mantissa.shape[1]
+        if np.all(aK == 0.5):
+            M = mantPNs_sqrt(self._mantissa, N)
+        elif np.all(aK == -0.5):
+            M = mantPNs_invsqrt(self._mantissa, N)
+        else:
+            M = mantPNs_power_real(self._mantissa, aK, N)
+        E = (self._exponent * aK).round().astype(int)
+        return PolyNumArray._fromMantExpo(M, E)
+
+    def sqrt(self):
+        """
+        >>> y = PolyNumArray([PolyNum([0.1,2.5]), PolyNum([4.,4,1], -2)]).sqrt()
+        >>> np.allclose(y.mantissa[0], PolyNumArray(PolyNum([0.1,2.5]).sqrt()).mantissa[0])
+        True
+        >>> print(y[1])
+        (~2.0~,1.0~)*(~1~0~)**(-1)
+        """
+        if np.any(self._exponent % 2):
+            raise ValueError("Does not support sqrt() if exponent is odd: {}".format(self._exponent))
+        N = self._mantissa.shape[1]
+        return PolyNumArray._fromMantExpo(mantPNs_sqrt(self._mantissa, N),
+                                          self._exponent // 2)
+
+    def exp(self):
+        """
+        >>> x = PolyNum([0.1,2.])
+        >>> y = PolyNumArray([x, PolyNum(x, -2)]).exp()
+        >>> np.allclose(y.mantissa, PolyNumArray([x.exp(), PolyNum(x, -2).exp()]).mantissa)
+        True
+        """
+        if np.any(self._exponent > 0):
+            raise ValueError("Todo(?) - case if exponent (== {}) is positive.".format(self._exponent))
+        N = self._mantissa.shape[1]
+        M = mantPNs_shr(self._mantissa, -self._exponent)
+        return PolyNumArray._fromMantExpo(mantPNs_exp(M, N),
+                                          np.zeros(len(M), dtype=int))
+
+    def ln(self):
+        """
+        >>> x = PolyNumArray([PolyNum([1.,0.5]), PolyNum([3.,2.,1.])])
+        >>> (x.ln().exp() - x).chop()
+        PolyNumArray([PolyNum('(~0.0~)'), PolyNum('(~0.0~)')])
+        """
+        if np.any(self._exponent):
+            raise ValueError("Does not support ln() if exponent is nonzero: {}".format(self._exponent))
+        N = self._mantissa.shape[1]
+        return PolyNumArray._fromMantExpo(mantPNs_ln(self._mantissa, N),
+                                          np.zeros(len(self), dtype=int))
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+def _mantExpo_ofPN(x):
+    """(1, N) mantissa and (1,) exponent of PolyNum x"""
+    M = np.asarray([x.mantissa], dtype=PolyNumArray._dtype)
+    E = np.asarray([x.exponent], dtype=int)
+    if not M[0, 0]: # zero PN
+        E[0] = 0
+    return M, E
+
+#################### MantPNs functions ################################
+# batch of mantPN (see PolyNum.mantPN_...) - rows of 2-D arrays,
+# arrays of K or 1 rows are broadcasted
+
+def mantPNs_shr(M, r):
+    """
+    rows of M shifted right by r (K,) digits (left if r < 0)
+
+    >>> mantPNs_shr(np.array([[1., 2, 3], [1, 2, 3]]), np.array([1, -1]))
+    array([[0., 1., 2.],
+           [2., 3., 0.]])
+    """
+    K, N = M.shape
+    idx = np.arange(N) - np.asarray(r)[:, None]
+    valid = (idx >= 0) & (idx < N)
+    return np.where(valid, M[np.arange(K)[:, None], np.clip(idx, 0, N-1)], 0)
+
+def mantPNs_add(M1, E1, M2, E2):
+    """
+    (M, E) of sum of PNs (M1, E1) + (M2, E2) with exponent alignment
+    """
+    nz1, nz2 = M1[:, 0] != 0, M2[:, 0] != 0
+    E = np.where(nz1, np.where(nz2, np.maximum(E1, E2), E1), E2)
+    N = M1.shape[1]
+    d1 = np.minimum(np.broadcast_to(E - E1, E.shape), N)
+    d2 = np.minimum(np.broadcast_to(E - E2, E.shape), N)
+    M1 = np.broadcast_to(M1, (len(E), N))
+    M2 = np.broadcast_to(M2, (len(E), N))
+    if d1.any():
+        M1 = mantPNs_shr(M1, d1)
+    if d2.any():
+        M2 = mantPNs_shr(M2, d2)
+    return M1 + M2, E
+
+def mantPNs_mul(X, H, N, k0=0):
+    """
+    (X * H)[:, k0:N] - products of rows of X and H, see PolyNum.mantPN_mul()
+    FFT convolution (with balancing of digits) if N >= PolyNumConf.MUL_FFT_MIN_N
+
+    >>> mantPNs_mul(np.array([[1., 2, 3], [1, 1, 1]]), np.array([[9., 5, 1]]), 3)
+    array([[ 9., 23., 38.],
+           [ 9., 14., 15.]])
+    """
+    K = max(len(X), len(H))
+    nx, nh = min(X.shape[1], N), min(H.shape[1], N)
+    if PolyNumConf.MUL_FFT_MIN_N is not None and N >= PolyNumConf.MUL_FFT_MIN_N:
+        return _mantPNs_mul_fft(X[:, :nx], H[:, :nh], N)[:, k0:]
+    if nh > nx:
+        X, H, nx, nh = H, X, nh, nx
+    Y = np.zeros((K, N), dtype=np.result_type(X, H))
+    for j in range(nh):
+        L = min(nx, N-j)
+        Y[:, j:j+L] += H[:, j, None] * X[:, :L]
+    return Y[:, k0:]
+
+def _mantPNs_mul_fft(X, H, N):
+    L = 1
+    while L < X.shape[1] + H.shape[1] - 1:
+        L *= 2
+    n = min(X.shape[1] + H.shape[1] - 1, N)
+    k = np.arange(max(X.shape[1], H.shape[1], n))
+    lnLam = np.maximum(_lnGrowthRows(X), _lnGrowthRows(H))
+    lnLam = np.clip(lnLam, -700. / len(k), 700. / len(k))[:, None]
+    with np.errstate(over='ignore', under='ignore', invalid='ignore'):
+        w = np.exp(-lnLam * k)
+        Y = np.fft.irfft(np.fft.rfft(X * w[:, :X.shape[1]], L, axis=1) *
+                         np.fft.rfft(H * w[:, :H.shape[1]], L, axis=1), L, axis=1)[:, :n]
+        Y = Y * np.exp(lnLam * k[:n])
+    if n < N:
+        Y = np.concatenate((Y, np.zeros((len(Y), N - n))), axis=1)
+    return Y
+
+def _lnGrowthRows(M):
+    """ln of geometric growth rates of non-zero digits of rows, LSQ fit"""
+    a = abs(M)
+    mask = np.isfinite(a) & (a > 0)
+    cnt = mask.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        lnA = np.where(mask, np.log(np.where(mask, a, 1)), 0)
+        k = np.arange(M.shape[1]) * mask
+        kMean = k.sum(axis=1) / cnt
+        lnMean = lnA.sum(axis=1) / cnt
+        dk = np.where(mask, k - kMean[:, None], 0)
+        slope = (dk * (lnA - lnMean[:, None])).sum(axis=1) / (dk * dk).sum(axis=1)
+    return np.where(cnt >= 2, slope, 0.)
+
+def mantPNs_inv(X, N):
+    """
+    (1 / X)[:, :N], Newton iteration - see PolyNum.mantPN_inv()
+
+    >>> mantPNs_inv(np.array([[0.5, 7, 0, 0], [1, 1, 0, 0]]), 4).tolist()
+    [[2.0, -28.0, 392.0, -5488.0], [1.0, -1.0, 1.0, -1.0]]
+    """
+    Y = np.zeros((len(X), N), dtype=X.dtype)
+    Y[:, 0] = 1 / X[:, 0]
+    nw = 1
+    while nw < N:
+        n2 = min(2*nw, N)
+        V = mantPNs_mul(X[:, :n2], Y[:, :nw], n2, nw) # (1 - X*Y)[nw:n2] == -V
+        Y[:, nw:n2] = -mantPNs_mul(Y[:, :nw], V, n2-nw)
+        nw = n2
+    return Y
+
+def mantPNs_invsqrt(X, N):
+    """
+    (1 / sqrt(X))[:, :N], Newton iteration - see PolyNum.mantPN_invsqrt()
+
+    >>> mantPNs_invsqrt(np.array([[4., 4, 1, 0], [1, 2, 0, 0]]), 4).tolist()
+    [[0.5, -0.25, 0.125, -0.0625], [1.0, -1.0, 1.5, -2.5]]
+    >>> mantPNs_invsqrt(np.array([[-1., 1]]), 2)
+    Traceback (most recent call last):
+    ...
+    ValueError: {1/sqrt(x)} 1st digit of x is not positive: [-1.]
+    """
+    if np.any(X[:, 0] <= 0):
+        raise ValueError("{{1/sqrt(x)}} 1st digit of x is not positive: {}".format(X[:, 0]))
+    Z = np.zeros((len(X), N), dtype=X.dtype)
+    Z[:, 0] = 1 / np.sqrt(X[:, 0])
+    nw = 1
+    while nw < N:
+        n2 = min(2*nw, N)
+        V = mantPNs_mul(X[:, :n2], mantPNs_mul(Z[:, :nw], Z[:, :nw], n2), n2, nw) # (1 - X*Z*Z)[nw:n2] == -V
+        Z[:, nw:n2] = -mantPNs_mul(Z[:, :n2-nw], V, n2-nw) / 2
+        nw = n2
+    return Z
+
+def mantPNs_sqrt(X, N):
+    """
+    sqrt(X)[:, :N], coupled iteration - see PolyNum.mantPN_sqrt()
+
+    accuracy: sqrt(p**2 + 1), p = p_trap/0.1, N = 512 (FFT products)
+    >>> p = np.array([20.] + [(-40.)**1, 40.] * 256)[:512]
+    >>> x = mantPNs_mul(p[None], p[None], 512); x[0, 0] += 1
+    >>> Y = mantPNs_sqrt(x, 512)
+    >>> bool(abs(mantPNs_mul(Y, Y, 512) - x).max() < 100 * np.finfo(x.dtype).eps * abs(x).max())
+    True
+    >>> mantPNs_sqrt(np.array([[4., 4, 1], [0, 1, 0]]), 3)
+    Traceback (most recent call last):
+    ...
+    ValueError: {sqrt(x)} 1st digit of x is not positive: [4. 0.]
+    """
+    if np.any(X[:, 0] <= 0):
+        raise ValueError("{{sqrt(x)}} 1st digit of x is not positive: {}".format(X[:, 0]))
+    if N == 1:
+        return np.sqrt(X[:, :1])
+    Z = mantPNs_invsqrt(X, N)
+    Y = mantPNs_mul(X[:, :N], Z, N)
+    R = mantPNs_mul(Y, Y, N) - X[:, :N] # Y*Y - X, digits ~ round-off
+    return Y - mantPNs_mul(Z, R, N) / 2
+
+def mantPNs_power_real(X, a, N):
+    """
+    X **a, a - scalar or (K,) array, see PolyNum.mantPN_power_real()
+    """
+    a = np.broadcast_to(np.asarray(a, dtype=X.dtype), (len(X),))
+    Y = np.zeros((len(X), N), dtype=X.dtype)
+    Y[:, 0] = X[:, 0] **a
+    a1 = (a + 1)[:, None]
+    j = np.arange(1, N, dtype=X.dtype)
+    for k in range(1, N):
+        Y[:, k] = (X[:, 1:k+1] * (a1*j[:k]/k - 1) * Y[:, k-1::-1]).sum(axis=1) / X[:, 0]
+    return Y
+
+def mantPNs_exp(X, N):
+    """
+    exp(X), see PolyNum.mantPN_exp()
+    """
+    exp_x0 = np.exp(X[:, 0])
+    Y = exp_x0[:, None] * X[:, :N]
+    Y[:, 0] = exp_x0
+    j = np.arange(1, N, dtype=X.dtype)
+    for k in range(2, N):
+        Y[:, k] += (X[:, k-1:0:-1] * (1 - j[:k-1]/k) * Y[:, 1:k]).sum(axis=1)
+    return Y
+
+def mantPNs_ln(X, N):
+    """
+    ln(X), see PolyNum.mantPN_ln()
+    """
+    Y = X[:, :N].copy()
+    Y[:, 0] = np.log(X[:, 0])
+    j = np.arange(1, N, dtype=X.dtype)
+    for k in range(1, N):
+        Y[:, k] = (Y[:, k] - (X[:, 1:k] * (1 - j[:k-1]/k) * Y[:, k-1:0:-1]).sum(axis=1)) / X[:, 0]
+    return Y
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    import time
+    import doctest
+    start = time.time()
+    doctest.testmod()
+    print('OK. sec: ',time.time() - start)
@@ -3,15 +3,15 @@
 PolyNum configuration
 =====================
 max_N = 64   #or 128 or 100 ..., 32 is mimnimum for doctest
-    PN mantissa length i.e. PN significant digits number
-    - is fixed as class attr. in `_max_N` in MantPN (->PolyNum) class definition.
-    It can be changed before importing PolyNum.
+    default PN mantissa length i.e. PN significant digits number N.
+    It can be changed before importing PolyNum or at runtime for new PNs 
+    with `with PolyNum.pn_precision(N): ...` (each PN keeps its own N).
     2**(N) - efficient for inversion and sqrt
     
 sep = '~' # in PolyNum str() and repr()
     - is fixed as class attr. `_sep` in PolyNum class definition
 
-FLOAT_TYPE = 'FLOAT-PYTHON' # 'FLOAT-MPMATH-MPF' # 'FLOAT-NUMPY'
+FLOAT_TYPE = 'FLOAT-PYTHON' # 'FLOAT-MPMATH-MPF' # 'FLOAT-NUMPY' # 'DECIMAL' # 'DOUBLE-DOUBLE'
     used in digitPN to define type and some finctions.
     Recommended float precision: mpmath -> mp.prec = 128,
     max_N=64 or 128 (PN significant digits number).
@@ -19,9 +19,76 @@ FLOAT_TYPE = 'FLOAT-PYTHON' # 'FLOAT-MPMATH-MPF' # 'FLOAT-NUMPY'
 
 MPMATH_PREC = 128   #38 dec. siginicant dig. if FLOAT_TYPE = 'FLOAT-MPMATH-MPF'
 
+DECIMAL_PREC = 40 # if FLOAT_TYPE = 'DECIMAL'
+    decimal.Decimal digits (C libmpdec), precision of own decimal.Context
+    of the backend - applied in PolyNum methods and digitPN.digitContext(),
+    decimal.getcontext() (and DefaultContext) is not changed.
+
+NUMPY_DTYPE = 'float64' # or 'float32', 'longdouble' if FLOAT_TYPE = 'FLOAT-NUMPY'
+    PN mantissa is stored as contiguous numpy.ndarray of this dtype, 
+    digit-wise operations, shifts and products run as NumPy array ops.
+
+PYTHON_ARRAY_MANT = False
+    if FLOAT_TYPE = 'FLOAT-PYTHON' and True, mantissa of float digits is 
+    stored as contiguous array.array('d') instead of list of boxed floats
+    (other digits, i.e. int or Fraction - list). Memory of PN of N=64 float
+    digits: ~660 B (array('d') or numpy.ndarray) vs ~2.2 KB (list); PNs 
+    have __slots__ (no instance __dict__). Arithmetic is slower - the
+    mantPN_ kernels return lists, converted back to array('d'): ~35% at
+    N=64 (* / exp: 1.45 -> 1.95 ms), ~15% at N=256 (FFT products).
+
+MUL_FFT_MIN_N = 256
+    mantPN_mul() of float digits (python float or numpy.ndarray) uses FFT
+    convolution (numpy.fft.rfft) if N >= MUL_FFT_MIN_N, otherwise direct 
+    O(N**2) sum. None - FFT is not used.
+
+MUL_KARATSUBA_MIN_N = 128
+    mantPN_mul() of other digits (mpf, Fraction, Decimal, ...) uses truncated
+    Karatsuba multiplication if N >= MUL_KARATSUBA_MIN_N. None - not used.
+
+MUL_KRONECKER_MIN_N = 8
+    mantPN_mul() of mpmath.mpf digits converts mantissas to fixed-point
+    python ints (shared binary exponent) and multiplies them as two big
+    ints (Kronecker substitution, CPython Karatsuba) if N >= 
+    MUL_KRONECKER_MIN_N. None - not used (mpf digit by digit).
+
+DIV_RECURRENCE_MAX_N = 16
+    Division by PN of effective length (up to the last non-zero digit) 
+    <= DIV_RECURRENCE_MAX_N uses O(N * length) linear recurrence instead
+    of Newton inversion mantPN_inv(). None - not used.
+
+EXP_NEWTON_MIN_N = None
+    mantPN_ln() of N >= EXP_NEWTON_MIN_N is ln(x[0]) + integral(x'/x) by
+    Newton inversion and fast product, mantPN_exp() - Newton iteration
+    y += y*(x - ln(y)) from (EXP_NEWTON_MIN_N+1)//2 digits of recurrence,
+    O(M(N)) instead of O(N**2) recurrence. None - recurrence only: 1/x 
+    of ln() is unstable if digits of x decay, i.e. delay exp(-T*sqrt(p**2+1))
+    (see mantPN_exp_newton()), use for growing digits only (i.e. 32).
+
+EXP_NEWTON_FLOAT_MIN_N = None
+    the same for float digits (python float or numpy.ndarray) - their
+    recurrence is cheap (array ops), so the crossover is higher (i.e. 256).
+
+MIXED_REFINE_STEPS = None
+    mantPN_inv(), mantPN_sqrt(), mantPN_exp() and mantPN_ln() of high 
+    precision digits (mpf, Decimal, double-double) solve in float64 first
+    and apply MIXED_REFINE_STEPS Newton corrections (high precision 
+    residual, float64 correction): 1 - ~1e-32, 2 - ~1e-48 relative (if
+    float64 solution has ~1e-16). None - not used (high precision only).
+
+POW_CACHE_SIZE = 16
+    PN **n (int n) is computed by square-and-multiply; the powers n are
+    kept in the PN (up to POW_CACHE_SIZE mantissas per PN) and reused, 
+    i.e. in polynomials of p. 0 - powers are not cached.
+
 """
 
-__all__ = ['max_N','sep', 'FLOAT_TYPE', 'MPMATH_PREC']
+__all__ = ['max_N','sep', 'FLOAT_TYPE', 'MPMATH_PREC', 'DECIMAL_PREC', 'NUMPY_DTYPE',
+           'PYTHON_ARRAY_MANT',
+           'MUL_FFT_MIN_N', 'MUL_KARATSUBA_MIN_N', 'MUL_KRONECKER_MIN_N',
+           'DIV_RECURRENCE_MAX_N', 'EXP_NEWTON_MIN_N',
+           'EXP_NEWTON_FLOAT_MIN_N', 'MIXED_REFINE_STEPS',
+           'POW_CACHE_SIZE']
 
 max_N = 64   #or 128 or 100 ..., 32 is mimnimum for doctest - PN significant digits number
 
@@ -30,5 +97,20 @@ sep = '~' # in PN str() and repr()
 FLOAT_TYPE = 'FLOAT-PYTHON'
 #FLOAT_TYPE = 'FLOAT-MPMATH-MPF'
 #FLOAT_TYPE = 'FLOAT-NUMPY'
+#FLOAT_TYPE = 'DECIMAL'
+#FLOAT_TYPE = 'DOUBLE-DOUBLE'
 
 MPMATH_PREC = 128   #38 dec. siginicant dig.
+DECIMAL_PREC = 40 # decimal significant digits
+
+NUMPY_DTYPE = 'float64' # 'float32' # 'longdouble'
+PYTHON_ARRAY_MANT = False # True - array('d') of floats in 'FLOAT-PYTHON' (less memory, slower)
+
+MUL_FFT_MIN_N = 256 # None - without FFT in mantPN_mul()
+MUL_KARATSUBA_MIN_N = 128 # None - without Karatsuba in mantPN_mul()
+MUL_KRONECKER_MIN_N = 8 # None - mpf digits without big int engine in mantPN_mul()
+DIV_RECURRENCE_MAX_N = 16 # None - always Newton inversion in PN division
+EXP_NEWTON_MIN_N = None # 32 - Newton (unstable for decaying digits) in mantPN_exp(), mantPN_ln()
+EXP_NEWTON_FLOAT_MIN_N = None # 256 - the same for float digits
+MIXED_REFINE_STEPS = None # 2 - float64 solution + 2 Newton steps of mpf, ...
+POW_CACHE_SIZE = 16 # 0 - PN int powers are not cached
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""\
+RationalPN class
+================
+    (rational Polynomial Number - transfer function form)
+
+    PN in form:
+
+            num(z) / den(z) · (~1~0~)^c        z = (~0~,1~) = (~1~0~)^(-1)
+
+    where num, den - short polynomials (lists of coefficients of powers
+    z^0, z^1, ...), den[0] != 0. Expressions rational in p, e.g.
+    1/(p**2 + p + 4) with p = p_trap(h) = (2/h)*(~1~-1~)/(~1~1~), are
+    combined exactly under + - * / and int **. PN digits are computed
+    only on demand (toPN()) by O(N * deg(den)) recurrence, see
+    PolyNum.mantPN_div_short(). Mixed with PolyNum or used with exp(),
+    sqrt(), ln(), ... RationalPN falls back to dense PolyNum.
+
+    Common factors of num and den are not cancelled - degrees are sums
+    of degrees of operands.
+
+    Examples
+    --------
+    >>> from digitPN import flt
+    >>> h = flt('0.1')
+    >>> p = RationalPN.p_trap(h)
+    >>> Y = 1 / (p**2 + p + 4)
+    >>> len(Y.num), len(Y.den)
+    (4, 4)
+    >>> pPN = PolyNum('const:(~2~,-4~4~-4~4~...~)') / h
+    >>> Y.toPN().isclose(1 / (pPN*pPN + pPN + 4), 1e-9, 1e-9)
+    True
+    >>> (Y * pPN).isclose(pPN / (pPN*pPN + pPN + 4), 1e-9, 1e-9)
+    True
+"""
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+__all__ = ['RationalPN']
+
+if __name__ == '__main__' or __name__ == 'RationalPN':
+    #standalone tests: RationalPN -> doctest
+    import digitPN
+    from PolyNum import PolyNum, pn_getN, mantPN_mul, mantPN_div_short, mantPN_effLen
+else: #relative package import
+    from . import digitPN
+    from .PolyNum import PolyNum, pn_getN, mantPN_mul, mantPN_div_short, mantPN_effLen
+
+
+#######################################################################
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+class RationalPN(object):
+    """\
+    Rational Polynomial Number
+    ==========================
+
+    Attributes:
+    ----------
+        num, den:
+            lists of polynomial coefficients (powers z^0, z^1, ...),
+            num[0] != 0 (or num == [0]), den[0] != 0
+        exponent:
+            (int) - like PolyNum.exponent
+
+    Parameters
+    ----------
+    num :
+        scalar, list of coefficients or PolyNum (taken up to its last
+        non-zero digit - exact for PN of finite mantissa)
+    den :
+        as num, default 1
+    exponent:
+        added to exponents of num and den (PolyNum)
+
+    Examples
+    --------
+    >>> RationalPN([1, 2])
+    RationalPN([1, 2], [1])
+    >>> RationalPN([0, 0, 1, 2], [0, 4], 1)
+    RationalPN([1, 2], [4])
+    >>> x = RationalPN([1, 2], [1, -1]); x
+    RationalPN([1, 2], [1, -1])
+    >>> print(x.toPN(6))
+    (~1.0~,3.0~3.0~3.0~3.0~3.0~)
+    >>> x + 1, x * x, x / RationalPN([1, 2], [1, 1])
+    (RationalPN([2, 1], [1, -1]), RationalPN([1, 4, 4], [1, -2, 1]), RationalPN([1, 3, 2], [1, 1, -2]))
+    >>> x **-2
+    RationalPN([1, -2, 1], [1, 4, 4])
+    >>> x + RationalPN([1], [1, -1], -1)
+    RationalPN([1, 3], [1, -1])
+    """
+    __hash__ = None
+    __array_ufunc__ = None # numpy scalar/ndarray op RPN -> RPN.__rop__
+    _PNdefer = True # PolyNum op RPN -> RPN.__rop__
+
+    @property
+    def exponent(self):
+        """ The exponent of the Rational Polynomial Number """
+        return self._exponent
+
+    def __init__(self, num=0, den=1, exponent=0):
+        num, eNum = _poly(num)
+        den, eDen = _poly(den)
+        self.num, self.den = num, den
+        self._exponent = exponent + eNum - eDen
+        self._normalize0()
+        self._toPN = {} # cache of materialized PNs (N -> PolyNum)
+
+    @classmethod
+    def p_trap(cls, h):
+        """
+        p_trap(h) == (2/h)*(~1~-1~)/(~1~1~) - see 'const:(~2~,-4~4~-4~4~...~)'
+        in PolyNum
+        """
+        two_h = 2 / h
+        return cls([two_h, -two_h], [1, 1])
+
+    def _normalize0(self):
+        """num[0] != 0 (or zero RPN), den[0] != 0, no trailing zeros"""
+        num, den = _polyTrim(self.num), _polyTrim(self.den)
+        k = _polyFirstNonzero(den)
+        if k == len(den):
+            raise ZeroDivisionError("RationalPN denominator is zero")
+        self._exponent += k
+        den = den[k:]
+        k = _polyFirstNonzero(num)
+        if k == len(num): # zero
+            num, den, self._exponent = num[:1], [den[0]*0 + 1], 0
+        else:
+            self._exponent -= k
+            num = num[k:]
+        self.num, self.den = num, den
+        return self
+
+    def toPN(self, N=None):
+        """
+        dense PolyNum of N digits (default pn_getN()) - O(N * len(den))
+        recurrence; results are cached per N
+        """
+        if N is None:
+            N = pn_getN()
+        y = self._toPN.get(N)
+        if y is None:
+            y = PolyNum(mantPN_div_short(self.num, self.den, N), self._exponent, N)
+            self._toPN[N] = y
+        return PolyNum(y)
+
+    def __repr__(self):
+        s = 'RationalPN({!r}, {!r}'.format(self.num, self.den)
+        if self._exponent:
+            s += ', {}'.format(self._exponent)
+        return s + ')'
+
+    def __str__(self):
+        s = '(~' + '~'.join(digitPN.strF(d) for d in self.num) + '~)/(~' + \
+            '~'.join(digitPN.strF(d) for d in self.den) + '~)'
+        if self._exponent:
+            s += '*(~1~0~)**({})'.format(self._exponent)
+        return s
+
+    def __nonzero__(self):
+        return bool(self.num[0])
+    __bool__ = __nonzero__
+
+#-----------------------------------------------------------
+
+    def _operand(self, other):
+        """RationalPN of scalar / RationalPN, None for PolyNum (-> dense)"""
+        if isinstance(other, RationalPN):
+            return other
+        if isinstance(other, PolyNum):
+            return None
+        if isinstance(other,(int,float)) or not hasattr(other, '__len__'):
+            return RationalPN([other])
+        raise ValueError(str(other)+" <- invalid operand for RationalPN")
+
+    def _dense(self, other):
+        """(self, other) as PolyNums of N of other"""
+        return self.toPN(other._max_N), other
+
+    def __neg__(self):
+        return RationalPN([-d for d in self.num], self.den, self._exponent)
+
+    def __pos__(self):
+        return self
+
+    def __add__(self, other):
+        """
+        >>> RationalPN([1, 2], [1, 1], -1) + RationalPN([3], [1, -1])
+        RationalPN([3, 4, 1, -2], [1, 0, -1])
+        """
+        y = self._operand(other)
+        if y is None:
+            x, y = self._dense(other)
+            return x + y
+        a1, a2 = (self, y) if y._exponent <= self._exponent else (y, self)
+        z = [0] * (a1._exponent - a2._exponent) # z**(e1-e2)
+        if a1.den == a2.den: # common denominator
+            return RationalPN(_polyAdd(a1.num, z + a2.num), a1.den, a1._exponent)
+        num = _polyAdd(_polyMul(a1.num, a2.den), z + _polyMul(a2.num, a1.den))
+        return RationalPN(num, _polyMul(a1.den, a2.den), a1._exponent)
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __sub__(self, other):
+        y = self._operand(other)
+        if y is None:
+            x, y = self._dense(other)
+            return x - y
+        return self.__add__(-y)
+
+    def __rsub__(self, other): # case: other - self
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        y = self._operand(other)
+        if y is None:
+            x, y = self._dense(other)
+            return x * y
+        return RationalPN(_polyMul(self.num, y.num), _polyMul(self.den, y.den),
+                          self._exponent + y._exponent)
+
+    def __rmul__(self, other):
+        return self.__mul__(other)
+
+    def __truediv__(self, other):
+        y = self._operand(other)
+        if y is None:
+            x, y = self._dense(other)
+            return x / y
+        return RationalPN(_polyMul(self.num, y.den), _polyMul(self.den, y.num),
+                          self._exponent - y._exponent)
+
+    def __rtruediv__(self, other): # case: other / self
+        y = self._operand(other)
+        if y is None:
+            x, y = self._dense(other)
+            return y / x
+        return y.__truediv__(self)
+
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, a):
+        """
+        int a - exact (binary exponentiation of num and den),
+        other a - dense PolyNum **a
+        """
+        if not isinstance(a, int):
+            return self.toPN() **a
+        num, den = (self.num, self.den) if a >= 0 else (self.den, self.num)
+        return RationalPN(_polyPow(num, abs(a)), _polyPow(den, abs(a)), self._exponent * a)
+
+    def __eq__(self, other):
+        if isinstance(other, RationalPN):
+            return (self - other).num == [0] or not (self - other).num[0]
+        return self.toPN() == other
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    # dense fall-back: PolyNum methods of the materialized PN
+    def sqrt(self):
+        return self.toPN().sqrt()
+    def exp(self):
+        return self.toPN().exp()
+    def ln(self):
+        return self.toPN().ln()
+    def expZ(self, pZ, T0, h):
+        return self.toPN().expZ(pZ, T0, h)
+    def invTr1LaplPN(self, t):
+        return self.toPN().invTr1LaplPN(t)
+    def invTr05exp_b0_LaplPN(self, t, b0):
+        return self.toPN().invTr05exp_b0_LaplPN(t, b0)
+    def __getitem__(self, index):
+        return self.toPN()[index]
+    def __iter__(self):
+        return iter(self.toPN())
+    @property
+    def mantissa(self):
+        return self.toPN().mantissa
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+#################### polynomial (full, not truncated) ##################
+
+def _poly(x):
+    """(list of coefficients, exponent) of scalar, list or PolyNum"""
+    if isinstance(x, PolyNum):
+        m = x._atScale(1)._mantissa # digits of scaled PN (see PolyNum.rescale)
+        m = m[:mantPN_effLen(m)]
+        return list(m.tolist() if hasattr(m, 'tolist') and not hasattr(m[0], 'tolist') else m), x.exponent
+    if isinstance(x, RationalPN):
+        raise ValueError("RationalPN as num/den - use RationalPN / RationalPN")
+    if isinstance(x,(int,float)) or not hasattr(x, '__len__'):
+        return [x], 0
+    return list(x), 0
+
+def _polyTrim(a):
+    """without trailing zeros (at least 1 coefficient)"""
+    n = len(a)
+    while n > 1 and not a[n-1]:
+        n -= 1
+    return list(a[:n])
+
+def _polyFirstNonzero(a):
+    for k, d in enumerate(a):
+        if d:
+            return k
+    return len(a)
+
+def _polyAdd(a, b):
+    if len(a) < len(b):
+        a, b = b, a
+    return [a[k] + b[k] for k in range(len(b))] + list(a[len(b):])
+
+def _polyMul(a, b):
+    """full product, see PolyNum.mantPN_mul()"""
+    return list(mantPN_mul(a, b, len(a) + len(b) - 1))
+
+def _polyPow(a, n):
+    """a**n, n >= 0 - binary exponentiation"""
+    y = [a[0]*0 + 1]
+    while n:
+        if n & 1:
+            y = _polyMul(y, a)
+        n >>= 1
+        if n:
+            a = _polyMul(a, a)
+    return y
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    import time
+    import doctest
+    start = time.time()
+    doctest.testmod()
+    print('OK. sec: ',time.time() - start)
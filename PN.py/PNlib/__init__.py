@@ -1,4 +1,4 @@
-__all__ = ["PolyNumConf", "digitPN", "PolyNum"]
+__all__ = ["PolyNumConf", "digitPN", "PolyNum", "PolyNumArray", "RationalPN", "LazyPN"]
 # place folder `PNlib` near to *.ipynb, 
 # or make symbolic / junction link to it (Windows: mklink /j PNlib "c:\dir\PNlib"), 
 # or ...
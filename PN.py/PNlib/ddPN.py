@@ -0,0 +1,551 @@
+# -*- coding: utf-8 -*-
+"""\
+Double-double PN digits
+=======================
+    (unevaluated sum hi + lo of two float64, |lo| <= ulp(hi)/2,
+    about 106 bits - 32 significant decimal digits)
+
+    DD - PN digit (scalar), DDArray - PN mantissa stored as a pair of
+    float64 ndarrays (hi, lo). Kernels are error-free transformations
+    (two_sum, Dekker's two_prod - no FMA) written with `+ - *` only, so
+    the same code runs on python floats (DD) and vectorized on ndarrays
+    (DDArray): digit-wise add, mul, convolution of mantissas and
+    pairwise sums. See backend 'DOUBLE-DOUBLE' in digitPN.
+
+    Examples
+    --------
+    >>> x = DD('0.1'); x
+    DD('0.1')
+    >>> print(x * 3, 0.1 * 3)
+    0.3 0.30000000000000004
+    >>> print(DD(1) / 3)
+    0.33333333333333333333333333333333
+    >>> print(DD(2).sqrt())
+    1.4142135623730950488016887242097
+    >>> m = DDArray(['0.1', 2, 0]); m
+    DDArray([DD('0.1'), DD('2.0'), DD('0.0')])
+    >>> m * 10 + m
+    DDArray([DD('1.1'), DD('22.0'), DD('0.0')])
+"""
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+__all__ = ['DD', 'DDArray']
+
+import math
+from decimal import Decimal, localcontext
+from fractions import Fraction
+
+import numpy as np
+
+
+#######################################################################
+# error-free transformations - for python floats and float64 ndarrays
+
+_SPLITTER = 134217729.0 # 2**27 + 1
+_SPLIT_MAX = 2.**996 # _SPLITTER * a overflows above
+
+def _twoSum(a, b):
+    """s + e == a + b exactly, s = fl(a + b)"""
+    s = a + b
+    bb = s - a
+    return s, (a - (s - bb)) + (b - bb)
+
+def _quickTwoSum(a, b):
+    """s + e == a + b exactly, |a| >= |b|"""
+    s = a + b
+    return s, b - (s - a)
+
+def _split(a):
+    """hi + lo == a, hi - upper 26 bits; |a| > 2**996 is split at 2**-28 scale"""
+    if isinstance(a, float):
+        if abs(a) > _SPLIT_MAX:
+            hi, lo = _split(a * 2.**-28)
+            return hi * 2.**28, lo * 2.**28
+    elif a.size and (a.max() > _SPLIT_MAX or a.min() < -_SPLIT_MAX):
+        s = np.where(abs(a) > _SPLIT_MAX, 2.**-28, 1.)
+        hi, lo = _split(a * s)
+        return hi / s, lo / s
+    t = _SPLITTER * a
+    hi = t - (t - a)
+    return hi, a - hi
+
+def _twoProd(a, b):
+    """p + e == a * b exactly, p = fl(a * b)"""
+    p = a * b
+    ah, al = _split(a)
+    bh, bl = _split(b)
+    return p, ((ah*bh - p) + ah*bl + al*bh) + al*bl
+
+def _add(ah, al, bh, bl):
+    s, e = _twoSum(ah, bh)
+    t, f = _twoSum(al, bl)
+    s, e = _quickTwoSum(s, e + t)
+    return _quickTwoSum(s, e + f)
+
+def _mul(ah, al, bh, bl):
+    p, e = _twoProd(ah, bh)
+    return _quickTwoSum(p, e + (ah*bl + al*bh))
+
+def _div(ah, al, bh, bl):
+    q1 = ah / bh
+    ph, pl = _mul(q1, 0. * q1, bh, bl)
+    rh, rl = _add(ah, al, -ph, -pl)
+    q2 = rh / bh
+    ph, pl = _mul(q2, 0. * q2, bh, bl)
+    rh, rl = _add(rh, rl, -ph, -pl)
+    q3 = rh / bh
+    q1, q2 = _quickTwoSum(q1, q2)
+    return _add(q1, q2, q3, 0. * q3)
+
+def _sum(h, l):
+    """pairwise DD sum along the last axis of (h, l)"""
+    n = h.shape[-1]
+    while n > 1:
+        if n % 2:
+            pad = [(0, 0)] * (h.ndim - 1) + [(0, 1)]
+            h, l = np.pad(h, pad), np.pad(l, pad)
+            n += 1
+        n //= 2
+        h, l = _add(h[..., :n], l[..., :n], h[..., n:], l[..., n:])
+    if n == 0:
+        return np.zeros(h.shape[:-1]), np.zeros(h.shape[:-1])
+    return h[..., 0], l[..., 0]
+
+
+#######################################################################
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _dd(hi, lo):
+    """DD of normalized (hi, lo) - not checked"""
+    x = object.__new__(DD)
+    x.hi, x.lo = hi, lo
+    return x
+
+def _parts(x):
+    """(hi, lo) of DD, float or int, None for other types"""
+    if isinstance(x, DD):
+        return x.hi, x.lo
+    if isinstance(x, float):
+        return float(x), 0.
+    if isinstance(x, int):
+        hi = float(x)
+        return hi, float(x - int(hi)) if math.isfinite(hi) else 0.
+    return None
+
+
+class DD(object):
+    """\
+    Double-double digit
+    ===================
+
+    Parameters
+    ----------
+    x :
+        str (exact decimal value rounded to 106 bits), DD, float, int,
+        Fraction, Decimal
+    """
+    __slots__ = ('hi', 'lo')
+
+    def __init__(self, x=0):
+        p = _parts(x)
+        if p is None:
+            if isinstance(x, str) and x.strip().lower().lstrip('+-') in ('inf', 'infinity', 'nan'):
+                p = float(x), 0.
+            else:
+                f = Fraction(x) # str, Fraction, Decimal
+                hi = float(f)
+                p = hi, float(f - Fraction(hi))
+        self.hi, self.lo = p
+
+    def __repr__(self):
+        return "DD('{}')".format(self._str(32))
+
+    def __str__(self):
+        return self._str(32)
+
+    def __format__(self, spec):
+        """'1.9' - 9 significant digits (as for float)"""
+        if not math.isfinite(self.hi):
+            return format(self.hi, spec)
+        with localcontext() as ctx:
+            ctx.prec = 34
+            return format(Decimal(self.hi) + Decimal(self.lo), spec)
+
+    def _str(self, signif):
+        s = self.__format__('1.{}'.format(signif))
+        m, __, e = s.lower().partition('e') # like float: 1.0, 2.5e-10
+        if '.' in m:
+            m = m.rstrip('0')
+            m = m.rstrip('.') if e else m + '0'*m.endswith('.')
+        elif not e and m[-1:].isdigit():
+            m += '.0'
+        return m + ('e' + e if e else '')
+
+    def __float__(self):
+        return self.hi
+
+    def __int__(self):
+        return int(Fraction(self.hi) + Fraction(self.lo))
+
+    def __floor__(self):
+        f = math.floor(self.hi)
+        return f + math.floor(self.lo) if f == self.hi else f
+
+    def __hash__(self):
+        return hash(self.hi) if not self.lo else hash((self.hi, self.lo))
+
+    def __bool__(self):
+        return self.hi != 0
+    __nonzero__ = __bool__
+
+#-----------------------------------------------------------
+
+    def __neg__(self):
+        return _dd(-self.hi, -self.lo)
+
+    def __pos__(self):
+        return self
+
+    def __abs__(self):
+        return _dd(-self.hi, -self.lo) if self.hi < 0 else self
+
+    def __add__(self, other):
+        p = _parts(other)
+        if p is None:
+            return NotImplemented
+        return _dd(*_add(self.hi, self.lo, p[0], p[1]))
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        p = _parts(other)
+        if p is None:
+            return NotImplemented
+        return _dd(*_add(self.hi, self.lo, -p[0], -p[1]))
+
+    def __rsub__(self, other):
+        p = _parts(other)
+        if p is None:
+            return NotImplemented
+        return _dd(*_add(p[0], p[1], -self.hi, -self.lo))
+
+    def __mul__(self, other):
+        p = _parts(other)
+        if p is None:
+            return NotImplemented
+        return _dd(*_mul(self.hi, self.lo, p[0], p[1]))
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        p = _parts(other)
+        if p is None:
+            return NotImplemented
+        return _dd(*_div(self.hi, self.lo, p[0], p[1]))
+
+    def __rtruediv__(self, other):
+        p = _parts(other)
+        if p is None:
+            return NotImplemented
+        return _dd(*_div(p[0], p[1], self.hi, self.lo))
+    __div__ = __truediv__
+    __rdiv__ = __rtruediv__
+
+    def __pow__(self, a):
+        """
+        >>> DD(3) **-2 == 1 / DD(9), '{:1.30}'.format(DD(2) **DD('0.5'))
+        (True, '1.41421356237309504880168872421')
+        """
+        if isinstance(a, int):
+            y, x, n = DD(1), self, abs(a)
+            while n:
+                if n & 1:
+                    y = y * x
+                n >>= 1
+                if n:
+                    x = x * x
+            return 1 / y if a < 0 else y
+        if not self:
+            return self
+        return (self.log() * a).exp()
+
+    def __rpow__(self, a):
+        return DD(a) **self
+
+    def _cmp(self, other):
+        p = _parts(other)
+        if p is None:
+            return None
+        return (self.hi > p[0] or self.hi == p[0] and self.lo > p[1]) - \
+               (self.hi < p[0] or self.hi == p[0] and self.lo < p[1])
+
+    def __eq__(self, other):
+        c = self._cmp(other)
+        return NotImplemented if c is None else c == 0 and self.hi == self.hi
+
+    def __ne__(self, other):
+        eq = self.__eq__(other)
+        return eq if eq is NotImplemented else not eq
+
+    def __lt__(self, other):
+        c = self._cmp(other)
+        return NotImplemented if c is None else c < 0
+
+    def __le__(self, other):
+        c = self._cmp(other)
+        return NotImplemented if c is None else c <= 0 and self.hi == self.hi
+
+    def __gt__(self, other):
+        c = self._cmp(other)
+        return NotImplemented if c is None else c > 0
+
+    def __ge__(self, other):
+        c = self._cmp(other)
+        return NotImplemented if c is None else c >= 0 and self.hi == self.hi
+
+#-----------------------------------------------------------
+
+    def sqrt(self):
+        """
+        >>> x = DD('0.1').sqrt(); x * x == DD('0.1')
+        True
+        """
+        if self.hi <= 0:
+            if not self.hi:
+                return _dd(0., 0.)
+            raise ValueError('math domain error')
+        s = math.sqrt(self.hi)
+        p, e = _twoProd(s, s)
+        rh, rl = _add(self.hi, self.lo, -p, -e)
+        return _dd(*_quickTwoSum(s, rh / (2 * s)))
+
+    def exp(self):
+        """
+        exp(r / 2**10 + k ln2): Taylor series of expm1(r / 2**10),
+        10 squarings, * 2**k
+
+        >>> '{:1.30}'.format(DD(1).exp())
+        '2.71828182845904523536028747135'
+        """
+        if self.hi > 709.79:
+            return _dd(math.inf, 0.)
+        if self.hi < -745.2:
+            return _dd(0., 0.)
+        k = int(round(self.hi / _LN2.hi))
+        r = (self - _LN2 * k) * (1. / 1024)
+        s, t, n = r, r, 1
+        while abs(t.hi) > 1e-36 * abs(s.hi) and n < 30:
+            n += 1
+            t = t * r / n
+            s = s + t
+        for __ in range(10): # expm1(2x) = 2 expm1(x) + expm1(x)**2
+            s = s * 2 + s * s
+        y = s + 1
+        return _dd(math.ldexp(y.hi, k), math.ldexp(y.lo, k))
+
+    def log(self):
+        """
+        >>> '{:1.30} {:1.30}'.format(DD(10).log(), DD(10).log().exp())
+        '2.30258509299404568401799145468 10.0000000000000000000000000000'
+        """
+        if self.hi <= 0:
+            raise ValueError('math domain error')
+        x = _dd(math.log(self.hi), 0.)
+        return x + self * (-x).exp() - 1 # Newton step
+    ln = log
+
+    def erfc(self):
+        """float accuracy"""
+        return _dd(math.erfc(self.hi), 0.)
+
+_LN2 = _dd(0.6931471805599453, 2.3190468138462996e-17)
+PI = _dd(3.141592653589793, 1.2246467991473532e-16)
+EPS = _dd(2.**-104, 0.) # ~ 4.93e-32
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+def _ddArr(hi, lo):
+    """DDArray of (hi, lo) float64 ndarrays - not copied, not checked"""
+    x = object.__new__(DDArray)
+    x.hi, x.lo = hi, lo
+    return x
+
+
+class DDArray(object):
+    """\
+    Double-double mantissa
+    ======================
+        pair of float64 ndarrays (hi, lo) - like list of DD digits:
+        len(), [k] (DD), slices (copies), item/slice assignment, iter;
+        vectorized: + - with DDArray, * / by scalar, unary - and abs(),
+        dot(), conv() - see mantPN_mul() in PolyNum
+
+    Parameters
+    ----------
+    digits :
+        iterable of DD, float, int, str; DDArray - copied
+    """
+    __slots__ = ('hi', 'lo')
+    _isDDArr = True
+
+    def __init__(self, digits=()):
+        if isinstance(digits, DDArray):
+            self.hi, self.lo = digits.hi.copy(), digits.lo.copy()
+            return
+        if isinstance(digits, np.ndarray) and digits.dtype.kind in 'biuf':
+            self.hi = np.array(digits, dtype=np.float64)
+            self.lo = np.zeros(len(self.hi))
+            return
+        digits = [d if isinstance(d, DD) else DD(d) for d in digits]
+        self.hi = np.array([d.hi for d in digits], dtype=np.float64)
+        self.lo = np.array([d.lo for d in digits], dtype=np.float64)
+
+    @staticmethod
+    def zeros(n):
+        return _ddArr(np.zeros(n), np.zeros(n))
+
+    def __repr__(self):
+        return 'DDArray([{}])'.format(', '.join(repr(d) for d in self))
+
+    def __len__(self):
+        return len(self.hi)
+
+    def __iter__(self):
+        for hi, lo in zip(self.hi.tolist(), self.lo.tolist()):
+            yield _dd(hi, lo)
+
+    def tolist(self):
+        return list(self)
+
+    def copy(self):
+        return _ddArr(self.hi.copy(), self.lo.copy())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _ddArr(self.hi[index].copy(), self.lo[index].copy())
+        return _dd(float(self.hi[index]), float(self.lo[index]))
+
+    def __setitem__(self, index, value):
+        if isinstance(value, DDArray):
+            self.hi[index], self.lo[index] = value.hi, value.lo
+            return
+        p = _parts(value)
+        if p is None:
+            value = DDArray(value)
+            self.hi[index], self.lo[index] = value.hi, value.lo
+            return
+        self.hi[index], self.lo[index] = p
+
+    def _operand(self, other):
+        """(hi, lo) of DDArray or scalar, None for other types"""
+        if isinstance(other, DDArray):
+            return other.hi, other.lo
+        return _parts(other)
+
+#-----------------------------------------------------------
+
+    def __neg__(self):
+        return _ddArr(-self.hi, -self.lo)
+
+    def __abs__(self):
+        s = np.where(self.hi < 0, -1., 1.)
+        return _ddArr(self.hi * s, self.lo * s)
+
+    def __add__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return _ddArr(*_add(self.hi, self.lo, p[0], p[1]))
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return _ddArr(*_add(self.hi, self.lo, -p[0], -p[1]))
+
+    def __rsub__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return _ddArr(*_add(p[0], p[1], -self.hi, -self.lo))
+
+    def __mul__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        return _ddArr(*_mul(self.hi, self.lo, p[0], p[1]))
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return _ddArr(*_div(self.hi, self.lo, p[0], p[1]))
+    __div__ = __truediv__
+
+    def _inplace(self, f, other, sign=1.):
+        p = self._operand(other)
+        if p is None:
+            return NotImplemented
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.hi[:], self.lo[:] = f(self.hi, self.lo, sign*p[0], sign*p[1])
+        return self
+
+    def __iadd__(self, other):
+        return self._inplace(_add, other)
+
+    def __isub__(self, other):
+        return self._inplace(_add, other, -1.)
+
+    def __imul__(self, other):
+        return self._inplace(_mul, other)
+
+    def __itruediv__(self, other):
+        return self._inplace(_div, other)
+    __idiv__ = __itruediv__
+
+    def dot(self, other):
+        """DD sum of digit products (pairwise summation)"""
+        return _dd(*(float(v) for v in _sum(*_mul(self.hi, self.lo, other.hi, other.lo))))
+
+    def conv(self, other, N, k0=0):
+        """
+        (self * other)[k0:N] - truncated product of mantissas: all digit
+        products x[k-j] * h[j] at once (in blocks of rows k), sums of rows
+        by pairwise DD summation
+
+        >>> x = DDArray(['0.1', 2, 3]); h = DDArray([1, '0.3'])
+        >>> x.conv(h, 4), x.conv(h, 4, 2)
+        (DDArray([DD('0.1'), DD('2.03'), DD('3.6'), DD('0.9')]), DDArray([DD('3.6'), DD('0.9')]))
+        """
+        x, h = self, other
+        if len(x) < len(h):
+            x, h = h, x
+        nx, nh = min(len(x), N), min(len(h), N)
+        yh, yl = np.zeros(N - k0), np.zeros(N - k0)
+        if not nh:
+            return _ddArr(yh, yl)
+        j = np.arange(nh)
+        hh, hl = h.hi[:nh], h.lo[:nh]
+        rows = max(1, (1 << 16) // nh)
+        for k1 in range(k0, N, rows):
+            k = np.arange(k1, min(k1 + rows, N))[:, None]
+            i = k - j
+            isIn = (i >= 0) & (i < nx)
+            i = np.where(isIn, i, 0)
+            ph, pl = _mul(x.hi[i], x.lo[i], hh, hl)
+            ph, pl = np.where(isIn, ph, 0.), np.where(isIn, pl, 0.)
+            yh[k1-k0:k1-k0+len(k)], yl[k1-k0:k1-k0+len(k)] = _sum(ph, pl)
+        return _ddArr(yh, yl)
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    import time
+    import doctest
+    start = time.time()
+    doctest.testmod()
+    print('OK. sec: ',time.time() - start)
@@ -4,33 +4,79 @@ PolyNum digits type
 ===================
 
 flt(digStr)
-    Define default type of PN didits if PN value is based on string (or other 
+    Define default type of PN didits if PN value is based on string (or other
         value converting to float type)
     Use it also for scalars, to have homogeneous type of float numbers:
         from digitPN import flt; x = flt('0.1')
-    PN digits can be of an arbitrarty type field, for which inertactions with 
-    int are determined: 0*x, 0*x+1 (zero and one of x-type), 1/x (inversion of 
-    x-type). Type of first mantissa digit is propagated for next digits 
+    PN digits can be of an arbitrarty type field, for which inertactions with
+    int are determined: 0*x, 0*x+1 (zero and one of x-type), 1/x (inversion of
+    x-type). Type of first mantissa digit is propagated for next digits
     in results of functions.
 
 strF(dig, chop_=True, signifi_=9), reprF(): strF(dig, chop_=False, signifi_=15)
-    string for for PolyNum.mantissa digits (for kind of float) in str(), repr(). 
+    string for for PolyNum.mantissa digits (for kind of float) in str(), repr().
 
 zeroPNdig, onePNdig = flt('0'), flt('1')
-   
-epsilonPNdig 
-    difference between 1 and the least value greater than 1 
+
+epsilonPNdig
+    difference between 1 and the least value greater than 1
     that is representable as a float
 
 PNdig_isclose(a, b, rel_tol=epsilonPNdig*128, abs_tol=epsilonPNdig*128)
     compare equality of two PolyNum.mantissa digits
+
+asMant(digits)
+    container of PolyNum.mantissa digits: `list` or (for 'FLOAT-NUMPY')
+    contiguous `numpy.ndarray` of dtype PolyNumConf.NUMPY_DTYPE,
+    ddPN.DDArray ('DOUBLE-DOUBLE'), fracPN.FracArray ('EXACT-FRACTION')
+
+Backends
+--------
+    The names above (and floor, sqrt, exp, log, erfc, pi, FLOAT_TYPE) are
+    attributes of the current digit backend: 'FLOAT-PYTHON',
+    'FLOAT-MPMATH-MPF', 'FLOAT-NUMPY', 'DECIMAL', 'DOUBLE-DOUBLE' (pairs
+    of float64, ~32 digits, vectorized), 'EXACT-FRACTION' (exact rational
+    digits for reference results) or registered by registerBackend().
+    A backend is loaded (mpmath, numpy, scipy imported) on first use only.
+    The default one is PolyNumConf.FLOAT_TYPE, it can be changed by
+    setBackend(name) or inside `with useBackend(name): ...` - in the
+    current context only (thread, task), i.e. per computation.
+    Default arguments (tolerances) of PolyNum methods are of the default
+    backend. PolyNum methods compute in the digit context of the backend
+    (own decimal.Context of 'DECIMAL'), other digit arithmetic - inside
+    `with useBackend(name): ...` or `with digitContext(): ...`.
+
+    >>> with useBackend('FLOAT-MPMATH-MPF'):
+    ...     print(getBackend().FLOAT_TYPE, type(getBackend().flt('0.1')).__name__)
+    FLOAT-MPMATH-MPF mpf
+    >>> with useBackend('EXACT-FRACTION'):
+    ...     print(getBackend().strF(getBackend().flt('0.1') / 3))
+    1/30
+    >>> with useBackend('DECIMAL') as b:
+    ...     print(b.strF(b.flt(1) / 3, signifi_=30), b.strF(b.flt('2.50')), b.strF(b.erfc(b.flt(5))))
+    0.333333333333333333333333333333 2.5 1.53745979e-12
+    >>> import decimal; prec = decimal.getcontext().prec
+    >>> with useBackend('DECIMAL') as b:
+    ...     n = len(str(b.flt(1) / 3)) - 2
+    >>> n == PolyNumConf.DECIMAL_PREC, decimal.getcontext().prec == prec
+    (True, True)
+    >>> getBackend('DECIMAL').strF(decimal.Decimal('-0e-38'))
+    '-0.0'
+    >>> with useBackend('DOUBLE-DOUBLE') as b:
+    ...     print(b.strF(b.flt(1) / 3, signifi_=30), b.strF(b.sqrt(b.flt(2)), signifi_=30))
+    0.333333333333333333333333333333 1.41421356237309504880168872421
 """
 from __future__ import division, unicode_literals
-__all__ = ['flt', 'strF', 'reprF', 'epsilonPNdig', 'onePNdig', 'zeroPNdig', 
-           'PNdig_isclose']
+__all__ = ['flt', 'strF', 'reprF', 'epsilonPNdig', 'onePNdig', 'zeroPNdig',
+           'PNdig_isclose', 'asMant',
+           'registerBackend', 'getBackend', 'setBackend', 'useBackend',
+           'digitContext']
 
+import contextlib
+import contextvars
+import types
 
-if __name__ == '__main__' or __name__ == 'digitPN': 
+if __name__ == '__main__' or __name__ == 'digitPN':
     #standalone tests: digitPN -> rundocs(), doctest
     import PolyNumConf
 else: #relative package import
@@ -40,115 +86,375 @@ else: #relative package import
 #in PolyNumConf:
 #FLOAT_TYPE = 'FLOAT-MPMATH-MPF' # 'FLOAT-PYTHON' # 'FLOAT-NUMPY'
 #MPMATH_PREC = 128   #38 dec. siginicant dig.
+
+_LOADERS = {} # name -> loader() of backend namespace
+_BACKENDS = {} # name -> loaded backend
+_backend = contextvars.ContextVar('digitPN_backend', default=None)
+
+def registerBackend(name, loader):
+    """
+    loader() returns namespace (i.e. types.SimpleNamespace) with: flt,
+    strF, asMant, floor, sqrt, exp, log, erfc, pi, epsilonPNdig - see
+    _loadPython(); it is called on first use of backend `name`.
+    """
+    _LOADERS[name] = loader
+    _BACKENDS.pop(name, None)
+
+def getBackend(name=None):
+    """backend `name` (loaded if needed), default - the current one"""
+    if name is None:
+        b = _backend.get()
+        if b is not None:
+            return b
+        name = PolyNumConf.FLOAT_TYPE
+    b = _BACKENDS.get(name)
+    if b is None:
+        if name not in _LOADERS:
+            raise ValueError("{!r} - unknown digitPN backend.".format(name))
+        b = _LOADERS[name]()
+        b.FLOAT_TYPE = name
+        b.zeroPNdig = b.flt('0') #zero of type of PN digits
+        b.onePNdig  = b.flt('1')
+        b.mantType = type(b.asMant([b.zeroPNdig])) # list, ndarray, array('d')
+        if not hasattr(b, 'localContext'):
+            b.localContext = None # no digit context (i.e. decimal.Context)
+        _BACKENDS[name] = b
+    return b
+
+def setBackend(name):
+    """backend `name` in the current context (thread, task)"""
+    _backend.set(getBackend(name))
+
+@contextlib.contextmanager
+def useBackend(name):
+    """backend `name` inside `with` block (in the current context)"""
+    b = getBackend(name)
+    token = _backend.set(b)
+    try:
+        with digitContext():
+            yield b
+    finally:
+        _backend.reset(token)
+
+def digitContext():
+    """
+    context manager - digit arithmetic of the current backend outside PN 
+    methods inside `with` block: decimal.Context of 'DECIMAL' (precision 
+    PolyNumConf.DECIMAL_PREC, decimal.getcontext() is not changed), no-op 
+    for other backends
+    """
+    localContext = getBackend().localContext
+    return localContext() if localContext else contextlib.nullcontext()
+
+def __getattr__(name): # flt, strF, ..., zeroPNdig of the current backend
+    try:
+        return getattr(getBackend(), name)
+    except AttributeError:
+        raise AttributeError("module 'digitPN' has no attribute {!r}".format(name))
+
 # =============================================================================
-if PolyNumConf.FLOAT_TYPE == 'FLOAT-PYTHON':
+def _loadPython(): # 'FLOAT-PYTHON'
 # =============================================================================
     import sys
     import math
-    epsilonPNdig = sys.float_info.epsilon #=2**-52 = 2.220446049250313e-16
+    b = types.SimpleNamespace()
+    b.epsilonPNdig = sys.float_info.epsilon #=2**-52 = 2.220446049250313e-16
     def flt(digStr):
         return(float(digStr))
     def strF(dig, chop_=True, signifi_=9):
         if dig and chop_: dig = chop(dig)
         try: return dig.__format__('1.'+str(signifi_)) #'1.9'
-        except (ValueError, TypeError): return str(dig) 
+        except (ValueError, TypeError): return str(dig)
             #without formatting (i.e. for int,  TypeError - for Fraction)
-    
-    floor = math.floor
-    sqrt  = math.sqrt
-    exp   = math.exp
-    log   = math.log
-    erfc  = math.erfc
-    pi    = math.pi
+    b.flt, b.strF = flt, strF
+    b.floor = math.floor
+    b.sqrt  = math.sqrt
+    b.exp   = math.exp
+    b.log   = math.log
+    b.erfc  = math.erfc
+    b.pi    = math.pi
+    if PolyNumConf.PYTHON_ARRAY_MANT:
+        from array import array
+        def asMant(digits):
+            """
+            array('d') copy of float `digits` (8 bytes per digit);
+            other digits (i.e. int, Fraction) - list
+            """
+            if all(type(d) is float for d in digits):
+                return array('d', digits)
+            return list(digits)
+        b.asMant = asMant
+    else:
+        b.asMant = list
+    return b
+
 # =============================================================================
-elif PolyNumConf.FLOAT_TYPE == 'FLOAT-MPMATH-MPF':
+def _loadMpmath(): # 'FLOAT-MPMATH-MPF'
 # =============================================================================
     from mpmath import mp, mpf
+    b = types.SimpleNamespace()
     mp.prec = PolyNumConf.MPMATH_PREC #128  #38 dec. siginicant dig.
-    epsilonPNdig = mpf(2)**(-mp.prec+1) #mp.epsilon 5.88e-39
+    b.epsilonPNdig = mpf(2)**(-mp.prec+1) #mp.epsilon 5.88e-39
     def flt(digStr):
         return(mpf(digStr))
     def strF(dig, chop_=True, signifi_=9):
         if dig: dig = chop(dig)
         return mp.nstr(dig,signifi_)
-    
-    floor = mp.floor
-    sqrt  = mp.sqrt
-    exp   = mp.exp
-    log   = mp.log
-    erfc  = mp.erfc
-    pi    = mp.pi
+    b.flt, b.strF = flt, strF
+    b.floor = mp.floor
+    b.sqrt  = mp.sqrt
+    b.exp   = mp.exp
+    b.log   = mp.log
+    b.erfc  = mp.erfc
+    b.pi    = mp.pi
+    b.asMant = list
+    return b
+
 # =============================================================================
-elif PolyNumConf.FLOAT_TYPE == 'FLOAT-NUMPY':
+def _loadNumpy(): # 'FLOAT-NUMPY'
 # =============================================================================
     import numpy as np
-    from scipy.special import erfc
-    epsilonPNdig = np.finfo(np.longdouble).eps #2.220446049250313e-16
+    b = types.SimpleNamespace()
+    dtypePN = b.dtypePN = np.dtype(PolyNumConf.NUMPY_DTYPE) #float64
+    b.epsilonPNdig = np.finfo(dtypePN).eps #2.220446049250313e-16
     def flt(digStr):
-        return(float(digStr))
+        return(dtypePN.type(digStr))
+    def asMant(digits):
+        """
+        ndarray copy of real `digits`; other digits (i.e. Fraction) - list
+        """
+        m = np.asarray(digits)
+        if m.dtype.kind in 'biuf':
+            return np.array(m, dtype=dtypePN)
+        return list(digits)
     def strF(dig, chop_=True, signifi_=9):
         if dig and chop_: dig = chop(dig)
         try: return dig.__format__('1.'+str(signifi_)) #'1.9'
-        except (ValueError, TypeError): return str(dig) 
+        except (ValueError, TypeError): return str(dig)
             #without formatting (i.e. for int,  TypeError - for Fraction)
-    
-    floor = np.floor
-    sqrt  = np.sqrt
-    exp   = np.exp
-    log   = np.log
-    erfc  = erfc
-    pi    = np.pi
+    def erfc(x): # scipy is imported on first use
+        from scipy.special import erfc
+        b.erfc = erfc
+        return erfc(x)
+    b.flt, b.asMant, b.strF, b.erfc = flt, asMant, strF, erfc
+    b.floor = np.floor
+    b.sqrt  = np.sqrt
+    b.exp   = np.exp
+    b.log   = np.log
+    b.pi    = np.pi
+    return b
+
 # =============================================================================
-else: #todo for yourself...
+def _loadDecimal(): # 'DECIMAL'
 # =============================================================================
+    import decimal
+    import math
+    from decimal import Decimal
+    b = types.SimpleNamespace()
+    prec = PolyNumConf.DECIMAL_PREC
+    ctx = decimal.Context(prec=prec) # own context, decimal.getcontext() is kept
+    b.localContext = lambda: decimal.localcontext(ctx)
+    b.epsilonPNdig = Decimal(10)**(1-prec)
     def flt(digStr):
-        return(float(digStr))
-    def strF(dig):
-        if dig: dig = chop(dig)
-        try: return dig.__format__('1.9') 
-        except (ValueError, TypeError): return str(dig) 
-            #without formatting (i.e. for int,  TypeError - for Fraction)
-    def getEpsilon(one):
-        v=one; epsilon=one/1024
-        while (v+epsilon > v ): epsilon = epsilon/2
-        return epsilon*2     #2.220446049250313e-16 for double
-    epsilonPNdig = getEpsilon(1.0)
-    #...
+        return(Decimal(digStr) if isinstance(digStr, (str, int, Decimal))
+               else Decimal(repr(digStr))) # float - shortest repr, not binary value
+    def strF(dig, chop_=True, signifi_=9):
+        if dig and chop_: dig = chop(dig)
+        if isinstance(dig, Decimal) and not dig:
+            dig = Decimal(0).copy_sign(dig) # 0e-38 -> 0.0
+        try: s = dig.__format__('1.'+str(signifi_))
+        except (ValueError, TypeError): return str(dig)
+        m, __, e = s.lower().partition('e') # like float: 1.0, 2.5e-10
+        if '.' in m:
+            m = m.rstrip('0')
+            m = m.rstrip('.') if e else m + '0'*m.endswith('.')
+        elif not e and m[-1:].isdigit():
+            m += '.0'
+        return m + ('e' + e if e else '')
+    b.flt, b.strF = flt, strF
+    b.floor = math.floor
+    b.sqrt  = _digitFun(Decimal, ctx.sqrt, math.sqrt)
+    b.exp   = _digitFun(Decimal, ctx.exp, math.exp)
+    b.log   = _digitFun(Decimal, ctx.ln, math.log)
+    b.erfc  = _digitFun(Decimal, lambda x: _erfcDecimal(x, ctx), math.erfc)
+    b.pi    = _piDecimal(ctx)
+    b.asMant = list
+    return b
+
+def _piDecimal(context):
+    """pi in decimal `context` (recipe of `decimal` docs)"""
+    import decimal
+    with decimal.localcontext(context) as ctx:
+        ctx.prec += 2
+        three = decimal.Decimal(3)
+        lasts, t, s, n, na, d, da = 0, three, 3, 1, 0, 0, 24
+        while s != lasts:
+            lasts = s
+            n, na = n+na, na+8
+            d, da = d+da, da+32
+            t = (t * n) / d
+            s += t
+    return context.plus(s)
+
+def _erfcDecimal(x, context):
+    """
+    erfc(x) of Decimal x in decimal `context`: Taylor series 
+    of erf (|x| < 3, with guard digits for cancellation in 1 - erf) or 
+    continued fraction (x >= 3)
+    """
+    import decimal
+    from decimal import Decimal
+    if x < 0:
+        return context.subtract(2, _erfcDecimal(-x, context))
+    with decimal.localcontext(context) as ctx:
+        eps = Decimal(10)**(-ctx.prec-2)
+        if x < 3:
+            ctx.prec += int(x*x) + 5 # terms up to exp(x*x)
+            x2, term, n = x*x, x, 0
+            s = x
+            while abs(term) > eps * abs(s):
+                n += 1
+                term = -term * x2 / n
+                s += term / (2*n + 1)
+            y = 1 - 2 * s / _piDecimal(ctx).sqrt()
+        else: # Lentz: x + 1/2/(x + 2/2/(x + 3/2/(x + ...)))
+            ctx.prec += 2
+            f, C, D, n = x, x, Decimal(0), 0
+            while True:
+                n += 1
+                a = Decimal(n) / 2
+                D = 1 / (x + a*D)
+                C = x + a/C
+                delta = C*D
+                f *= delta
+                if abs(delta - 1) <= eps:
+                    break
+            y = (-x*x).exp() / _piDecimal(ctx).sqrt() / f
+    return context.plus(y)
+
+# =============================================================================
+def _loadDD(): # 'DOUBLE-DOUBLE'
 # =============================================================================
+    """
+    double-double digits (ddPN.DD, ~106 bits), mantissa - ddPN.DDArray
+    (pair of float64 ndarrays, vectorized); erfc - float accuracy
+    """
+    import math
+    if __name__ == 'digitPN':
+        import ddPN
+    else:
+        from . import ddPN
+    DD = ddPN.DD
+    b = types.SimpleNamespace()
+    b.epsilonPNdig = ddPN.EPS #2**-104
+    def flt(digStr):
+        return(DD(digStr))
+    def strF(dig, chop_=True, signifi_=9):
+        if dig and chop_: dig = chop(dig)
+        if isinstance(dig, DD):
+            return dig._str(signifi_)
+        try: return dig.__format__('1.'+str(signifi_))
+        except (ValueError, TypeError): return str(dig)
+    b.flt, b.strF = flt, strF
+    b.floor = math.floor
+    b.sqrt  = _digitFun(DD, DD.sqrt, math.sqrt)
+    b.exp   = _digitFun(DD, DD.exp, math.exp)
+    b.log   = _digitFun(DD, DD.log, math.log)
+    b.erfc  = _digitFun(DD, DD.erfc, math.erfc)
+    b.pi    = ddPN.PI
+    b.asMant = ddPN.DDArray
+    return b
+
+def _digitFun(digType, fDig, f):
+    """fDig for digits of digType, f (math) for other digits"""
+    return lambda x: fDig(x) if isinstance(x, digType) else f(x)
 
 # =============================================================================
-# universal `reprF`, `zeroPNdig`, `onePNdig` and `PNdig_isclose`
+def _loadFraction(): # 'EXACT-FRACTION'
+# =============================================================================
+    """
+    exact rational digits (fractions.Fraction) - reference results of 
+    rational PN operations (+ - * / **int) for validating float runs,
+    mantissa - fracPN.FracArray (int numerators over one denominator);
+    floor, sqrt, exp, log, erfc, pi are float (rounded) values
+    """
+    import math
+    from fractions import Fraction
+    if __name__ == 'digitPN':
+        import fracPN
+    else:
+        from . import fracPN
+    b = types.SimpleNamespace()
+    b.epsilonPNdig = Fraction(1, 2**(PolyNumConf.MPMATH_PREC-1)) #as 'FLOAT-MPMATH-MPF'
+    def flt(digStr):
+        return(Fraction(digStr))
+    def strF(dig, chop_=True, signifi_=9):
+        if dig and chop_: dig = chop(dig)
+        return str(dig) # exact, i.e. '-3/7'
+    def rounded(f):
+        return lambda x: Fraction(f(x))
+    b.flt, b.strF = flt, strF
+    b.floor = math.floor
+    b.sqrt  = rounded(math.sqrt)
+    b.exp   = rounded(math.exp)
+    b.log   = rounded(math.log)
+    b.erfc  = rounded(math.erfc)
+    b.pi    = Fraction(math.pi)
+    b.asMant = fracPN.FracArray
+    return b
+
+registerBackend('FLOAT-PYTHON', _loadPython)
+registerBackend('FLOAT-MPMATH-MPF', _loadMpmath)
+registerBackend('FLOAT-NUMPY', _loadNumpy)
+registerBackend('EXACT-FRACTION', _loadFraction)
+registerBackend('DECIMAL', _loadDecimal)
+registerBackend('DOUBLE-DOUBLE', _loadDD)
+#todo for yourself... registerBackend('MY-FLOAT', _loadMyFloat)
+
+def getEpsilon(one):
+    v=one; epsilon=one/1024
+    while (v+epsilon > v ): epsilon = epsilon/2
+    return epsilon*2     #2.220446049250313e-16 for double
+
+# =============================================================================
+# universal `reprF`, `chop` and `PNdig_isclose`
 
 def reprF(dig):
     """
     repr() of PN digit
     """
     # return repr(dig)
-    return strF(dig, chop_=False, signifi_=15)
+    return getBackend().strF(dig, chop_=False, signifi_=15)
 
-zeroPNdig = flt('0') # flt('0') #zero of type of PN digits
-onePNdig  = flt('1')
-def chop(d, tol=epsilonPNdig*1024*1024, zero=zeroPNdig):#tol: 6e-33 by eps=6e-39
+def chop(d, tol=None, zero=None):#tol: 6e-33 by eps=6e-39
         """
-        Converts x close to zero to exact zero        
+        Converts x close to zero to exact zero
+        (default: tol=epsilonPNdig*1024*1024, zero=zeroPNdig)
         """
+        if tol is None:
+            tol = getBackend().epsilonPNdig*1024*1024
         if (abs(d) > tol):
-            return d 
+            return d
         else:
-            return zero
-    
-def PNdig_isclose(a, b, rel_tol=epsilonPNdig*128, abs_tol=epsilonPNdig*128): 
+            return getBackend().zeroPNdig if zero is None else zero
+
+def PNdig_isclose(a, b, rel_tol=None, abs_tol=None):
     """
     Like `math.isclose` or `mpmath.almosteq` - for an arbitrary types a, b
+    (default: rel_tol, abs_tol = epsilonPNdig*128)
     Return :
     True if a - b == 0 or |a - b| <= abs_tol
     else
-        if (|a-b| and rel_tol) are compatybile type: 
+        if (|a-b| and rel_tol) are compatybile type:
             |a-b| <= rel_tol*max(|a|,|b|)
-        else: 
-            raise NotImplementedError 
+        else:
+            raise NotImplementedError
     """
-    if not a and not b: 
+    if rel_tol is None or abs_tol is None:
+        eps128 = getBackend().epsilonPNdig*128
+        rel_tol = eps128 if rel_tol is None else rel_tol
+        abs_tol = eps128 if abs_tol is None else abs_tol
+    if not a and not b:
         return True
     diff = abs(a - b)
     if not diff:
@@ -160,11 +466,11 @@ def PNdig_isclose(a, b, rel_tol=epsilonPNdig*128, abs_tol=epsilonPNdig*128):
         absMax = abs2
     if isinstance(diff,type(rel_tol)):
         return diff <= rel_tol * absMax
-    raise NotImplementedError 
+    raise NotImplementedError
 
 
 if __name__ == "__main__":
-    print(strF(zeroPNdig))  
-    print(repr(zeroPNdig))
+    print(getBackend().strF(getBackend().zeroPNdig))
+    print(repr(getBackend().zeroPNdig))
 #    import doctest
-#    doctest.testmod(); print('OK.')
\ No newline at end of file
+#    doctest.testmod(); print('OK.')
@@ -0,0 +1,212 @@
+# -*- coding: utf-8 -*-
+"""\
+Exact rational PN mantissa
+==========================
+    (int numerators over one shared denominator: digit k is num[k] / den)
+
+    FracArray - PN mantissa of 'EXACT-FRACTION' digits (see digitPN).
+    Digit-wise + - of mantissas and scaling by a rational scalar are int
+    operations on numerators, the denominator is normalized (one gcd of
+    den and all numerators) once per operation - not a gcd per digit as
+    for a list of fractions.Fraction. Products of mantissas multiply the
+    numerators as one big int (Kronecker substitution) - see
+    PolyNum.mantPN_mul_rational().
+
+    Examples
+    --------
+    >>> from fractions import Fraction
+    >>> x = FracArray([Fraction(1, 2), 10, Fraction(-2, 3)]); x
+    FracArray([1/2, 10, -2/3])
+    >>> x.num, x.den
+    ([3, 60, -4], 6)
+    >>> y = x + FracArray([Fraction(1, 2), 0, Fraction(2, 3)]); y, y.den
+    (FracArray([1, 10, 0]), 1)
+    >>> x * Fraction(3, 2), x[1], x[1:]
+    (FracArray([3/4, 15, -1]), Fraction(10, 1), FracArray([10, -2/3]))
+"""
+from __future__ import division, absolute_import, print_function, unicode_literals
+
+__all__ = ['FracArray']
+
+from fractions import Fraction
+from math import gcd
+
+
+class FracArray(object):
+    """\
+    Exact rational mantissa
+    =======================
+        int numerators `num` (list) over one int denominator `den` > 0 -
+        like list of Fraction digits: len(), [k] (Fraction), slices
+        (copies), item/slice assignment, iter; + - with FracArray,
+        * / by scalar, unary - and abs() on numerators
+
+    Parameters
+    ----------
+    digits :
+        iterable of Fraction, int (or float, Decimal, str - exact value
+        by Fraction()); FracArray - copied
+    """
+    __slots__ = ('num', 'den')
+    _isFracArr = True
+
+    def __init__(self, digits=()):
+        if isinstance(digits, FracArray):
+            self.num, self.den = list(digits.num), digits.den
+            return
+        digits = [d if type(d) in (int, Fraction) else Fraction(d) for d in digits]
+        D = 1
+        for d in digits:
+            den = d.denominator
+            if D % den:
+                D = D // gcd(D, den) * den
+        self.num = [d.numerator * (D // d.denominator) for d in digits]
+        self.den = D
+
+    @staticmethod
+    def fromNumDen(num, den):
+        """FracArray num[k] / den (list `num` not copied), normalized"""
+        return _fracArr(num, den)
+
+    @staticmethod
+    def zeros(n):
+        return _fracArr([0] * n, 1, False)
+
+    def __repr__(self):
+        return 'FracArray([{}])'.format(', '.join(str(d) for d in self))
+
+    def __len__(self):
+        return len(self.num)
+
+    def __iter__(self):
+        den = self.den
+        for n in self.num:
+            yield Fraction(n, den)
+
+    def tolist(self):
+        return list(self)
+
+    def copy(self):
+        return _fracArr(self.num[:], self.den, False)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return _fracArr(self.num[index], self.den, False)
+        return Fraction(self.num[index], self.den)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            if not isinstance(value, FracArray):
+                value = FracArray(value)
+            if index.indices(len(self.num)) == (0, len(self.num), 1) and \
+                    len(value.num) == len(self.num): # x[:] = y
+                self.num[:], self.den = value.num, value.den
+                return
+            num, den = value.num, value.den
+        else:
+            if type(value) not in (int, Fraction):
+                value = Fraction(value)
+            num, den = value.numerator, value.denominator
+        if self.den % den: # common denominator of self and value
+            g = gcd(self.den, den)
+            a = den // g
+            self.num = [n * a for n in self.num]
+            self.den *= a
+        a = self.den // den
+        if a != 1:
+            num = [n * a for n in num] if isinstance(index, slice) else num * a
+        self.num[index] = num
+
+    def _operand(self, other):
+        """numerators of self and FracArray other over common denominator"""
+        if self.den == other.den:
+            return self.num, other.num, self.den
+        g = gcd(self.den, other.den)
+        a, b = other.den // g, self.den // g
+        return [n * a for n in self.num], [n * b for n in other.num], self.den * a
+
+    @staticmethod
+    def _scalar(a):
+        """(numerator, denominator) of rational scalar, None for other types"""
+        if isinstance(a, FracArray) or not hasattr(a, '__float__'):
+            return None
+        if type(a) not in (int, Fraction):
+            a = Fraction(a)
+        return a.numerator, a.denominator
+
+#-----------------------------------------------------------
+
+    def __neg__(self):
+        return _fracArr([-n for n in self.num], self.den, False)
+
+    def __abs__(self):
+        return _fracArr([abs(n) for n in self.num], self.den, False)
+
+    def __add__(self, other):
+        if not isinstance(other, FracArray):
+            return NotImplemented
+        X, Y, D = self._operand(other)
+        return _fracArr([x + y for (x, y) in zip(X, Y)], D)
+
+    def __sub__(self, other):
+        if not isinstance(other, FracArray):
+            return NotImplemented
+        X, Y, D = self._operand(other)
+        return _fracArr([x - y for (x, y) in zip(X, Y)], D)
+
+    def __mul__(self, other):
+        p = self._scalar(other)
+        if p is None:
+            return NotImplemented
+        return _fracArr([n * p[0] for n in self.num], self.den * p[1])
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        p = self._scalar(other)
+        if p is None:
+            return NotImplemented
+        if not p[0]:
+            raise ZeroDivisionError('FracArray division by zero')
+        s = -1 if p[0] < 0 else 1
+        return _fracArr([n * s * p[1] for n in self.num], self.den * s * p[0])
+    __div__ = __truediv__
+
+    def _inplace(self, y):
+        if y is NotImplemented:
+            return y
+        self.num[:], self.den = y.num, y.den
+        return self
+
+    def __iadd__(self, other):
+        return self._inplace(self.__add__(other))
+
+    def __isub__(self, other):
+        return self._inplace(self.__sub__(other))
+
+    def __imul__(self, other):
+        return self._inplace(self.__mul__(other))
+
+    def __itruediv__(self, other):
+        return self._inplace(self.__truediv__(other))
+    __idiv__ = __itruediv__
+
+def _fracArr(num, den, normalize=True):
+    """FracArray of list `num` and `den` > 0 (not copied), normalized:
+    common factor of den and all numerators is cancelled"""
+    if normalize and den != 1:
+        g = gcd(den, *num)
+        if g != 1:
+            num, den = [n // g for n in num], den // g
+    y = object.__new__(FracArray)
+    y.num, y.den = num, den
+    return y
+
+#$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$$
+
+
+if __name__ == "__main__":
+    import time
+    import doctest
+    start = time.time()
+    doctest.testmod()
+    print('OK. sec: ',time.time() - start)